@@ -0,0 +1,63 @@
+"""
+Shared setup and synthetic corpora for the benchmark scripts.
+
+    from _common import ROOT, synthetic_texts
+
+Importing it puts the checkout on sys.path (once, so Streamlit reruns do not
+grow it) and turns remote translation off unless the caller already chose
+otherwise, so every script runs offline. The generators are seeded: a given
+(rows, seed, settings) always yields the same corpus, which keeps stored
+baselines comparable across runs.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import os
+import random
+import sys
+from functools import lru_cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ.setdefault("VIBE_ORACLE_TRANSLATE", "0")
+
+# Non-emotional words mixed with lexicon keywords; CHAT_FILLER for short chat messages
+FILLER      = ["i", "feel", "so", "today", "this", "is", "the", "day", "was", "really", "and", "my"]
+CHAT_FILLER = ["lol", "ok", "so", "today", "this", "is", "the", "omg", "was", "really", "and", "my"]
+
+
+@lru_cache(maxsize=None)
+def keyword_vocab() -> tuple:
+    """Every English lexicon keyword, in lexicon order."""
+    from vibe_oracle.lexicon import EMOTION_KEYWORDS
+    return tuple(w for kws in EMOTION_KEYWORDS.values() for w in kws)
+
+
+@lru_cache(maxsize=None)
+def phrase_vocab() -> tuple:
+    """Every multi-language (romanised Bengali / Hindi) phrase, in lexicon order."""
+    from vibe_oracle.lexicon import MULTILANG_PHRASES
+    return tuple(p for ps in MULTILANG_PHRASES.values() for p in ps)
+
+
+def keyword_words(rng: random.Random, min_words: int, max_words: int, filler=FILLER) -> list:
+    """min_words…max_words words, each a lexicon keyword with probability 0.3, else filler."""
+    vocab = keyword_vocab()
+    return [rng.choice(vocab if rng.random() < 0.3 else filler)
+            for _ in range(rng.randint(min_words, max_words))]
+
+
+def synthetic_texts(rows: int, seed: int = 7, min_words: int = 4, max_words: int = 30,
+                    phrase_rate: float = 0.0, filler=FILLER) -> list:
+    """
+    `rows` seeded messages of keyword_words(); with phrase_rate > 0 that share
+    of them also gets one multi-language phrase at a random position.
+    """
+    rng = random.Random(seed)
+    out = []
+    for _ in range(rows):
+        words = keyword_words(rng, min_words, max_words, filler)
+        if phrase_rate and rng.random() < phrase_rate:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(phrase_vocab()))
+        out.append(" ".join(words))
+    return out
@@ -0,0 +1,93 @@
+"""
+Serial vs concurrent translation against a local fake translation server.
+
+Starts an in-process HTTP server that mimics Google Translate's mobile page
+(fixed artificial latency, every 10th text answers HTTP 500), then translates
+the same batch one request at a time and through `translate_many` with a
+bounded semaphore over pooled connections. Checks both paths agree (failures
+fall back to None → original text) and prints the wall time saved.
+
+    python benchmarks/bench_async_translate.py [--texts 200] [--latency-ms 80] [--concurrency 16]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import _common  # noqa: F401  (sys.path + offline translation)
+
+from vibe_oracle.async_translate import PooledGoogleTranslator, translate_many
+
+
+def _fake_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"       # keep-alive, so pooling is observable
+
+        def do_GET(self):
+            q = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+            time.sleep(latency)
+            if q.endswith("#fail"):
+                body, status = b"boom", 500
+            else:
+                body   = f'<div class="result-container">EN {html.escape(q)}</div>'.encode()
+                status = 200
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _serial(texts: list, translate_fn) -> list:
+    out = []
+    for t in texts:
+        try:
+            out.append(translate_fn(t))
+        except Exception:
+            out.append(None)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    server = _fake_server(args.latency_ms / 1000)
+    url    = f"http://127.0.0.1:{server.server_port}/m"
+    texts  = [f"message {i}" + ("#fail" if i % 10 == 9 else "") for i in range(args.texts)]
+    client = PooledGoogleTranslator(base_url=url, pool_size=args.concurrency, timeout=5.0)
+
+    t0      = time.perf_counter()
+    serial  = _serial(texts, client.translate)
+    t_ser   = time.perf_counter() - t0
+
+    t0      = time.perf_counter()
+    batched = translate_many(texts, client.translate, concurrency=args.concurrency, timeout=5.0)
+    t_async = time.perf_counter() - t0
+    server.shutdown()
+
+    assert serial == batched, "serial and concurrent translations differ"
+    failed = sum(r is None for r in batched)
+    print(f"{args.texts} texts, {args.latency_ms:.0f} ms simulated latency, "
+          f"{failed} failures (fall back to original text)")
+    print(f"serial     {t_ser:7.2f}s")
+    print(f"concurrent {t_async:7.2f}s  (concurrency {args.concurrency})")
+    print(f"saved      {t_ser - t_async:7.2f}s  ({t_ser / t_async:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Compact quantised artifact vs the joblib Pipeline artifact.
+
+Exports the active model (VIBE_ORACLE_MODEL_VARIANT) with export_compact at
+each dtype / prune setting and reports, against the joblib artifact that
+get_model() loads:
+
+    size kB      file size on disk
+    load ms      median load time (joblib.load with mmap / CompactModel.load)
+    RSS MB       peak RSS of a fresh interpreter that imports what loading
+                 needs, loads the artifact and scores one text
+    train acc    accuracy on the synthetic training corpus
+    agree        argmax agreement with get_model() on a synthetic corpus
+    max |Δp|     largest probability difference on that corpus
+
+    python benchmarks/bench_compact_model.py [--prune 0 0.01 0.05]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import ROOT, synthetic_texts
+
+# Child: load one artifact in a fresh interpreter and print its peak RSS
+_CHILD = """
+import json, resource, sys
+kind, path = sys.argv[1], sys.argv[2]
+if kind == "joblib":
+    import joblib
+    pipe, le = joblib.load(path, mmap_mode="r")
+    pipe.predict_proba(["feel happy today"])
+else:
+    from vibe_oracle.compact_model import CompactModel
+    CompactModel.load(path).predict_proba(["feel happy today"])
+try:    # VmHWM starts fresh at exec; ru_maxrss can carry over the forking parent's peak
+    with open("/proc/self/status") as fh:
+        rss = next(int(line.split()[1]) for line in fh if line.startswith("VmHWM:")) / 1024
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = rss / 1024 ** 2 if sys.platform == "darwin" else rss / 1024
+print(json.dumps({"rss_mb": rss}))
+"""
+
+
+def _rss_mb(kind: str, path: str) -> float:
+    env  = {**os.environ, "PYTHONPATH": ROOT}
+    proc = subprocess.run([sys.executable, "-c", _CHILD, kind, path],
+                          env=env, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])["rss_mb"]
+
+
+def _load_ms(fn, path: str) -> float:
+    times = []
+    for _ in range(7):
+        t0 = time.perf_counter()
+        fn(path)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--prune", type=float, nargs="+", default=[0.0, 0.01, 0.05])
+    parser.add_argument("--texts", type=int, default=5_000)
+    args = parser.parse_args()
+
+    import joblib
+    import numpy as np
+
+    from vibe_oracle import engine
+    from vibe_oracle.compact_model import CompactModel, export_compact
+
+    pipe, le = engine.get_model()
+    base     = engine._model_store().path_for(engine.model_key())
+    train    = engine._build_training_corpus()
+    X_train  = [engine.preprocess(t) for t in train["text"]]
+    y_train  = train["label"].to_numpy()
+    synth    = synthetic_texts(args.texts, seed=21, min_words=3, max_words=25)
+    X_synth  = [engine.preprocess(t) for t in synth]
+    ref      = pipe.predict_proba(X_synth)
+
+    print(f"{engine.MODEL_VARIANT} model {engine.model_key()[:16]}, "
+          f"{pipe.steps[-1][1].coef_.shape[1]:,} features")
+    print(f"{'artifact':<26} {'size kB':>9} {'load ms':>8} {'RSS MB':>7} {'train acc':>10} "
+          f"{'agree':>7} {'max |Δp|':>9}")
+    acc = float(np.mean(le.inverse_transform(pipe.predict(X_train)) == y_train))
+    print(f"{'joblib (get_model)':<26} {os.path.getsize(base) / 1024:>9.1f} "
+          f"{_load_ms(lambda p: joblib.load(p, mmap_mode=engine.MODEL_MMAP_MODE), base):>8.2f} "
+          f"{_rss_mb('joblib', base):>7.1f} {acc:>10.4f} {1.0:>7.4f} {0.0:>9.4f}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for dtype in ("float32", "int8"):
+            for prune in args.prune:
+                path  = os.path.join(tmpdir, f"{dtype}-{prune}.npz")
+                info  = export_compact(pipe, le, path, dtype=dtype, prune=prune)
+                model = CompactModel.load(path)
+                got   = model.predict_proba(X_synth)
+                acc   = float(np.mean(model.predict(X_train) == y_train))
+                name  = f"{dtype} prune={prune:g} ({info['kept']:,})"
+                print(f"{name:<26} {info['bytes'] / 1024:>9.1f} {_load_ms(CompactModel.load, path):>8.2f} "
+                      f"{_rss_mb('compact', path):>7.1f} {acc:>10.4f} "
+                      f"{np.mean(got.argmax(1) == ref.argmax(1)):>7.4f} {np.abs(got - ref).max():>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Incremental lexicon update vs full retrain.
+
+Adds a small overlay of new keywords (and a phrase) to every emotion, then
+builds the updated model with the current full retrain on base + overlay and
+with engine._update_model (delta vectorised, warm-started classifier) at
+several replay sizes. Prints wall time, accuracy on the merged training
+corpus, accuracy on the new rows only and prediction agreement with the full
+retrain. Also times the rule-layer hot reload.
+
+    python benchmarks/bench_incremental.py [--words 5] [--replay 300 1200 all]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import _common  # noqa: F401  (sys.path + offline translation)
+
+import numpy as np
+
+from vibe_oracle import engine
+
+# Candidate additions; anything already in the lexicon is skipped
+_CANDIDATES = {
+    "joy":      ["stoked", "elated", "chuffed", "jubilant", "overjoyed", "buoyant", "gleeful"],
+    "anger":    ["livid", "seething", "incensed", "irate", "fuming", "apoplectic", "riled"],
+    "sadness":  ["forlorn", "crestfallen", "despondent", "morose", "doleful", "woebegone", "glum"],
+    "fear":     ["petrified", "jittery", "spooked", "aghast", "unnerved", "panicky", "skittish"],
+    "disgust":  ["repulsed", "nauseated", "grossed", "sickened", "revolted", "appalled", "icky"],
+    "surprise": ["gobsmacked", "flabbergasted", "dumbfounded", "astounded", "thunderstruck", "agog", "floored"],
+}
+_PHRASES = {
+    "joy": ["on cloud nine"], "anger": ["blew my top"], "sadness": ["down in the dumps"],
+    "fear": ["scared stiff"], "disgust": ["makes my skin crawl"], "surprise": ["out of the blue"],
+}
+
+
+def _accuracy(model, texts, labels) -> float:
+    pipe, le = model
+    pred     = le.inverse_transform(pipe.predict([engine.preprocess(t) for t in texts]))
+    return float(np.mean(pred == np.asarray(labels)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=5, help="new keywords per emotion")
+    parser.add_argument("--replay", nargs="+", default=["300", "1200", "all"],
+                        help="INCREMENTAL_REPLAY_ROWS values to try ('all' = None)")
+    args = parser.parse_args()
+
+    overlay_raw = {
+        "keywords": {e: ws[: args.words] for e, ws in _CANDIDATES.items()},
+        "phrases":  _PHRASES,
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+        json.dump(overlay_raw, fh)
+    overlay = engine._read_overlay(fh.name)
+
+    base = engine.get_model()                        # base artifact (load or train once)
+    for text in engine._build_training_corpus()["text"]:
+        engine.preprocess(text)                      # warm the lemma memo for both paths
+
+    keywords = engine._merged(engine.EMOTION_KEYWORDS, overlay["keywords"])
+    phrases  = engine._merged(engine.MULTILANG_PHRASES, overlay["phrases"])
+
+    t0     = time.perf_counter()
+    full   = engine._train_model(keywords, phrases)
+    t_full = time.perf_counter() - t0
+
+    variants = []
+    for replay in args.replay:
+        engine.INCREMENTAL_REPLAY_ROWS = None if replay == "all" else int(replay)
+        t0   = time.perf_counter()
+        incr = engine._update_model(base, overlay)
+        variants.append((f"incremental ({replay})", incr, time.perf_counter() - t0))
+
+    t0      = time.perf_counter()
+    report  = engine.reload_lexicon(fh.name)
+    t_rules = time.perf_counter() - t0
+    os.remove(fh.name)
+
+    merged  = engine._build_training_corpus(keywords, phrases)
+    delta   = engine._build_training_corpus(overlay["keywords"], overlay["phrases"])
+    X       = [engine.preprocess(t) for t in merged["text"]]
+    full_pr = full[0].predict(X)
+
+    n_new = report["keywords_added"] + report["phrases_added"]
+    print(f"overlay: {n_new} new entries ({len(delta)} delta rows vs {len(merged)} full rows)")
+    print(f"{'':<22} {'seconds':>8} {'speedup':>8} {'acc all':>8} {'acc new':>8} {'agree':>6} {'features':>9}")
+    for name, model, secs in [("full retrain", full, t_full)] + variants:
+        print(f"{name:<22} {secs:>8.3f} {t_full / secs:>7.1f}x "
+              f"{_accuracy(model, merged['text'], merged['label']):>8.3f} "
+              f"{_accuracy(model, delta['text'], delta['label']):>8.3f} "
+              f"{np.mean(model[0].predict(X) == full_pr):>6.3f} "
+              f"{model[0].named_steps['clf'].coef_.shape[1]:>9,}")
+    print(f"rule-layer hot reload: {t_rules * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
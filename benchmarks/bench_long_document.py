@@ -0,0 +1,58 @@
+"""
+Per-request cost of long inputs: whole-text scoring vs long-document mode.
+
+For growing input sizes (journal-like text built from the lexicon) this
+times the old single-row path (_detect_emotion_uncached on the whole string)
+and detect_document with the default CHAR_BUDGET, and reports how many
+sentences were scored and whether the budget truncated the input.
+
+    python benchmarks/bench_long_document.py [--sizes 1000 10000 100000 1000000]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import random
+import time
+
+from _common import keyword_words
+
+from vibe_oracle import engine
+
+
+def _document(chars: int, seed: int = 3) -> str:
+    rng         = random.Random(seed)
+    parts, size = [], 0
+    while size < chars:
+        sentence = " ".join(keyword_words(rng, 5, 25)).capitalize() + rng.choice([".", "!", "?", "।"])
+        parts.append(sentence + ("\n" if rng.random() < 0.1 else " "))
+        size    += len(parts[-1])
+    return "".join(parts)[:chars]
+
+
+def _ms(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - t0) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    engine.get_model()
+    engine.detect_document(_document(2_000, seed=0))      # warm Punkt, lemma memo, VADER
+
+    print(f"budget {engine.CHAR_BUDGET:,} chars, sentence cap {engine.SENTENCE_MAX_CHARS}")
+    print(f"{'chars':>10} {'whole-text ms':>14} {'document ms':>12} {'sentences':>10} {'truncated':>10}")
+    for chars in args.sizes:
+        text  = _document(chars)
+        whole = _ms(engine._detect_emotion_uncached, text)
+        t0    = time.perf_counter()
+        doc   = engine.detect_document(text)
+        docms = (time.perf_counter() - t0) * 1e3
+        print(f"{chars:>10,} {whole:>14.1f} {docms:>12.1f} {len(doc['sentences']):>10,} {str(doc['truncated']):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Resident memory per worker: plain joblib.load vs memory-mapped model loading.
+
+Spawns N fresh processes that each load the same model artifact (copy or
+mmap_mode="r"), touch every coefficient and idf page, then report their
+RSS and PSS growth while all N are alive. PSS (proportional set size) splits
+shared pages between the processes mapping them, so it shows the saving that
+RSS alone hides.
+
+    python -m vibe_oracle bake-model            # make sure an artifact exists
+    python benchmarks/bench_model_memory.py [--workers 4] [--artifact PATH]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import glob
+import multiprocessing as mp
+import os
+import tempfile
+
+
+def _mem_kb() -> dict:
+    """{'rss': kB, 'pss': kB} for this process (Linux /proc)."""
+    out = {"rss": 0, "pss": 0}
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith("VmRSS:"):
+                out["rss"] = int(line.split()[1])
+    try:
+        with open("/proc/self/smaps_rollup") as fh:
+            for line in fh:
+                if line.startswith("Pss:"):
+                    out["pss"] = int(line.split()[1])
+    except OSError:
+        pass
+    return out
+
+
+def _worker(path: str, mmap_mode, barrier, results):
+    import joblib
+    # Import cost is not part of the measurement — load the unpickled classes first
+    import sklearn.feature_extraction.text  # noqa: F401
+    import sklearn.linear_model             # noqa: F401
+    import sklearn.pipeline                 # noqa: F401
+    import sklearn.preprocessing            # noqa: F401
+
+    before   = _mem_kb()
+    pipe, _  = joblib.load(path, mmap_mode=mmap_mode)
+    pipe.named_steps["clf"].coef_.sum()          # fault in every mapped page
+    pipe.named_steps["tfidf"].idf_.sum()
+    barrier.wait()                               # all workers alive and loaded
+    after    = _mem_kb()
+    results.put({k: after[k] - before[k] for k in after})
+    barrier.wait()
+
+
+def _run(path: str, mmap_mode, workers: int) -> dict:
+    ctx     = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs   = [ctx.Process(target=_worker, args=(path, mmap_mode, barrier, results))
+               for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return {
+        "rss_per_worker": sum(r["rss"] for r in rows) / workers,
+        "pss_per_worker": sum(r["pss"] for r in rows) / workers,
+        "pss_total":      sum(r["pss"] for r in rows),
+    }
+
+
+def main():
+    default_dir = (
+        os.environ.get("VIBE_ORACLE_MODEL_DIR")
+        or os.path.join(tempfile.gettempdir(), "vibe_oracle_models")
+    )
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--artifact", default=None,
+                        help=f"model artifact (default: newest in {default_dir})")
+    args = parser.parse_args()
+
+    path = args.artifact
+    if path is None:
+        candidates = glob.glob(os.path.join(default_dir, "*.joblib"))
+        if not candidates:
+            raise SystemExit("no artifact found — run `python -m vibe_oracle bake-model` first")
+        path = max(candidates, key=os.path.getmtime)
+
+    print(f"artifact: {path} ({os.path.getsize(path) / 1024:.0f} kB), workers: {args.workers}")
+    print(f"{'mode':>8} {'RSS/worker kB':>14} {'PSS/worker kB':>14} {'PSS total kB':>13}")
+    for label, mode in [("copy", None), ("mmap", "r")]:
+        r = _run(path, mode, args.workers)
+        print(f"{label:>8} {r['rss_per_worker']:>14.0f} {r['pss_per_worker']:>14.0f} "
+              f"{r['pss_total']:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Side-by-side report: TF-IDF vocabulary pipeline vs hashed-feature pipeline.
+
+For each model variant in engine._MODEL_CONFIGS (and each lexicon growth
+factor, which appends synthetic keywords to every emotion) this prints:
+
+    held-out acc   accuracy on a stratified 20% split (trained on the other 80%)
+    artifact kB    size of the joblib artifact trained on the full corpus
+    load ms        median joblib.load time (mmap_mode as in the engine)
+    rows/s         predict_proba throughput on 10k preprocessed texts
+    single µs      median predict_proba latency for one text
+
+    python benchmarks/bench_model_variants.py [--grow 1 4 16] [--hash-bits 14]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import _common  # noqa: F401  (sys.path + offline translation)
+
+import joblib
+import numpy as np
+
+from vibe_oracle import engine
+
+
+def _grown_keywords(factor: int) -> dict:
+    rng = random.Random(factor)
+    out = {}
+    for emotion, kws in engine.EMOTION_KEYWORDS.items():
+        extra = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+                 for _ in range(len(kws) * (factor - 1))]
+        out[emotion] = list(kws) + extra
+    return out
+
+
+def _split(df, frac: float = 0.2):
+    rng  = np.random.default_rng(42)
+    test = np.zeros(len(df), dtype=bool)
+    for _, idx in df.groupby("label").indices.items():
+        test[rng.choice(idx, size=max(1, int(len(idx) * frac)), replace=False)] = True
+    return df[~test], df[test]
+
+
+def _fit(config: dict, df):
+    from sklearn.preprocessing import LabelEncoder
+
+    le   = LabelEncoder()
+    pipe = engine._make_pipeline(config)
+    pipe.fit([engine.preprocess(t) for t in df["text"]], le.fit_transform(df["label"]))
+    return pipe, le
+
+
+def _row(variant: str, config: dict, keywords: dict, texts: list, tmpdir: str) -> dict:
+    df          = engine._build_training_corpus(keywords)
+    train, test = _split(df)
+    pipe, le    = _fit(config, train)
+    pred        = le.inverse_transform(pipe.predict([engine.preprocess(t) for t in test["text"]]))
+    held_out    = float(np.mean(pred == test["label"].to_numpy()))
+
+    model = engine._train_model(keywords, config=config)
+    path  = os.path.join(tmpdir, f"{variant}.joblib")
+    joblib.dump(model, path)
+    loads = []
+    for _ in range(7):
+        t0 = time.perf_counter()
+        joblib.load(path, mmap_mode=engine.MODEL_MMAP_MODE)
+        loads.append(time.perf_counter() - t0)
+
+    pipe  = model[0]
+    t0    = time.perf_counter()
+    pipe.predict_proba(texts)
+    batch = time.perf_counter() - t0
+    single = []
+    for t in texts[:500]:
+        t0 = time.perf_counter()
+        pipe.predict_proba([t])
+        single.append(time.perf_counter() - t0)
+
+    return {
+        "n_docs":   len(df),
+        "acc":      held_out,
+        "kb":       os.path.getsize(path) / 1024,
+        "load_ms":  statistics.median(loads) * 1e3,
+        "rows_s":   len(texts) / batch,
+        "single":   statistics.median(single) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--grow", type=int, nargs="+", default=[1, 4, 16],
+                        help="lexicon growth factors (synthetic keywords appended)")
+    parser.add_argument("--hash-bits", type=int, default=None,
+                        help="override the hashing variant's n_features as 2**bits")
+    args = parser.parse_args()
+
+    configs = dict(engine._MODEL_CONFIGS)
+    if args.hash_bits:
+        configs["hashing"] = {**configs["hashing"],
+                              "hash": {**configs["hashing"]["hash"], "n_features": 2 ** args.hash_bits}}
+
+    rng   = random.Random(7)
+    vocab = [w for kws in engine.EMOTION_KEYWORDS.values() for w in kws]
+    texts = [engine.preprocess(" ".join(rng.choice(vocab) for _ in range(rng.randint(3, 20))))
+             for _ in range(10_000)]
+    engine._make_pipeline(engine._MODEL_CONFIG)       # pay the sklearn import up front
+
+    print(f"{'variant':<8} {'grow':>4} {'docs':>7} {'held-out acc':>13} {'artifact kB':>12} "
+          f"{'load ms':>8} {'rows/s':>9} {'single µs':>10}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for factor in args.grow:
+            keywords = _grown_keywords(factor)
+            for variant, config in configs.items():
+                r = _row(variant, config, keywords, texts, tmpdir)
+                print(f"{variant:<8} {factor:>4} {r['n_docs']:>7,} {r['acc']:>13.3f} {r['kb']:>12,.0f} "
+                      f"{r['load_ms']:>8.2f} {r['rows_s']:>9,.0f} {r['single']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
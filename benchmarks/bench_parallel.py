@@ -0,0 +1,61 @@
+"""
+Scaling benchmark for process-pool scoring (vibe_oracle.parallel).
+
+Scores the same synthetic English corpus (remote translation disabled, so no
+network is involved) in-process and with 1/2/4/8/16 pool workers, checks
+every parallel result equals the in-process one, and prints throughput and
+speedup. Pool start-up (spawn + model warm-up) is reported separately and
+excluded from the timed run.
+
+    python benchmarks/bench_parallel.py [--rows 40000] [--workers 1 2 4 8 16]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import time
+
+from _common import synthetic_texts   # also sets VIBE_ORACLE_TRANSLATE=0, inherited by workers
+
+import numpy as np
+
+from vibe_oracle import engine
+from vibe_oracle.parallel import default_workers, detect_emotion_parallel, make_pool
+
+
+def _corpus(rows: int) -> list:
+    return synthetic_texts(rows, seed=7)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=40_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--batch-size", type=int, default=512)
+    args = parser.parse_args()
+
+    texts = _corpus(args.rows)
+    engine.get_model()
+    t0       = time.perf_counter()
+    expected = engine.detect_emotion_batch(texts)
+    base     = time.perf_counter() - t0
+
+    print(f"{args.rows:,} rows, {default_workers()} usable CPUs")
+    print(f"{'workers':>8} {'startup s':>10} {'run s':>8} {'rows/s':>10} {'speedup':>8}")
+    print(f"{'in-proc':>8} {'-':>10} {base:>8.2f} {args.rows / base:>10,.0f} {1.0:>7.2f}x")
+    for n in args.workers:
+        t0   = time.perf_counter()
+        pool = make_pool(n)
+        list(pool.map(abs, range(n)))          # spawn pools start (and warm) every worker
+        startup = time.perf_counter() - t0
+
+        t0  = time.perf_counter()
+        got = detect_emotion_parallel(texts, workers=n, batch_size=args.batch_size, pool=pool)
+        run = time.perf_counter() - t0
+        pool.shutdown()
+
+        assert np.array_equal(got, expected), f"parallel result differs at {n} workers"
+        print(f"{n:>8} {startup:>10.2f} {run:>8.2f} {args.rows / run:>10,.0f} {base / run:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Microbenchmark: Aho–Corasick LexiconMatcher vs the original per-pattern loops.
+
+Synthetic lexicons grow from a few hundred to tens of thousands of entries;
+for each size both implementations score the same texts, the scores are
+checked for equality, and the mean time per text is printed.
+
+    python benchmarks/bench_rule_matcher.py
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import random
+import time
+
+import _common  # noqa: F401  (sys.path + offline translation)
+
+from vibe_oracle.lexicon_matcher import LexiconMatcher
+
+EMOTIONS = ["joy", "anger", "sadness", "fear", "disgust", "surprise"]
+SIZES    = [300, 1_000, 3_000, 10_000, 30_000]
+N_TEXTS  = 200
+
+
+def _legacy_scores(phrases: dict, keywords: dict, raw_text: str, translated: str) -> dict:
+    """The pre-automaton loops from _rule_based_scores (token check omitted)."""
+    scores    = {e: 0.0 for e in EMOTIONS}
+    raw_lower = raw_text.lower()
+    for emotion, pats in phrases.items():
+        for phrase in pats:
+            if phrase.lower() in raw_lower:
+                scores[emotion] += 2.0
+    translated_lc = translated.lower()
+    for emotion, kws in keywords.items():
+        for kw in kws:
+            if kw in translated_lc:
+                scores[emotion] += 1.0
+    return scores
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9)))
+
+
+def _lexicon(rng: random.Random, size: int, max_words: int) -> dict:
+    lex = {e: [] for e in EMOTIONS}
+    for i in range(size):
+        n = rng.randint(1, max_words)
+        lex[EMOTIONS[i % len(EMOTIONS)]].append(" ".join(_word(rng) for _ in range(n)))
+    return lex
+
+
+def _texts(rng: random.Random, phrases: dict, keywords: dict) -> list:
+    pool  = [p for v in phrases.values() for p in v] + [k for v in keywords.values() for k in v]
+    texts = []
+    for _ in range(N_TEXTS):
+        words = [_word(rng) for _ in range(rng.randint(5, 40))]
+        words += rng.sample(pool, k=min(3, len(pool)))
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'entries':>8} {'legacy µs':>11} {'automaton µs':>13} {'speedup':>8} {'build ms':>9}")
+    for size in SIZES:
+        phrases  = _lexicon(rng, size // 2, max_words=3)
+        keywords = _lexicon(rng, size - size // 2, max_words=1)
+        texts    = _texts(rng, phrases, keywords)
+
+        t0 = time.perf_counter()
+        phrase_m  = LexiconMatcher(phrases, weight=2.0, lowercase=True)
+        keyword_m = LexiconMatcher(keywords, weight=1.0)
+        build_ms  = (time.perf_counter() - t0) * 1e3
+
+        t0 = time.perf_counter()
+        legacy = [_legacy_scores(phrases, keywords, t, t) for t in texts]
+        legacy_us = (time.perf_counter() - t0) / len(texts) * 1e6
+
+        t0 = time.perf_counter()
+        fast = []
+        for t in texts:
+            scores = {e: 0.0 for e in EMOTIONS}
+            phrase_m.add_scores(scores, t.lower())
+            keyword_m.add_scores(scores, t.lower())
+            fast.append(scores)
+        fast_us = (time.perf_counter() - t0) / len(texts) * 1e6
+
+        assert legacy == fast, f"score mismatch at {size} entries"
+        print(f"{size:>8} {legacy_us:>11.1f} {fast_us:>13.1f} "
+              f"{legacy_us / fast_us:>7.1f}x {build_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Single-row ML layer: Pipeline.predict_proba vs the array-level LinearTextScorer.
+
+Builds the scorer from the active model variant (VIBE_ORACLE_MODEL_VARIANT),
+checks that its probabilities match predict_proba on a synthetic corpus, then
+reports per-call latency percentiles for both paths and the end-to-end
+uncached detect_emotion latency with the fast path on and off.
+
+    python benchmarks/bench_single_row.py [--texts 2000]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import os
+import time
+
+from _common import synthetic_texts
+
+os.environ.setdefault("VIBE_ORACLE_RESULT_CACHE_SIZE", "0")
+
+import numpy as np
+
+from vibe_oracle import engine
+from vibe_oracle.fast_inference import LinearTextScorer
+
+
+def _texts(n: int, seed: int = 9) -> list:
+    return synthetic_texts(n, seed=seed, min_words=3, max_words=25)
+
+
+def _latencies(fn, items) -> np.ndarray:
+    lat = np.empty(len(items))
+    for i, item in enumerate(items):
+        t0     = time.perf_counter()
+        fn(item)
+        lat[i] = time.perf_counter() - t0
+    return lat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=2_000)
+    args = parser.parse_args()
+
+    pipe, _   = engine.get_model()
+    raw       = _texts(args.texts)
+    processed = [engine.preprocess(t) for t in raw]
+
+    t0     = time.perf_counter()
+    scorer = LinearTextScorer.from_pipeline(pipe)
+    build  = (time.perf_counter() - t0) * 1e3
+
+    ref   = pipe.predict_proba(processed)
+    got   = np.array([scorer.predict_proba(t) for t in processed])
+    exact = int((ref == got).all(axis=1).sum())
+    print(f"variant {engine.MODEL_VARIANT}: scorer built in {build:.1f} ms; "
+          f"{exact}/{len(processed)} rows bit-identical, max |diff| {np.abs(ref - got).max():.1e}")
+
+    rows = [
+        ("Pipeline.predict_proba", _latencies(lambda t: pipe.predict_proba([t]), processed)),
+        ("LinearTextScorer",       _latencies(scorer.predict_proba, processed)),
+    ]
+    for flag in (False, True):
+        engine.FAST_PATH = flag
+        engine._fast_scorer.cache_clear()
+        engine._detect_emotion_uncached(raw[0])
+        rows.append((f"detect_emotion fast={'on' if flag else 'off'}",
+                     _latencies(engine._detect_emotion_uncached, raw)))
+
+    print(f"{'path':<26} {'p50 µs':>9} {'p95 µs':>9} {'p99 µs':>9}")
+    for name, lat in rows:
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+        print(f"{name:<26} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Per-message cost of the sliding-window room vibe vs re-scoring history.
+
+Feeds a synthetic chat stream through VibeWindow for several window lengths
+and reports the median per-message update time (scores pre-computed with
+detect_emotion_batch, so only window maintenance is timed) next to the
+naive approach: mean of the last N rows recomputed on every message, and
+re-scoring the last N texts with detect_emotion_batch.
+
+    python benchmarks/bench_streaming.py [--windows 10 100 1000 10000] [--messages 20000]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import statistics
+import time
+
+from _common import CHAT_FILLER, synthetic_texts
+
+import numpy as np
+
+from vibe_oracle import engine
+from vibe_oracle.streaming import VibeWindow
+
+
+def _messages(n: int, seed: int = 5) -> list:
+    return synthetic_texts(n, seed=seed, min_words=2, max_words=15, filler=CHAT_FILLER)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--windows", type=int, nargs="+", default=[10, 100, 1_000, 10_000])
+    parser.add_argument("--messages", type=int, default=20_000)
+    args = parser.parse_args()
+
+    texts  = _messages(args.messages)
+    matrix = engine.detect_emotion_batch(texts)
+
+    print(f"{'window':>8} {'window µs/msg':>14} {'naive mean µs/msg':>18} {'re-score ms/msg':>16} {'max |diff|':>11}")
+    for n in args.windows:
+        room, lat, naive = VibeWindow(max_messages=n), [], []
+        max_diff = 0.0
+        for i, row in enumerate(matrix):
+            t0 = time.perf_counter()
+            room.push_scores(row, timestamp=i)
+            lat.append(time.perf_counter() - t0)
+            t0   = time.perf_counter()
+            mean = matrix[max(0, i + 1 - n): i + 1].mean(axis=0)
+            naive.append(time.perf_counter() - t0)
+            if i % 997 == 0:
+                got      = np.fromiter(room.snapshot()["scores"].values(), dtype=float)
+                max_diff = max(max_diff, float(np.abs(got - np.round(mean, 4)).max()))
+        t0 = time.perf_counter()
+        engine.detect_emotion_batch(texts[-n:])
+        rescore = (time.perf_counter() - t0) * 1e3
+        print(f"{n:>8,} {statistics.median(lat) * 1e6:>14.2f} {statistics.median(naive) * 1e6:>18.2f} "
+              f"{rescore:>16.1f} {max_diff:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
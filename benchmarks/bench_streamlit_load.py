@@ -0,0 +1,244 @@
+"""
+Concurrent multi-session load test of streamlitapp.py against a real Streamlit server.
+
+Starts `streamlit run` headless on a local port, with this file as the entry
+script: it swaps the remote translator for a local stub that sleeps
+--translate-ms and echoes its input, then runs streamlitapp.py. No network
+is used. Each simulated user is its own websocket session on
+/_stcore/stream, i.e. a browser tab with its own script thread on the
+server. A user loads the page, then types a fresh message and clicks
+"Reveal the Vibe" over and over, sending the same rerun BackMsg a browser
+sends. Messages are unique and mix English with romanised Bengali / Hindi,
+so both the local path and the translation path run.
+
+For each concurrency level this reports reveal throughput, p50/p95/p99/max
+latency from sending a rerun to its script_finished message, and the memory
+of the server process: current RSS after the level and its peak so far.
+
+The client speaks Streamlit's browser protocol (BackMsg / ForwardMsg protobufs
+over /_stcore/stream), which is internal to Streamlit. It has been checked
+against streamlit 1.34.0 (the version pinned in requirements.txt, tornado
+server) and 1.65.0 (starlette server). Needs the `websockets` package:
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/bench_streamlit_load.py [--concurrency 1 2 4 8 16 32] [--requests 10] [--translate-ms 80]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import asyncio
+import os
+import random
+import runpy
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+try:
+    import websockets
+except ImportError:        # client side only; see benchmarks/requirements.txt
+    websockets = None
+
+from _common import ROOT, keyword_words, phrase_vocab
+
+
+class _StubTranslator:
+    """Stands in for PooledGoogleTranslator: fixed latency, returns the input."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def translate(self, text: str) -> str:
+        time.sleep(self.seconds)
+        return text
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--requests", type=int, default=10, help="reveal reruns per session")
+    parser.add_argument("--translate-ms", type=float, default=80.0, help="stub translator latency")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)  # server-side entry
+    return parser.parse_args()
+
+
+# ── Server side: runs inside `streamlit run`, once per rerun ─────────────────
+def _serve(translate_ms: float):
+    from vibe_oracle import engine
+
+    engine._translator = lambda: _StubTranslator(translate_ms / 1e3)
+    runpy.run_path(os.path.join(ROOT, "streamlitapp.py"), run_name="__main__")
+
+
+def _start_server(translate_ms: float) -> tuple:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env  = {**os.environ, "VIBE_ORACLE_TRANSLATE": "1"}       # routed to the stub, never the network
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.abspath(__file__),
+         "--server.headless", "true", "--server.address", "127.0.0.1", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false",
+         "--", "--serve", "--translate-ms", str(translate_ms)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {proc.returncode}")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return proc, port
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("streamlit did not become healthy within 120 s")
+
+
+def _memory_mb(pid: int) -> tuple:
+    """(current RSS, peak RSS) of `pid` in MB, from /proc (0, 0 elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            fields = dict(line.split(":", 1) for line in fh)
+        return int(fields["VmRSS"].split()[0]) / 1024, int(fields["VmHWM"].split()[0]) / 1024
+    except (OSError, KeyError):
+        return 0.0, 0.0
+
+
+# ── Client side: one websocket per simulated user ────────────────────────────
+def _messages(n: int, rng: random.Random) -> list:
+    out = []
+    for _ in range(n):
+        if rng.random() < 0.5:
+            words = keyword_words(rng, 4, 20)
+        else:
+            words = [rng.choice(phrase_vocab()) for _ in range(rng.randint(1, 3))]
+        out.append(" ".join(words + [f"#{rng.getrandbits(48):x}"]))   # unique: no cache hits across runs
+    return out
+
+
+class _Session:
+    """One browser tab: a websocket plus the widget ids of the text area and button."""
+
+    def __init__(self, ws):
+        self.ws        = ws
+        self.text_id   = None
+        self.button_id = None
+
+    async def rerun(self, widgets: list = ()) -> list:
+        """Send a rerun BackMsg and wait for its script_finished → ForwardMsg deltas seen."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(widgets)
+        await self.ws.send(msg.SerializeToString())
+        deltas = []
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                deltas.append(fwd.delta)
+            elif kind == "session_event" and fwd.session_event.HasField("script_compilation_exception"):
+                raise RuntimeError("script failed to compile")
+            elif kind == "script_finished":
+                if fwd.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    raise RuntimeError(f"rerun finished with status {fwd.script_finished}")
+                return deltas
+
+    async def load(self):
+        for delta in await self.rerun():
+            element = delta.new_element
+            kind    = element.WhichOneof("type")
+            if kind == "exception":
+                raise RuntimeError(element.exception.message)
+            if kind == "text_area":
+                self.text_id = element.text_area.id
+            elif kind == "button":
+                self.button_id = element.button.id
+        if not (self.text_id and self.button_id):
+            raise RuntimeError("page load did not render the text area and button")
+
+    async def reveal(self, text: str):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        deltas = await self.rerun([WidgetState(id=self.text_id, string_value=text),
+                                   WidgetState(id=self.button_id, trigger_value=True)])
+        for delta in deltas:
+            if delta.new_element.WhichOneof("type") == "exception":
+                raise RuntimeError(delta.new_element.exception.message)
+
+
+async def _user(port: int, texts: list, start: asyncio.Barrier) -> list:
+    try:
+        ws = await websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"],
+                                      max_size=None, open_timeout=120)
+        session = _Session(ws)
+        await session.load()                           # page load — not timed
+    except BaseException:
+        await start.abort()                            # release everyone, surface this error
+        raise
+    async with ws:
+        await start.wait()
+        latencies = []
+        for text in texts:
+            t0 = time.perf_counter()
+            await session.reveal(text)
+            latencies.append(time.perf_counter() - t0)
+        return latencies
+
+
+async def _level(port: int, users: int, requests: int, rng: random.Random) -> dict:
+    import numpy as np
+
+    start = asyncio.Barrier(users + 1)
+    tasks = [asyncio.create_task(_user(port, _messages(requests, rng), start)) for _ in range(users)]
+    try:
+        await start.wait()                             # every session has loaded its page
+    except asyncio.BrokenBarrierError:
+        await asyncio.gather(*tasks)                   # re-raises the session that failed
+    t0   = time.perf_counter()
+    lat  = np.concatenate(await asyncio.gather(*tasks)) * 1e3
+    wall = time.perf_counter() - t0
+    p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+    return {"rps": len(lat) / wall, "p50": p50, "p95": p95, "p99": p99, "max": lat.max()}
+
+
+async def _run(args, port: int, pid: int):
+    rng = random.Random(time.time_ns())
+    await _level(port, 1, 2, rng)                       # warm model, caches, Streamlit internals
+    rss, _ = _memory_mb(pid)
+    print(f"translator stub {args.translate_ms:g} ms, {args.requests} reveals per session, "
+          f"{os.cpu_count()} CPUs, warm server RSS {rss:.0f} MB")
+    print(f"{'sessions':>8} {'reveals/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+          f"{'RSS MB':>7} {'peak MB':>8}")
+    for users in args.concurrency:
+        r = await _level(port, users, args.requests, rng)
+        rss, peak = _memory_mb(pid)
+        print(f"{users:>8} {r['rps']:>10.1f} {r['p50']:>8.1f} {r['p95']:>8.1f} {r['p99']:>8.1f} "
+              f"{r['max']:>8.1f} {rss:>7.0f} {peak:>8.0f}", flush=True)
+
+
+def main():
+    args = _parse_args()
+    if args.serve:
+        _serve(args.translate_ms)
+        return
+
+    if websockets is None:
+        sys.exit("bench_streamlit_load needs `websockets`: pip install -r benchmarks/requirements.txt")
+
+    proc, port = _start_server(args.translate_ms)
+    try:
+        asyncio.run(_run(args, port, proc.pid))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Server-side render cost of streamlitapp.py per rerun (Streamlit AppTest).
+
+Runs the app headless, then repeats two kinds of rerun: the idle page and
+the full results panel for a sample text. For each it reports the median
+script run time, how many elements the script emitted, how many of them were
+markdown, and the serialized payload size of the element protos sent to the
+browser. Remote translation is disabled and the result cache left on, so
+timings reflect rendering rather than detection.
+
+    python benchmarks/bench_streamlit_render.py [--runs 20]
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import os
+import statistics
+import time
+
+from _common import ROOT
+
+from streamlit.testing.v1 import AppTest
+
+SAMPLE_TEXT = "I am so happy and excited today, ami khub khushi"
+
+
+def _walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from _walk(child)
+
+
+def _payload(at: AppTest) -> dict:
+    elements = [n for n in _walk(at._tree) if getattr(n, "proto", None) is not None
+                and not getattr(n, "children", None)]
+    markdown = [n for n in elements if n.type == "markdown"]
+    return {
+        "elements": len(elements),
+        "markdown": len(markdown),
+        "bytes":    sum(len(n.proto.SerializeToString()) for n in elements),
+    }
+
+
+def _measure(runs: int, click: bool) -> dict:
+    at = AppTest.from_file(os.path.join(ROOT, "streamlitapp.py"), default_timeout=120)
+    at.run()                                            # cold run: imports, model, caches
+    times = []
+    for _ in range(runs):
+        if click:
+            at.text_area(key="vibe_input").input(SAMPLE_TEXT)
+            t0 = time.perf_counter()
+            at.button[0].click().run()
+        else:
+            t0 = time.perf_counter()
+            at.run()
+        times.append(time.perf_counter() - t0)
+    assert not at.exception, at.exception
+    return {"ms": statistics.median(times) * 1e3, **_payload(at)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rerun':<10} {'median ms':>10} {'elements':>9} {'markdown':>9} {'payload kB':>11}")
+    for label, click in (("idle", False), ("results", True)):
+        r = _measure(args.runs, click)
+        print(f"{label:<10} {r['ms']:>10.1f} {r['elements']:>9} {r['markdown']:>9} {r['bytes'] / 1024:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
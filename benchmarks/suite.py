@@ -0,0 +1,268 @@
+"""
+Regression benchmark suite with a stored baseline.
+
+Measures, with remote translation stubbed out (VIBE_ORACLE_TRANSLATE=0) and
+the result cache off so every call runs the full pipeline:
+
+    cold start       fresh interpreter: engine import + get_model() (median of runs)
+    single request   detect_emotion latency p50/p95/p99 over a fixed corpus
+    batch            detect_emotion_batch throughput at several batch sizes
+    rule layer       phrase + keyword add_vector cost (the engine's rule path) as the
+                     lexicons grow ×1 … ×64
+    peak memory      max RSS of a fresh process after cold start / a 10k batch
+
+Results are written as JSON. With --baseline every metric is compared to the
+stored value and the run fails (exit 1) when one regresses by more than
+--tolerance, so a PR that slows the hot path is caught.
+
+    python benchmarks/suite.py --out bench.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from _common import ROOT, synthetic_texts
+
+# Stub translation, bypass the result cache, keep spans off — before the engine loads
+BENCH_ENV = {
+    "VIBE_ORACLE_TRANSLATE":         "0",
+    "VIBE_ORACLE_OFFLINE":           "1",
+    "VIBE_ORACLE_RESULT_CACHE_SIZE": "0",
+    "VIBE_ORACLE_RESULT_CACHE_DB":   "",
+    "VIBE_ORACLE_SPANS":             "0",
+}
+os.environ.update(BENCH_ENV)
+
+BATCH_SIZES    = [100, 1_000, 10_000]
+LEXICON_GROWTH = [1, 4, 16, 64]
+
+
+# ── Corpus ───────────────────────────────────────────────────────────────────
+def _corpus(rows: int, seed: int = 7) -> list:
+    return synthetic_texts(rows, seed=seed, phrase_rate=0.2)
+
+
+def _metric(value: float, unit: str, better: str) -> dict:
+    return {"value": round(value, 6), "unit": unit, "better": better}
+
+
+def _max_rss_kb() -> int:
+    """Peak resident set size of this process in kB (ru_maxrss is bytes on macOS)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+# ── Child-process probes (fresh interpreter per measurement) ─────────────────
+def _child(probe: str) -> dict:
+    t0 = time.perf_counter()
+    from vibe_oracle import engine
+    t_import = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    engine.get_model()
+    t_model = time.perf_counter() - t0
+    out = {"import_s": t_import, "get_model_s": t_model, "max_rss_kb": _max_rss_kb()}
+    if probe == "batch-memory":
+        engine.detect_emotion_batch(_corpus(10_000))
+        out["max_rss_kb"] = _max_rss_kb()
+    return out
+
+
+def _run_child(probe: str) -> dict:
+    env  = {**os.environ, **BENCH_ENV}
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", probe],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ── Benchmarks ───────────────────────────────────────────────────────────────
+def bench_cold_start(runs: int) -> dict:
+    _run_child("cold-start")                        # make sure the artifact is baked
+    samples = [_run_child("cold-start") for _ in range(runs)]
+    return {
+        "cold_start.import_s":    _metric(statistics.median(s["import_s"] for s in samples), "s", "lower"),
+        "cold_start.get_model_s": _metric(statistics.median(s["get_model_s"] for s in samples), "s", "lower"),
+        "cold_start.total_s":     _metric(
+            statistics.median(s["import_s"] + s["get_model_s"] for s in samples), "s", "lower"),
+        "memory.cold_start_max_rss_kb": _metric(
+            statistics.median(s["max_rss_kb"] for s in samples), "kB", "lower"),
+    }
+
+
+def bench_single(requests: int) -> dict:
+    from vibe_oracle import engine
+    import numpy as np
+
+    texts = _corpus(requests, seed=11)
+    for t in texts[:50]:                            # warm lemma memo / VADER / sklearn
+        engine.detect_emotion(t)
+    lat = np.empty(len(texts))
+    for i, t in enumerate(texts):
+        t0     = time.perf_counter()
+        engine.detect_emotion(t)
+        lat[i] = time.perf_counter() - t0
+    p50, p95, p99 = np.percentile(lat, [50, 95, 99]) * 1e3
+    return {
+        "single.p50_ms": _metric(p50, "ms", "lower"),
+        "single.p95_ms": _metric(p95, "ms", "lower"),
+        "single.p99_ms": _metric(p99, "ms", "lower"),
+    }
+
+
+def bench_batch(sizes: list, repeats: int) -> dict:
+    from vibe_oracle import engine
+
+    out = {}
+    for n in sizes:
+        texts = _corpus(n, seed=13)
+        engine.detect_emotion_batch(texts[:100])
+        best = min(_timed(engine.detect_emotion_batch, texts) for _ in range(repeats))
+        out[f"batch.rows_per_s@{n}"] = _metric(n / best, "rows/s", "higher")
+    return out
+
+
+def bench_rule_layer(growth: list) -> dict:
+    import numpy as np
+
+    from vibe_oracle.lexicon import EMOTION_KEYWORDS, EMOTIONS, MULTILANG_PHRASES
+    from vibe_oracle.lexicon_matcher import LexiconMatcher
+
+    rng   = random.Random(42)
+    texts = _corpus(500, seed=17)
+    word  = lambda: "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+    out   = {}
+    for factor in growth:
+        phrases  = {e: list(v) for e, v in MULTILANG_PHRASES.items()}
+        keywords = {e: list(v) for e, v in EMOTION_KEYWORDS.items()}
+        for lex, words in ((phrases, 2), (keywords, 1)):
+            for e, entries in lex.items():
+                entries += [" ".join(word() for _ in range(words))
+                            for _ in range(len(entries) * (factor - 1))]
+
+        t0       = time.perf_counter()
+        phrase_m = LexiconMatcher(phrases, weight=2.0, lowercase=True, columns=EMOTIONS)
+        kw_m     = LexiconMatcher(keywords, weight=1.0, columns=EMOTIONS)
+        build    = time.perf_counter() - t0
+
+        def run():                                  # as engine._rule_vector
+            for t in texts:
+                row = np.zeros(len(EMOTIONS))
+                phrase_m.add_vector(row, t.lower())
+                kw_m.add_vector(row, t.lower(), set(t.split()))
+
+        per_text = min(_timed(run) for _ in range(3)) / len(texts)
+        entries  = len(phrase_m) + len(kw_m)
+        out[f"rule_layer.us_per_text@x{factor}"] = _metric(per_text * 1e6, "µs", "lower")
+        out[f"rule_layer.build_ms@x{factor}"]    = _metric(build * 1e3, "ms", "lower")
+        out[f"rule_layer.entries@x{factor}"]     = _metric(entries, "patterns", "info")
+    return out
+
+
+def bench_memory() -> dict:
+    return {"memory.batch10k_max_rss_kb": _metric(_run_child("batch-memory")["max_rss_kb"], "kB", "lower")}
+
+
+def _timed(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+# ── Baseline comparison ──────────────────────────────────────────────────────
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Rows of (metric, baseline, current, change, regressed) for metrics in both runs."""
+    rows = []
+    for name, base in baseline["metrics"].items():
+        cur = current["metrics"].get(name)
+        if cur is None or base["better"] == "info" or not base["value"]:
+            continue
+        change = cur["value"] / base["value"] - 1.0
+        worse  = change if base["better"] == "lower" else -change
+        rows.append((name, base["value"], cur["value"], change, worse > tolerance))
+    return rows
+
+
+def _meta() -> dict:
+    from vibe_oracle import engine
+
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True).stdout.strip()
+    except OSError:
+        rev = ""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_rev":   rev,
+        "python":    platform.python_version(),
+        "platform":  platform.platform(),
+        "cpus":      os.cpu_count(),
+        "model_key": engine.model_key()[:16],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=None, help="write results JSON here (default stdout)")
+    parser.add_argument("--baseline", default=None, help="compare against this results JSON")
+    parser.add_argument("--save-baseline", default=None, help="also write results here")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative regression per metric (default 0.25)")
+    parser.add_argument("--quick", action="store_true", help="fewer runs / smaller sizes")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child)))
+        return 0
+
+    metrics = {}
+    for label, fn in (
+        ("cold start",     lambda: bench_cold_start(runs=3 if args.quick else 5)),
+        ("single request", lambda: bench_single(requests=300 if args.quick else 2_000)),
+        ("batch",          lambda: bench_batch(BATCH_SIZES[:2] if args.quick else BATCH_SIZES,
+                                               repeats=2 if args.quick else 3)),
+        ("rule layer",     lambda: bench_rule_layer(LEXICON_GROWTH[:3] if args.quick else LEXICON_GROWTH)),
+        ("peak memory",    bench_memory),
+    ):
+        t0 = time.perf_counter()
+        metrics.update(fn())
+        print(f"  {label:<15} {time.perf_counter() - t0:6.1f}s", file=sys.stderr)
+
+    result = {"meta": _meta(), "metrics": metrics}
+    text   = json.dumps(result, indent=2, ensure_ascii=False)
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    if not args.out:
+        print(text)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    rows = compare(result, baseline, args.tolerance)
+    print(f"\n{'metric':<34} {'baseline':>12} {'current':>12} {'change':>8}", file=sys.stderr)
+    for name, base, cur, change, regressed in rows:
+        flag = "  REGRESSED" if regressed else ""
+        print(f"{name:<34} {base:>12.4g} {cur:>12.4g} {change:>+7.1%}{flag}", file=sys.stderr)
+    failed = [r[0] for r in rows if r[4]]
+    if failed:
+        print(f"\n{len(failed)} metric(s) regressed beyond {args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,361 +2,26 @@
 🌌 Vibe Oracle — Full Streamlit App
 Detects emotional vibe of user input text with a mystical, visually rich UI.
 
-Stack: streamlit==1.34.0 | nltk==3.8.1 | scikit-learn | pandas | numpy | joblib | deep-translator
+The detection engine lives in the headless `vibe_oracle` package; this script
+is only the UI on top of it.
+
+Stack: streamlit==1.34.0 | nltk==3.8.1 | scikit-learn | pandas | numpy | joblib | requests | beautifulsoup4
 """
 
 # ── Standard library ──────────────────────────────────────────────────────────
 import re
-import os
-import tempfile
 
 # ── Third-party ───────────────────────────────────────────────────────────────
-import numpy as np
-import pandas as pd
-import joblib
 import streamlit as st
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from deep_translator import GoogleTranslator
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import LabelEncoder
-
-# ── Download required NLTK data ───────────────────────────────────────────────
-for _pkg in ["vader_lexicon", "stopwords", "wordnet", "punkt", "omw-1.4"]:
-    try:
-        nltk.download(_pkg, quiet=True)
-    except Exception:
-        pass
 
-# =============================================================================
-# EMOTION DATA DICTIONARIES
-# =============================================================================
-
-EMOTION_KEYWORDS = {
-    "joy": [
-        "happy", "happiness", "joyful", "excited", "love", "wonderful", "amazing",
-        "great", "fantastic", "cheerful", "delighted", "thrilled", "bliss", "elated",
-        "ecstatic", "glad", "laugh", "smile", "celebrate", "fun", "enjoy", "grateful",
-        "awesome", "brilliant", "content", "pleased", "radiant", "euphoric", "good",
-        "excellent", "positive", "hopeful", "vibrant", "alive", "bright",
-    ],
-    "anger": [
-        "angry", "anger", "furious", "rage", "mad", "hate", "irritated", "annoyed",
-        "outraged", "frustrated", "enraged", "livid", "fuming", "hostile", "bitter",
-        "resentful", "aggressive", "violent", "disgusted", "infuriated", "explode",
-        "boiling", "seething", "wrathful", "irate", "temper", "snap", "explosive",
-    ],
-    "sadness": [
-        "sad", "unhappy", "depressed", "miserable", "heartbroken", "grief", "cry",
-        "sorrow", "mournful", "hopeless", "lonely", "gloomy", "melancholy", "despair",
-        "desolate", "tragic", "painful", "lost", "tears", "devastated", "anguish",
-        "down", "blue", "broken", "suffering", "hurt", "empty", "void", "miss",
-    ],
-    "fear": [
-        "afraid", "fear", "scared", "terrified", "anxious", "nervous", "panic",
-        "dread", "horror", "terror", "phobia", "worried", "uneasy", "apprehensive",
-        "trembling", "fright", "nightmare", "shock", "startled", "petrified",
-        "paranoid", "shaking", "tremble", "spooked", "creepy", "haunted",
-    ],
-    "disgust": [
-        "disgusting", "gross", "revolting", "nasty", "awful", "yuck", "repulsed",
-        "sick", "vomit", "nauseating", "horrible", "repulsive", "filthy", "foul",
-        "unpleasant", "loathe", "abhorrent", "putrid", "hideous", "revolted",
-        "sickening", "vile", "repugnant", "offensive", "stink",
-    ],
-    "surprise": [
-        "surprised", "shocked", "astonished", "amazed", "unexpected", "wow",
-        "unbelievable", "incredible", "stunning", "remarkable", "astounded",
-        "speechless", "gasp", "omg", "whoa", "sudden", "startling", "jaw-dropping",
-        "mind-blowing", "extraordinary", "unreal", "whoah", "no way",
-    ],
-}
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle.engine import detect_emotion, get_model, startup_report, translation_decision
+from vibe_oracle.lexicon import EMOTIONS, LANG_DICT
 
 # =============================================================================
-# THREE-LANGUAGE DICTIONARY  (English · Bengali · Hindi)
-# Used both for phrase-matching detection AND for the UI reference table.
+# UI DICTIONARIES
 # =============================================================================
 
-# Each entry: { "en": [...], "bn": [...], "hi": [...] }
-LANG_DICT = {
-    "joy": {
-        "en": [
-            "happy", "joyful", "excited", "wonderful", "amazing", "delighted",
-            "thrilled", "ecstatic", "cheerful", "blissful", "elated", "radiant",
-            "grateful", "celebrate", "euphoric", "content", "pleased",
-        ],
-        "bn": [
-            "খুশি",           # khushi  – happy
-            "আনন্দিত",        # anandita – joyful
-            "উত্সাহিত",       # utsahit – excited
-            "দারুণ",          # darun – wonderful
-            "অসাধারণ",        # asadharan – amazing
-            "আনন্দ",          # ananda – joy
-            "হাসি",           # hashi – smile/laughter
-            "ভালো লাগছে",     # bhalo lagche – feeling good
-            "অনেক মজা",       # onek moja – so much fun
-            "খুব ভালো",       # khub bhalo – very good
-            "উল্লাস",         # ullas – delight
-            "তৃপ্তি",         # tripti – contentment
-            "কৃতজ্ঞ",         # kritagya – grateful
-            "উচ্ছ্বাস",       # uchchhas – elation
-            "মজাদার",         # mojadaar – enjoyable
-        ],
-        "hi": [
-            "खुश",            # khush – happy
-            "खुशी",           # khushi – happiness
-            "प्रसन्न",        # prasann – pleased
-            "आनंदित",         # aanandित – joyful
-            "उत्साहित",       # utsaahit – excited
-            "शानदार",         # shaandaar – wonderful
-            "मस्त",           # mast – awesome
-            "जश्न",           # jashn – celebration
-            "कमाल",           # kamaal – amazing
-            "बेहतरीन",        # behtareen – excellent
-            "दिल खुश",        # dil khush – heart happy
-            "बहुत मज़ा",       # bahut maza – so much fun
-            "कृतज्ञ",         # kritagna – grateful
-            "उल्लास",         # ullaas – joy
-            "तृप्त",          # trupt – content
-        ],
-    },
-    "anger": {
-        "en": [
-            "angry", "furious", "rage", "mad", "hate", "irritated", "annoyed",
-            "outraged", "frustrated", "enraged", "livid", "fuming", "hostile",
-            "bitter", "resentful", "aggressive", "infuriated", "wrathful",
-        ],
-        "bn": [
-            "রাগান্বিত",      # raganvit – angry
-            "ক্রোধিত",        # krodhit – furious
-            "রাগ হচ্ছে",      # rag hochhe – feeling angry
-            "খুব রাগ",        # khub rag – very angry
-            "বিরক্ত",         # birakt – irritated
-            "ঘেন্না",         # ghenna – disgust/hatred
-            "ক্ষুব্ধ",        # khubdh – outraged
-            "জ্বলছি",         # jolchi – burning (with anger)
-            "অসহ্য",          # asahya – unbearable
-            "হতাশ",           # hatash – frustrated
-            "শত্রুতা",        # shotrutha – hostility
-            "প্রতিশোধ",       # protishod – revenge
-            "উগ্র",           # ugro – aggressive
-            "তিক্ততা",        # tiktota – bitterness
-            "রোষ",            # rosh – wrath
-        ],
-        "hi": [
-            "गुस्सा",         # gussa – angry
-            "क्रोध",          # krodh – anger/rage
-            "नाराज़",         # naraaz – displeased
-            "चिढ़",           # chidh – irritated
-            "भड़का हुआ",      # bhadka hua – enraged
-            "आग बबूला",       # aag babula – furious
-            "बहुत गुस्सा",    # bahut gussa – very angry
-            "जलन",            # jalan – burning anger
-            "कोप",            # kop – wrath
-            "आक्रोश",         # aakrosh – outrage
-            "नफ़रत",          # nafrat – hatred
-            "झुंझलाहट",       # jhunjhlahat – annoyance
-            "कड़वाहट",        # kadwahat – bitterness
-            "रोष",            # rosh – fury
-            "तैश",            # taish – rage
-        ],
-    },
-    "sadness": {
-        "en": [
-            "sad", "unhappy", "depressed", "miserable", "heartbroken", "grief",
-            "sorrow", "hopeless", "lonely", "gloomy", "melancholy", "despair",
-            "devastated", "anguish", "broken", "suffering", "empty", "lost",
-        ],
-        "bn": [
-            "দুঃখিত",          # dukhit – sad
-            "মন খারাপ",        # mon kharap – feeling down
-            "কষ্ট পাচ্ছি",    # koshto pachhi – feeling hurt
-            "কান্না পাচ্ছে",  # kanna pachhe – feeling like crying
-            "একা",             # eka – alone/lonely
-            "হতাশ",            # hatash – hopeless
-            "দুঃখ",            # dukh – grief
-            "বিষণ্ণ",          # bishonno – gloomy
-            "ভেঙে পড়েছি",    # bhenge porechhi – broken down
-            "বিষাদ",           # bishad – melancholy
-            "শোক",             # shok – mourning
-            "যন্ত্রণা",        # jantrana – anguish
-            "অসহায়",          # asahay – helpless
-            "ক্লান্ত",         # klant – exhausted/weary
-            "বিধ্বস্ত",        # bidhwosto – devastated
-        ],
-        "hi": [
-            "उदास",            # udaas – sad
-            "दुखी",            # dukhi – unhappy
-            "निराश",           # niraash – disappointed/hopeless
-            "अकेला",           # akela – lonely
-            "टूटा हुआ",        # toota hua – broken
-            "रोना आ रहा",      # rona aa raha – feeling like crying
-            "दर्द",            # dard – pain
-            "गम",              # gham – grief
-            "बर्बाद",          # barbaad – devastated
-            "दिल टूट गया",    # dil toot gaya – heartbroken
-            "उजड़ा हुआ",      # ujda hua – desolate
-            "विषाद",           # vishad – melancholy
-            "पीड़ा",           # peeda – suffering
-            "तकलीफ़",         # takleef – distress
-            "बेबस",            # bebas – helpless
-        ],
-    },
-    "fear": {
-        "en": [
-            "afraid", "scared", "terrified", "anxious", "nervous", "panic",
-            "dread", "horror", "terror", "worried", "uneasy", "petrified",
-            "paranoid", "trembling", "haunted", "spooked", "fright", "nightmare",
-        ],
-        "bn": [
-            "ভয় পাচ্ছি",      # bhoy pachhi – feeling scared
-            "ভয় লাগছে",       # bhoy lagche – feeling fear
-            "আতঙ্কিত",         # aatankito – terrified
-            "নার্ভাস",         # nervous – nervous
-            "উদ্বিগ্ন",        # udbigno – anxious
-            "ভয়ংকর",          # bhoyonkor – horrifying
-            "দুশ্চিন্তা",      # dushchinta – worry
-            "আতঙ্ক",           # aatank – panic/terror
-            "শিউরে উঠছি",     # shiure uthchi – shuddering
-            "ভূত ভূত",         # bhoot bhoot – ghostly
-            "ত্রাস",           # tras – dread
-            "শঙ্কা",           # shanka – apprehension
-            "কাঁপছি",          # kampchi – trembling
-            "দুঃস্বপ্ন",       # duhswapno – nightmare
-            "আশঙ্কা",          # ashanka – fearful anticipation
-        ],
-        "hi": [
-            "डर",              # dar – fear
-            "डरा हुआ",         # dara hua – scared
-            "घबराहट",          # ghabrahat – nervousness
-            "भय",              # bhay – dread
-            "आतंक",            # aatank – terror
-            "चिंता",           # chinta – anxiety/worry
-            "दहशत",            # dahshat – horror
-            "सहम गया",         # saham gaya – startled/froze
-            "कांप रहा हूं",    # kaanp raha hun – trembling
-            "बहुत डर",         # bahut dar – very scared
-            "डर लग रहा है",   # dar lag raha hai – feeling scared
-            "भूत जैसा",        # bhoot jaisa – like a ghost
-            "घबराया हुआ",      # ghabraya hua – panicked
-            "रूह काँप गई",     # rooh kaanp gayi – soul trembled
-            "खौफ़",            # khauf – terror
-        ],
-    },
-    "disgust": {
-        "en": [
-            "disgusting", "gross", "revolting", "nasty", "yuck", "repulsed",
-            "nauseating", "horrible", "repulsive", "filthy", "foul", "loathe",
-            "abhorrent", "putrid", "vile", "sickening", "offensive", "stink",
-        ],
-        "bn": [
-            "ঘেন্না লাগছে",   # ghenna lagche – feeling disgusted
-            "বিরক্তিকর",       # birktikar – disgusting
-            "নোংরা",           # nongra – filthy
-            "বাজে",            # baje – awful/bad
-            "অসহ্য গন্ধ",     # asahya gondho – unbearable smell
-            "ছি ছি",           # chhi chhi – ugh/yuck
-            "জঘন্য",           # jaghonyo – heinous/disgusting
-            "বমি পাচ্ছে",      # bomi pachhe – feeling like vomiting
-            "ঘৃণা",            # ghrina – hatred/revulsion
-            "অরুচিকর",         # oruchikor – distasteful
-            "ভয়াবহ",          # bhoyaboho – horrible
-            "কুৎসিত",          # kutsit – ugly/repulsive
-            "দুর্গন্ধ",        # durgondho – foul smell
-            "বীভৎস",           # bibhotso – grotesque
-            "ঘৃণ্য",           # ghrinyo – repugnant
-        ],
-        "hi": [
-            "घिनौना",          # ghinauna – disgusting
-            "बेकार",           # bekaar – useless/awful
-            "गंदा",            # ganda – dirty/filthy
-            "उल्टी आ रही",    # ulti aa rahi – feeling like vomiting
-            "घृणा",            # ghrina – revulsion
-            "बदबूदार",         # badbudaar – stinking
-            "भयानक",           # bhayanak – horrible
-            "नफ़रत",           # nafrat – loathing
-            "छी छी",           # chhi chhi – yuck
-            "गंदगी",           # gandagi – filth
-            "वाहियात",         # waahiyaat – disgusting/worthless
-            "बकवास",           # bakwaas – nonsense/awful
-            "जुगुप्सा",        # jugupsa – disgust
-            "घिन",             # ghin – revulsion
-            "बेहूदा",          # behooda – absurd/repulsive
-        ],
-    },
-    "surprise": {
-        "en": [
-            "surprised", "shocked", "astonished", "amazed", "unexpected", "wow",
-            "unbelievable", "incredible", "stunning", "remarkable", "astounded",
-            "speechless", "gasp", "mind-blowing", "extraordinary", "whoa", "omg",
-        ],
-        "bn": [
-            "অবাক",            # obak – surprised
-            "আশ্চর্য",         # ashchoryo – astonished
-            "অবিশ্বাস্য",      # obishwasyo – unbelievable
-            "চমকে গেছি",       # chomke gechi – startled
-            "এটা কী করে সম্ভব", # eta ki kore shombhob – how is this possible
-            "অদ্ভুত",          # odbhut – strange/unexpected
-            "হতবাক",           # hotobak – speechless
-            "বিস্মিত",         # bismit – amazed
-            "চমৎকার",          # chomotkar – wonderful/astonishing
-            "অপ্রত্যাশিত",     # oprottashit – unexpected
-            "অকল্পনীয়",       # okalponiyo – unimaginable
-            "আরে বাবা",        # are baba – oh my goodness
-            "কী আশ্চর্য",      # ki ashchoryo – how surprising
-            "বিষ্ময়",          # bishmoyo – amazement
-            "থমকে গেছি",       # thomke gechi – stunned
-        ],
-        "hi": [
-            "हैरान",           # hairaan – surprised
-            "चौंक गया",        # chaunk gaya – startled
-            "अविश्वसनीय",     # avishvasneey – unbelievable
-            "अरे वाह",         # are waah – oh wow
-            "क्या बात है",     # kya baat hai – what a thing
-            "अचंभा",           # achambha – astonishment
-            "दंग रह गया",      # dang reh gaya – stunned
-            "सच में",          # sach mein – really?
-            "यकीन नहीं होता", # yakeen nahi hota – can't believe it
-            "ओह माय गॉड",     # oh my god
-            "कमाल है",         # kamaal hai – amazing
-            "अजीब",            # ajeeb – strange/unexpected
-            "विस्मय",          # vismay – wonder
-            "हक्का बक्का",     # hakka bakka – dumbfounded
-            "अप्रत्याशित",    # apratyashit – unexpected
-        ],
-    },
-}
-
-# Flatten LANG_DICT into MULTILANG_PHRASES for detection engine
-# (combines Bengali script + Hindi script + romanised Hinglish phrases)
-_HINGLISH_EXTRA = {
-    "joy":      ["bahut maza", "kitna maza", "maja aa gaya", "full masti",
-                 "dil khush", "ek number", "bhai wah", "acha lag raha", "bohot khushi"],
-    "anger":    ["bahut gussa", "bura lag raha", "kuch nahi chahiye", "bohot bura",
-                 "chup raho", "teri toh", "faltu baat", "kya bakwas", "dimag mat kha"],
-    "sadness":  ["bahut dukh", "rona aa raha", "dil toot gaya", "ek dum sad",
-                 "kuch nahi ho raha", "akele hain", "bahut bura lag raha"],
-    "fear":     ["bahut dar lag raha", "dar gaya", "dara hua", "bhoot jaisa",
-                 "itna darna", "andhera"],
-    "disgust":  ["chhi chhi", "yuck yaar", "kya bakwas hai", "bilkul pasand nahi",
-                 "ganda hai", "ulti aa rahi"],
-    "surprise": ["arre wah", "yaar kya baat", "sach mein", "aisa kaise",
-                 "oh my god yaar", "kya hua", "kitni badi baat"],
-}
-
-MULTILANG_PHRASES = {
-    emotion: (
-        LANG_DICT[emotion]["bn"]
-        + LANG_DICT[emotion]["hi"]
-        + _HINGLISH_EXTRA[emotion]
-    )
-    for emotion in LANG_DICT
-}
-
 EMOTION_EMOJIS = {
     "joy":      "😄",
     "anger":    "😡",
@@ -402,205 +67,6 @@ TAGLINES = {
     "surprise": "The universe loves to astonish 💫",
 }
 
-EMOTIONS = list(EMOTION_KEYWORDS.keys())
-
-# =============================================================================
-# NLP UTILITIES
-# =============================================================================
-
-_lemmatizer = WordNetLemmatizer()
-_sia        = SentimentIntensityAnalyzer()
-
-try:
-    _stop_words = set(stopwords.words("english"))
-except Exception:
-    _stop_words = set()
-
-
-def preprocess(text: str) -> str:
-    """Lowercase → strip punctuation → tokenize → remove stopwords → lemmatize → rejoin."""
-    text   = text.lower()
-    text   = re.sub(r"[^\w\s]", " ", text)
-    tokens = text.split()
-    tokens = [_lemmatizer.lemmatize(t) for t in tokens if t not in _stop_words]
-    return " ".join(tokens)
-
-
-def translate_to_english(text: str) -> str:
-    """Auto-detect source language and translate to English via deep_translator."""
-    try:
-        result = GoogleTranslator(source="auto", target="en").translate(text)
-        return result if result else text
-    except Exception:
-        return text
-
-
-# =============================================================================
-# SKLEARN ML MODEL  (TF-IDF + Logistic Regression, cached with joblib)
-# =============================================================================
-
-_MODEL_CACHE_PATH = os.path.join(tempfile.gettempdir(), "vibe_oracle_model.joblib")
-
-
-def _build_training_corpus() -> pd.DataFrame:
-    """
-    Build a synthetic training DataFrame from keyword + phrase seeds.
-    Returns a pandas DataFrame with columns ['text', 'label'].
-    """
-    # Sentence templates per keyword
-    templates = [
-        "I feel {w} today",
-        "This makes me feel {w}",
-        "Feeling so {w} right now",
-        "I am completely {w}",
-        "Everything feels {w}",
-        "Such a {w} moment",
-        "I cannot help but feel {w}",
-        "It was truly {w}",
-        "The {w} inside me is overwhelming",
-        "So much {w}",
-        "{w} is all I feel",
-        "{w}",
-    ]
-
-    records = []
-    for emotion, keywords in EMOTION_KEYWORDS.items():
-        for kw in keywords:
-            for tpl in templates:
-                records.append({"text": tpl.format(w=kw), "label": emotion})
-        # Also seed with multi-language phrases
-        for phrase in MULTILANG_PHRASES.get(emotion, []):
-            records.append({"text": phrase, "label": emotion})
-
-    # Build DataFrame and shuffle with numpy for reproducibility
-    df  = pd.DataFrame(records)
-    rng = np.random.default_rng(42)
-    idx = rng.permutation(len(df))
-    df  = df.iloc[idx].reset_index(drop=True)
-    return df
-
-
-def _train_model():
-    """Train TF-IDF + LogisticRegression pipeline; return (pipeline, label_encoder)."""
-    df = _build_training_corpus()
-    le = LabelEncoder()
-    y  = le.fit_transform(df["label"])
-    X  = df["text"].apply(preprocess)
-
-    pipe = Pipeline([
-        ("tfidf", TfidfVectorizer(
-            ngram_range=(1, 2),
-            max_features=8000,
-            sublinear_tf=True,
-        )),
-        ("clf", LogisticRegression(
-            max_iter=1000,
-            C=5.0,
-            solver="lbfgs",
-            random_state=42,
-        )),
-    ])
-    pipe.fit(X, y)
-    return pipe, le
-
-
-@st.cache_resource(show_spinner=False)
-def get_model():
-    """Return cached (pipeline, label_encoder). Train once; persist via joblib."""
-    if os.path.exists(_MODEL_CACHE_PATH):
-        try:
-            return joblib.load(_MODEL_CACHE_PATH)
-        except Exception:
-            pass   # corrupt cache — retrain
-
-    pipe, le = _train_model()
-    try:
-        joblib.dump((pipe, le), _MODEL_CACHE_PATH)
-    except Exception:
-        pass
-    return pipe, le
-
-
-# =============================================================================
-# EMOTION DETECTION  (3-layer fusion)
-# =============================================================================
-
-def _rule_based_scores(raw_text: str, translated: str) -> dict:
-    """Layer 1 + 2: multi-lang phrase hits (weight ×2) + keyword hits."""
-    scores    = {e: 0.0 for e in EMOTIONS}
-    raw_lower = raw_text.lower()
-
-    # 1. Multi-language phrase detection on original text
-    for emotion, phrases in MULTILANG_PHRASES.items():
-        for phrase in phrases:
-            if phrase.lower() in raw_lower:
-                scores[emotion] += 2.0
-
-    # 2. Keyword matching on translated + preprocessed text
-    tokens        = set(preprocess(translated).split())
-    translated_lc = translated.lower()
-    for emotion, keywords in EMOTION_KEYWORDS.items():
-        for kw in keywords:
-            if kw in tokens or kw in translated_lc:
-                scores[emotion] += 1.0
-
-    return scores
-
-
-def detect_emotion(raw_text: str) -> dict:
-    """
-    Multi-layer emotion detection → probability distribution over 6 emotions.
-
-    Priority chain:
-      1. Rule-based (phrase + keyword) — normalised if any signal
-      2. ML model (TF-IDF + LogReg) probability vector
-      3. VADER compound fallback when ML confidence is low
-      4. Blend: 60% rule + 40% ML when rule has signal; 100% ML otherwise
-    """
-    # Translate once
-    translated = translate_to_english(raw_text)
-
-    # ── Layer 1 & 2: rule-based ───────────────────────────────────────────────
-    rule_s     = _rule_based_scores(raw_text, translated)
-    rule_total = sum(rule_s.values())
-
-    # ── Layer 2: ML ───────────────────────────────────────────────────────────
-    pipe, le      = get_model()
-    processed     = preprocess(translated)
-    ml_proba_arr  = pipe.predict_proba([processed])[0]          # numpy array
-    ml_classes    = le.inverse_transform(np.arange(len(ml_proba_arr)))
-    ml_scores     = {cls: float(ml_proba_arr[i])
-                     for i, cls in enumerate(ml_classes)}
-    for e in EMOTIONS:
-        ml_scores.setdefault(e, 0.0)
-
-    # ── Blend ────────────────────────────────────────────────────────────────
-    if rule_total > 0:
-        rule_proba = {e: rule_s[e] / rule_total for e in EMOTIONS}
-        blended    = {e: 0.6 * rule_proba[e] + 0.4 * ml_scores[e] for e in EMOTIONS}
-    else:
-        blended = dict(ml_scores)
-        # ── Layer 3: VADER safety-net when ML is uncertain ────────────────────
-        top_conf = max(blended.values())
-        if top_conf < 0.40:
-            compound = _sia.polarity_scores(translated)["compound"]
-            if compound >= 0.05:
-                blended["joy"]     = blended.get("joy", 0)     + 0.50
-            elif compound <= -0.05:
-                blended["sadness"] = blended.get("sadness", 0) + 0.50
-            total = sum(blended.values())
-            blended = {e: v / total for e, v in blended.items()}
-
-    # Final normalisation
-    total = sum(blended.values())
-    if total > 0:
-        blended = {e: round(blended[e] / total, 4) for e in EMOTIONS}
-    else:
-        blended = {e: round(1.0 / len(EMOTIONS), 4) for e in EMOTIONS}
-
-    return blended
-
-
 # =============================================================================
 # STREAMLIT PAGE CONFIG
 # =============================================================================
@@ -615,7 +81,7 @@ st.set_page_config(
 # CSS
 # =============================================================================
 
-st.markdown("""
+_CSS = """
 <style>
 @import url('https://fonts.googleapis.com/css2?family=Cinzel+Decorative:wght@400;700;900&family=Raleway:ital,wght@0,300;0,400;0,600;1,300&display=swap');
 
@@ -852,25 +318,220 @@ textarea:focus {
     font-size: .95rem !important;
 }
 
+/* ── Dictionary chips & lexicon table ── */
+.chip {
+    display: inline-block; margin: 3px 4px; padding: 4px 10px;
+    border-radius: 999px; font-size: .78rem; font-weight: 600;
+    background: var(--chip-bg); border: 1px solid var(--chip-bd);
+    color: #f0e6ff; font-family: 'Raleway', sans-serif;
+}
+.lex-table { width: 100%; border-collapse: collapse; }
+.lex-table th {
+    padding: 8px 12px; text-align: left;
+    color: #c4b5fd; font-family: 'Cinzel Decorative', serif;
+    font-size: .72rem; letter-spacing: .12em; border-bottom: 1px solid rgba(168,85,247,.3);
+}
+.lex-table td {
+    padding: 7px 12px; font-size: .8rem;
+    color: #e2d9f3; font-family: 'Raleway', sans-serif;
+    border-bottom: 1px solid rgba(255,255,255,.05);
+}
+
 /* ── Hide Streamlit chrome ── */
 #MainMenu, footer, [data-testid="stDecoration"] { display: none !important; }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # =============================================================================
-# LAYOUT
+# STATIC FRAGMENTS  (input-independent HTML, built once per process)
 # =============================================================================
 
-st.markdown('<div class="main-wrapper">', unsafe_allow_html=True)
+_LANG_LABELS = {"en": "🇬🇧 English", "bn": "🇧🇩 বাংলা", "hi": "🇮🇳 हिंदी"}
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE   = re.compile(r"\s*([{};,>])\s*")
+
+
+@st.cache_data(show_spinner=False)
+def _css_html() -> str:
+    """_CSS with comments and layout whitespace stripped — re-sent on every rerun."""
+    css = _CSS_COMMENT.sub("", _CSS)
+    css = " ".join(css.split())
+    return _CSS_SPACE.sub(r"\1", css)
+
+
+def _section_label(text: str) -> str:
+    return f'<hr class="mystic-divider"><p class="section-label" style="text-align:center;">{text}</p>'
+
+
+def _chips(words: list, chip_color: str) -> str:
+    """Word chips; .chip takes its tint from --chip-bg / --chip-bd on the wrapper."""
+    chips = "".join(f'<span class="chip">{w}</span>' for w in words)
+    return f'<div style="--chip-bg:{chip_color}22; --chip-bd:{chip_color}55; text-align:center; line-height:2;">{chips}</div>'
+
+
+@st.cache_data(show_spinner=False)
+def _dictionary_panel_html(emotion: str) -> str:
+    """Three-language word-chip panel for one emotion (3 columns in a CSS grid)."""
+    color   = EMOTION_COLORS[emotion]
+    entry   = LANG_DICT[emotion]
+    columns = "".join(
+        f'<div style="background:rgba(255,255,255,.03);'
+        f'border:1px solid {color}33;'
+        f'border-radius:14px; padding:12px 10px;'
+        f'min-height:200px;">'
+        f'<p style="font-family:\'Cinzel Decorative\',serif;'
+        f'font-size:.72rem; letter-spacing:.15em;'
+        f'color:{color}; text-align:center;'
+        f'margin-bottom:8px; text-transform:uppercase;">'
+        f'{_LANG_LABELS[lang_key]}</p>'
+        f'{_chips(entry[lang_key], color)}'
+        f'</div>'
+        for lang_key in ("en", "bn", "hi")
+    )
+    return (
+        _section_label("✦ Emotion Dictionary ✦ English · বাংলা · हिंदी")
+        + f'<div style="display:grid; grid-template-columns:repeat(3, 1fr); gap:1rem;">{columns}</div>'
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _lexicon_table_html() -> str:
+    """Compact table of all emotions × all 3 languages (first 5 words each)."""
+    header_cells = "".join(f"<th>{col}</th>" for col in ("Emotion", "English", "বাংলা", "हिंदी"))
+    body_rows = ""
+    for emo in EMOTIONS:
+        values = [f"{EMOTION_EMOJIS[emo]} {emo.capitalize()}"] + [
+            " · ".join(LANG_DICT[emo][lang][:5]) for lang in ("en", "bn", "hi")
+        ]
+        cells = "".join(f"<td>{v}</td>" for v in values)
+        body_rows += f'<tr style="background:{EMOTION_COLORS[emo]}0d;">{cells}</tr>'
+
+    return (
+        _section_label("✦ Full Emotion Lexicon ✦")
+        + '<div style="overflow-x:auto; border-radius:12px;'
+        'border:1px solid rgba(168,85,247,.25);'
+        'background:rgba(255,255,255,.03);">'
+        '<table class="lex-table">'
+        f'<thead><tr>{header_cells}</tr></thead>'
+        f'<tbody>{body_rows}</tbody>'
+        '</table></div>'
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _expander_html() -> str:
+    """Full 3-language dictionary reference: every emotion, every word, one fragment."""
+    parts = []
+    for emo in EMOTIONS:
+        parts.append(
+            f'<p style="font-family:\'Cinzel Decorative\',serif; '
+            f'font-size:.9rem; color:{EMOTION_COLORS[emo]}; margin:1rem 0 .3rem;">'
+            f'{EMOTION_EMOJIS[emo]} {emo.upper()}</p>'
+            '<div style="display:grid; grid-template-columns:repeat(3, 1fr); gap:1rem;">'
+        )
+        for lang_key in ("en", "bn", "hi"):
+            parts.append(
+                f'<div><p style="font-size:.75rem; color:#a78bfa; '
+                f'font-weight:700; margin-bottom:4px;">{_LANG_LABELS[lang_key]}</p>'
+                f'<p style="line-height:1.7;">{"<br>".join(LANG_DICT[emo][lang_key])}</p></div>'
+            )
+        parts.append("</div>")
+    return "".join(parts)
+
+
+def _results_html(scores: dict, route: dict) -> str:
+    """Aura card, breakdown bars, tagline, dictionary panel and lexicon table as one fragment."""
+    ranked       = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    dominant     = ranked[0][0]
+    dominant_pct = int(round(scores[dominant] * 100))
+
+    color = EMOTION_COLORS[dominant]
+    emoji = EMOTION_EMOJIS[dominant]
+    fairy = FAIRY_EMOJIS[dominant]
+    moon  = MOON_PHASES[dominant]
+    tag   = TAGLINES[dominant]
+
+    # ── Aura card ─────────────────────────────────────────────────────────────
+    glow = (
+        f"0 0 60px {color}55, "
+        f"0 0 120px {color}22, "
+        f"inset 0 0 40px {color}11"
+    )
+    html = [
+        f'<div class="aura-card" style="box-shadow:{glow}; border-color:{color}44;">'
+        f'<span class="fairy-float">{fairy}</span>'
+        f'<span class="moon-spin">{moon}</span>'
+        f'<p class="section-label">Your Dominant Vibe</p>'
+        f'<span class="emotion-emoji-big">{emoji}</span>'
+        f'<p class="emotion-name" style="color:{color};">{dominant.upper()}</p>'
+        f'<p style="color:#c4b5fd; font-size:.95rem; margin-top:.2rem;'
+        f'font-family:\'Raleway\',sans-serif;">{fairy} &nbsp; {moon} &nbsp; {emoji}</p>'
+        f'<span class="conf-badge">✦ Confidence: {dominant_pct}% ✦</span>'
+        f'<p style="color:#8b7fb0; font-size:.72rem; margin-top:.6rem;'
+        f'font-family:\'Raleway\',sans-serif; letter-spacing:.08em;">'
+        f'🔤 {"translated" if route["translate"] else "read locally"}'
+        f' · {route["script"]} · {route["reason"]}</p>'
+        f'</div>',
+        _section_label("✦ Emotion Breakdown ✦"),
+    ]
+
+    # ── Emotion breakdown bars (descending) ───────────────────────────────────
+    for emotion, score in ranked:
+        pct = int(round(score * 100))
+        ec  = EMOTION_COLORS[emotion]
+        if pct == 100:
+            fill     = f"linear-gradient(90deg, {ec}, #fff8)"
+            glow_bar = f"0 0 10px {ec}"
+        else:
+            fill     = f"linear-gradient(90deg, {ec}cc, {ec}44)"
+            glow_bar = f"0 0 6px {ec}88"
+        html.append(
+            f'<div class="bar-row">'
+            f'<span class="bar-label">{EMOTION_EMOJIS[emotion]} {emotion}</span>'
+            f'<div class="bar-track"><div class="bar-fill" style="--bar-w:{pct}%; width:{pct}%;'
+            f'background:{fill}; box-shadow:{glow_bar};"></div></div>'
+            f'<span class="bar-pct">{pct}%</span>'
+            f'</div>'
+        )
+
+    # ── Mystical tagline + static dictionary fragments ────────────────────────
+    html.append(
+        f'<p style="text-align:center; margin-top:1.2rem; font-style:italic; color:#a78bfa;'
+        f'font-size:.95rem; letter-spacing:.06em; font-family:\'Raleway\',sans-serif;">{tag}</p>'
+    )
+    html.append(_dictionary_panel_html(dominant))
+    html.append(_lexicon_table_html())
+    return "".join(html)
+
+
+st.markdown(_css_html(), unsafe_allow_html=True)
+
+# =============================================================================
+# LAYOUT
+# =============================================================================
 
 # ── Header ────────────────────────────────────────────────────────────────────
-st.markdown('<p class="oracle-title">🌌 Vibe Oracle</p>', unsafe_allow_html=True)
-st.markdown('<p class="oracle-subtitle">Speak your vibe 🌙</p>', unsafe_allow_html=True)
+st.markdown(
+    '<div class="main-wrapper"></div>'
+    '<p class="oracle-title">🌌 Vibe Oracle</p>'
+    '<p class="oracle-subtitle">Speak your vibe 🌙</p>',
+    unsafe_allow_html=True,
+)
 
 # ── Warm the model once (cached after first run) ──────────────────────────────
 with st.spinner("🔭 Aligning the cosmic model…"):
     _pipe, _le = get_model()
 
+
+@st.cache_resource(show_spinner=False)
+def _log_startup_report() -> bool:
+    """Print the cold-start report to the server log once per process."""
+    print("🌌 Vibe Oracle startup report\n" + startup_report().to_string(index=False), flush=True)
+    return True
+
+
+_log_startup_report()
+
 # ── Text input ────────────────────────────────────────────────────────────────
 user_input = st.text_area(
     label="",
@@ -896,213 +557,11 @@ if reveal:
     else:
         with st.spinner("✨ Reading the cosmic vibrations…"):
             scores = detect_emotion(user_input)
+        route = translation_decision(user_input)
 
-        # Use pandas Series for ordering / max lookup
-        score_series = pd.Series(scores, dtype=float).sort_values(ascending=False)
-        dominant     = str(score_series.idxmax())
-        dominant_pct = int(round(score_series[dominant] * 100))
-
-        color = EMOTION_COLORS[dominant]
-        emoji = EMOTION_EMOJIS[dominant]
-        fairy = FAIRY_EMOJIS[dominant]
-        moon  = MOON_PHASES[dominant]
-        tag   = TAGLINES[dominant]
-
-        # ── Aura card ─────────────────────────────────────────────────────────
-        glow = (
-            f"0 0 60px {color}55, "
-            f"0 0 120px {color}22, "
-            f"inset 0 0 40px {color}11"
-        )
-        st.markdown(f"""
-        <div class="aura-card" style="box-shadow:{glow}; border-color:{color}44;">
-            <span class="fairy-float">{fairy}</span>
-            <span class="moon-spin">{moon}</span>
-            <p class="section-label">Your Dominant Vibe</p>
-            <span class="emotion-emoji-big">{emoji}</span>
-            <p class="emotion-name" style="color:{color};">{dominant.upper()}</p>
-            <p style="color:#c4b5fd; font-size:.95rem; margin-top:.2rem;
-                      font-family:'Raleway',sans-serif;">
-                {fairy} &nbsp; {moon} &nbsp; {emoji}
-            </p>
-            <span class="conf-badge">✦ Confidence: {dominant_pct}% ✦</span>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # ── Emotion breakdown bars ────────────────────────────────────────────
-        st.markdown('<hr class="mystic-divider">', unsafe_allow_html=True)
-        st.markdown(
-            '<p class="section-label" style="text-align:center;">'
-            '✦ Emotion Breakdown ✦</p>',
-            unsafe_allow_html=True,
-        )
-
-        # Iterate emotions in descending order (pandas sort already done)
-        for emotion in score_series.index.tolist():
-            pct = int(round(score_series[emotion] * 100))
-            ec  = EMOTION_COLORS[emotion]
-            ee  = EMOTION_EMOJIS[emotion]
-
-            if pct == 100:
-                fill     = f"linear-gradient(90deg, {ec}, #fff8)"
-                glow_bar = f"0 0 10px {ec}"
-            else:
-                fill     = f"linear-gradient(90deg, {ec}cc, {ec}44)"
-                glow_bar = f"0 0 6px {ec}88"
-
-            st.markdown(f"""
-            <div class="bar-row">
-                <span class="bar-label">{ee} {emotion}</span>
-                <div class="bar-track">
-                    <div class="bar-fill"
-                         style="--bar-w:{pct}%;
-                                width:{pct}%;
-                                background:{fill};
-                                box-shadow:{glow_bar};">
-                    </div>
-                </div>
-                <span class="bar-pct">{pct}%</span>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # ── Mystical tagline ──────────────────────────────────────────────────
-        st.markdown(f"""
-        <p style="text-align:center; margin-top:1.2rem;
-                  font-style:italic; color:#a78bfa;
-                  font-size:.95rem; letter-spacing:.06em;
-                  font-family:'Raleway',sans-serif;">
-            {tag}
-        </p>
-        """, unsafe_allow_html=True)
-
-        # ── Three-language dictionary panel ───────────────────────────────────
-        st.markdown('<hr class="mystic-divider">', unsafe_allow_html=True)
-        st.markdown(
-            '<p class="section-label" style="text-align:center;">'
-            '✦ Emotion Dictionary ✦ English · বাংলা · हिंदी</p>',
-            unsafe_allow_html=True,
-        )
-
-        d_color = EMOTION_COLORS[dominant]
-        d_entry = LANG_DICT[dominant]
-
-        # Build a 3-column word-chip layout
-        def _chips(words: list, chip_color: str) -> str:
-            chips = "".join(
-                f'<span style="display:inline-block; margin:3px 4px; padding:4px 10px;'
-                f'border-radius:999px; font-size:.78rem; font-weight:600;'
-                f'background:{chip_color}22; border:1px solid {chip_color}55;'
-                f'color:#f0e6ff; font-family:\'Raleway\',sans-serif;">'
-                f'{w}</span>'
-                for w in words
-            )
-            return chips
-
-        lang_labels = {"en": "🇬🇧 English", "bn": "🇧🇩 বাংলা", "hi": "🇮🇳 हिंदी"}
-
-        col_en, col_bn, col_hi = st.columns(3)
-        for col, lang_key in zip([col_en, col_bn, col_hi], ["en", "bn", "hi"]):
-            with col:
-                words  = d_entry[lang_key]
-                chips  = _chips(words, d_color)
-                st.markdown(f"""
-                <div style="background:rgba(255,255,255,.03);
-                            border:1px solid {d_color}33;
-                            border-radius:14px; padding:12px 10px;
-                            min-height:200px;">
-                    <p style="font-family:'Cinzel Decorative',serif;
-                               font-size:.72rem; letter-spacing:.15em;
-                               color:{d_color}; text-align:center;
-                               margin-bottom:8px; text-transform:uppercase;">
-                        {lang_labels[lang_key]}
-                    </p>
-                    <div style="text-align:center; line-height:2;">
-                        {chips}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        # Also show a compact table of all emotions × all 3 languages
-        st.markdown('<hr class="mystic-divider">', unsafe_allow_html=True)
-        st.markdown(
-            '<p class="section-label" style="text-align:center;">'
-            '✦ Full Emotion Lexicon ✦</p>',
-            unsafe_allow_html=True,
-        )
-
-        # Build pandas DataFrame for the full table
-        table_rows = []
-        for emo in EMOTIONS:
-            ec  = EMOTION_COLORS[emo]
-            ee  = EMOTION_EMOJIS[emo]
-            row = {
-                "Emotion":  f"{ee} {emo.capitalize()}",
-                "English":  " · ".join(LANG_DICT[emo]["en"][:5]),
-                "বাংলা":    " · ".join(LANG_DICT[emo]["bn"][:5]),
-                "हिंदी":    " · ".join(LANG_DICT[emo]["hi"][:5]),
-            }
-            table_rows.append(row)
-
-        df_table = pd.DataFrame(table_rows)
-
-        # Render as a styled HTML table (no st.dataframe to preserve dark theme)
-        header_cells = "".join(
-            f'<th style="padding:8px 12px; text-align:left; '
-            f'color:#c4b5fd; font-family:\'Cinzel Decorative\',serif; '
-            f'font-size:.72rem; letter-spacing:.12em; border-bottom:1px solid rgba(168,85,247,.3);">'
-            f'{col}</th>'
-            for col in df_table.columns
-        )
-
-        body_rows_html = ""
-        for i, row in df_table.iterrows():
-            emo_key = EMOTIONS[i]
-            rc      = EMOTION_COLORS[emo_key]
-            cells   = "".join(
-                f'<td style="padding:7px 12px; font-size:.8rem; '
-                f'color:#e2d9f3; font-family:\'Raleway\',sans-serif; '
-                f'border-bottom:1px solid rgba(255,255,255,.05);">{v}</td>'
-                for v in row.values
-            )
-            body_rows_html += (
-                f'<tr style="background:{rc}0d;">{cells}</tr>'
-            )
-
-        st.markdown(f"""
-        <div style="overflow-x:auto; border-radius:12px;
-                    border:1px solid rgba(168,85,247,.25);
-                    background:rgba(255,255,255,.03);">
-            <table style="width:100%; border-collapse:collapse;">
-                <thead><tr>{header_cells}</tr></thead>
-                <tbody>{body_rows_html}</tbody>
-            </table>
-        </div>
-        """, unsafe_allow_html=True)
+        # One markdown element for the whole results panel
+        st.markdown(_results_html(scores, route), unsafe_allow_html=True)
 
 # ── Always-visible expander: full dictionary reference ────────────────────────
 with st.expander("📖 Browse the Full 3-Language Emotion Dictionary"):
-    for emo in EMOTIONS:
-        ec = EMOTION_COLORS[emo]
-        ee = EMOTION_EMOJIS[emo]
-        st.markdown(
-            f'<p style="font-family:\'Cinzel Decorative\',serif; '
-            f'font-size:.9rem; color:{ec}; margin:1rem 0 .3rem;">'
-            f'{ee} {emo.upper()}</p>',
-            unsafe_allow_html=True,
-        )
-        c1, c2, c3 = st.columns(3)
-        for col, lang_key, flag in [
-            (c1, "en", "🇬🇧 English"),
-            (c2, "bn", "🇧🇩 বাংলা"),
-            (c3, "hi", "🇮🇳 हिंदी"),
-        ]:
-            with col:
-                words_md = "\n".join(f"- {w}" for w in LANG_DICT[emo][lang_key])
-                st.markdown(
-                    f'<p style="font-size:.75rem; color:#a78bfa; '
-                    f'font-weight:700; margin-bottom:4px;">{flag}</p>',
-                    unsafe_allow_html=True,
-                )
-                st.markdown(words_md)
-
-st.markdown('</div>', unsafe_allow_html=True)   # close .main-wrapper
+    st.markdown(_expander_html(), unsafe_allow_html=True)
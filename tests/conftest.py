@@ -0,0 +1,26 @@
+"""
+Shared test setup: import the package from the checkout and keep every test
+offline and self-contained — remote translation off unless a test installs a
+stub translator, no nltk downloads, and the model store plus the translation
+and result caches in a per-session temp dir rather than the shared system one.
+Runs before any test module imports vibe_oracle.engine, which reads these
+variables at import.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_SESSION_DIR = tempfile.mkdtemp(prefix="vibe_oracle_tests_")
+atexit.register(shutil.rmtree, _SESSION_DIR, ignore_errors=True)
+
+os.environ.setdefault("VIBE_ORACLE_TRANSLATE", "0")
+os.environ["VIBE_ORACLE_OFFLINE"]              = "1"
+os.environ["VIBE_ORACLE_MODEL_DIR"]            = os.path.join(_SESSION_DIR, "models")
+os.environ["VIBE_ORACLE_TRANSLATION_CACHE_DB"] = os.path.join(_SESSION_DIR, "translations.sqlite3")
+os.environ["VIBE_ORACLE_RESULT_CACHE_DB"]      = os.path.join(_SESSION_DIR, "results.sqlite3")
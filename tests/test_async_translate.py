@@ -0,0 +1,61 @@
+"""translate_many ordering, failure handling and use from inside a running event loop."""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import asyncio
+import time
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+from vibe_oracle.async_translate import translate_many
+from vibe_oracle.translation_cache import TranslationCache
+
+
+def _upper(text: str) -> str:
+    if text == "boom":
+        raise RuntimeError("translator down")
+    return text.upper()
+
+
+def test_order_duplicates_and_failures():
+    assert translate_many(["a", "boom", "b", "a"], _upper) == ["A", None, "B", "A"]
+
+
+def test_timeout_yields_none():
+    def slow(text):
+        time.sleep(0.5)
+        return text
+    assert translate_many(["x"], slow, timeout=0.05) == [None]
+
+
+def test_inside_running_event_loop():
+    async def main():
+        return translate_many(["a", "b"], _upper)
+    assert asyncio.run(main()) == ["A", "B"]
+
+
+def test_batch_scoring_inside_running_event_loop(monkeypatch):
+    class Stub:
+        def translate(self, text):
+            return text
+
+    monkeypatch.setattr(engine, "TRANSLATE", True)
+    monkeypatch.setattr(engine, "_translator", lambda: Stub())
+    cache = TranslationCache(engine._google_translate)
+    monkeypatch.setattr(engine, "translation_cache", lambda: cache)
+    texts = ["ami khub khushi aaj", "mujhe dar lag raha hai"]
+
+    async def main():
+        return engine.detect_emotion_batch(texts)
+    assert asyncio.run(main()).shape == (2, len(engine.EMOTIONS))
+
+
+def test_translation_off_never_builds_the_cache(monkeypatch, tmp_path):
+    db = tmp_path / "translations.sqlite3"
+    monkeypatch.setattr(engine, "TRANSLATE", False)
+    monkeypatch.setattr(engine, "TRANSLATION_CACHE_PATH", str(db))
+    engine.translation_cache.cache_clear()
+    texts = ["ami khub khushi aaj", "mujhe dar lag raha hai"]
+    assert engine.translate_batch_to_english(texts) == texts
+    assert engine.translate_to_english(texts[0]) == texts[0]
+    assert engine.translation_cache.cache_info().currsize == 0
+    assert not db.exists()
@@ -0,0 +1,33 @@
+"""LinearTextScorer reproduces Pipeline.predict_proba without copying the model arrays."""
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+from vibe_oracle.fast_inference import LinearTextScorer
+
+
+@pytest.fixture(scope="module")
+def model():
+    return engine.get_model()
+
+
+@pytest.fixture(scope="module")
+def processed():
+    texts = list(engine._build_training_corpus()["text"][:300]) + ["", "zzzz qqqq", "happy happy happy"]
+    return [engine.preprocess(t) for t in texts]
+
+
+def test_matches_predict_proba(model, processed):
+    pipe, _ = model
+    scorer  = LinearTextScorer.from_pipeline(pipe)
+    fast    = np.array([scorer.predict_proba(t) for t in processed])
+    np.testing.assert_array_equal(fast, pipe.predict_proba(processed))
+
+
+def test_shares_coefficients_with_the_loaded_model(model):
+    pipe, _ = model
+    scorer  = LinearTextScorer.from_pipeline(pipe)
+    assert np.shares_memory(scorer._coef, pipe.steps[-1][1].coef_)
@@ -0,0 +1,68 @@
+"""score_file column checks and resuming after an interrupted run."""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import csv
+import json
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle.file_scorer import count_output_rows, score_file
+
+MESSAGES = ["ami khub khushi", "I am so angry", "this is scary", "what a surprise", "so sad today"]
+
+
+def _write_csv(path, column="text"):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["id", column])
+        writer.writerows(enumerate(MESSAGES))
+
+
+def _rows(path):
+    with open(path, newline="", encoding="utf-8") as fh:
+        return list(csv.reader(fh))[1:]
+
+
+def test_missing_text_column_raises_and_keeps_output(tmp_path):
+    src, out = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write_csv(src, column="message")
+    out.write_text("keep me\n")
+    with pytest.raises(ValueError, match="'text'"):
+        score_file(str(src), str(out), progress=None)
+    assert out.read_text() == "keep me\n"
+
+
+def test_missing_id_column_raises(tmp_path):
+    src = tmp_path / "in.csv"
+    _write_csv(src)
+    with pytest.raises(ValueError, match="'msg_id'"):
+        score_file(str(src), str(tmp_path / "out.csv"), id_column="msg_id", progress=None)
+
+
+def test_resume_drops_half_written_row(tmp_path):
+    src, out = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write_csv(src)
+    score_file(str(src), str(out), progress=None)
+    full = _rows(out)
+
+    lines = out.read_bytes().splitlines(keepends=True)
+    out.write_bytes(b"".join(lines[:3]) + lines[3][:10])   # header + 2 rows + a torn third row
+    assert count_output_rows(str(out)) == 2
+
+    stats = score_file(str(src), str(out), resume=True, progress=None)
+    assert stats["start_offset"] == 2
+    assert _rows(out) == full
+
+
+def test_resume_jsonl_drops_half_written_row(tmp_path):
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    src.write_text("".join(json.dumps({"text": m}) + "\n" for m in MESSAGES))
+    score_file(str(src), str(out), progress=None)
+    full = out.read_text()
+
+    lines = full.splitlines(keepends=True)
+    out.write_text("".join(lines[:1]) + lines[1][:15])
+    assert score_file(str(src), str(out), resume=True, progress=None)["start_offset"] == 1
+    assert out.read_text() == full
@@ -0,0 +1,51 @@
+"""Overlay parsing: malformed files are rejected, keywords are normalised to lowercase."""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import json
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+
+
+@pytest.fixture
+def overlay_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, "LEXICON_OVERLAY_PATH", None)
+
+    def write(payload):
+        path = tmp_path / "overlay.json"
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return str(path)
+    yield write
+    engine.reload_lexicon(None)                        # back to the shipped lexicons
+
+
+@pytest.mark.parametrize("payload", [
+    {"keywords": {"joy": "stoked"}},                 # a string, not a list of keywords
+    {"keywords": {"joy": ["stoked", 3]}},
+    {"keywords": {"joy": ["stoked", "  "]}},
+    {"phrases": {"fear": [""]}},
+    {"phrases": ["on cloud nine"]},
+    ["stoked"],
+])
+def test_malformed_overlay_raises_and_keeps_lexicon(overlay_file, payload):
+    before = engine.detect_emotion_batch(["the weather report"])[0].tolist()
+    with pytest.raises(ValueError):
+        engine.reload_lexicon(overlay_file(payload))
+    assert engine.lexicon_version() == "base"
+    assert engine.detect_emotion_batch(["the weather report"])[0].tolist() == before
+
+
+def test_keywords_are_lowercased(overlay_file):
+    overlay = engine._read_overlay(overlay_file({"keywords": {"joy": ["Stoked", "stoked", "CHUFFED"]}}))
+    assert overlay["keywords"] == {"joy": ["stoked", "chuffed"]}
+
+
+def test_mixed_case_keyword_matches_after_reload(overlay_file):
+    before = engine._rule_vector("so stoked today", "so stoked today")
+    engine.reload_lexicon(overlay_file({"keywords": {"joy": ["Stoked"]}}))
+    after  = engine._rule_vector("so stoked today", "so stoked today")
+    joy    = engine.EMOTIONS.index("joy")
+    assert after[joy] == before[joy] + 1.0
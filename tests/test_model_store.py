@@ -0,0 +1,34 @@
+"""ModelStore round trip, build-once locking path and the mmap re-open fallback."""
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle.model_store import ModelStore, fingerprint
+
+
+def test_fingerprint_is_order_insensitive_for_dicts():
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+    assert fingerprint("x", 1) != fingerprint("x", 2)
+
+
+def test_build_once_then_load_mapped(tmp_path):
+    store  = ModelStore(str(tmp_path))
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"coef": np.arange(6.0).reshape(2, 3)}
+
+    first  = store.get_or_build("k" * 64, build, mmap_mode="r")
+    second = store.get_or_build("k" * 64, build, mmap_mode="r")
+    assert builds == [1]
+    assert isinstance(second["coef"], np.memmap)
+    np.testing.assert_array_equal(first["coef"], second["coef"])
+
+
+def test_falls_back_to_built_object_when_reopen_fails(tmp_path, monkeypatch):
+    store = ModelStore(str(tmp_path))
+    built = ("pipe", "label-encoder")
+    monkeypatch.setattr(store, "load", lambda key, mmap_mode=None: None)
+    assert store.get_or_build("k" * 64, lambda: built, mmap_mode="r") is built
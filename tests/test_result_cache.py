@@ -0,0 +1,35 @@
+"""ResultCache keys and agreement between the cached, uncached and batch scorers."""
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+from vibe_oracle.lexicon import EMOTIONS
+from vibe_oracle.result_cache import ResultCache, canonical_text
+
+WHITESPACE_VARIANTS = ["dil  khush", "dil khush", "no  way", "no\nway", " I am\tso happy ", "ＨＡＰＰＹ day"]
+
+
+def test_canonical_text_collapses_whitespace_and_nfkc():
+    assert canonical_text("  no \n\t way ") == "no way"
+    assert canonical_text("ＨＡＰＰＹ") == "HAPPY"
+
+
+def test_variants_share_one_entry_and_case_does_not():
+    calls = []
+    cache = ResultCache(lambda t: calls.append(t) or {"n": len(calls)}, version="v1", memory_size=8)
+    assert cache.get_or_compute("no  way") == cache.get_or_compute("no\nway") == {"n": 1}
+    assert cache.get_or_compute("NO WAY") == {"n": 2}
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.parametrize("text", WHITESPACE_VARIANTS)
+def test_detect_emotion_matches_batch_and_uncached(text):
+    engine.result_cache().clear()
+    for variant in WHITESPACE_VARIANTS:                   # warm the cache with every variant first
+        engine.detect_emotion(variant)
+    cached   = [engine.detect_emotion(text)[e] for e in EMOTIONS]
+    batch    = engine.detect_emotion_batch([text])[0].tolist()
+    uncached = [engine._detect_emotion_uncached(text)[e] for e in EMOTIONS]
+    assert cached == batch == uncached
@@ -0,0 +1,65 @@
+"""HTTP service routes and request validation, against a server on an ephemeral port."""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import json
+import threading
+import urllib.error
+import urllib.request
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+from vibe_oracle.server import make_server
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    httpd  = make_server("127.0.0.1", 0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _post(base_url: str, path: str, payload) -> tuple:
+    request = urllib.request.Request(base_url + path, data=json.dumps(payload).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as err:
+        return err.code, json.load(err)
+
+
+def test_detect(base_url):
+    status, body = _post(base_url, "/detect", {"text": "I am so happy today"})
+    assert status == 200 and body["dominant"] == "joy"
+
+
+def test_document_budget(base_url):
+    status, body = _post(base_url, "/detect/document", {"text": "Great day. Awful night.", "char_budget": 10})
+    assert status == 200 and body["truncated"]
+
+
+@pytest.mark.parametrize("cap", [0, -1])
+def test_document_without_budget_when_unlimited(base_url, monkeypatch, cap):
+    monkeypatch.setattr(engine, "CHAR_BUDGET", cap)             # <= 0 → no limit
+    status, body = _post(base_url, "/detect/document", {"text": "Great day. Awful night."})
+    assert status == 200 and not body["truncated"]
+
+
+def test_document_budget_is_capped(base_url, monkeypatch):
+    monkeypatch.setattr(engine, "CHAR_BUDGET", 10)
+    status, body = _post(base_url, "/detect/document", {"text": "Great day. Awful night."})
+    assert status == 200 and body["chars_scored"] <= 10
+    status, body = _post(base_url, "/detect/document", {"text": "Great day. Awful night.", "char_budget": 500})
+    assert status == 200 and body["chars_scored"] <= 10
+
+
+@pytest.mark.parametrize("budget", [True, False, 0, -5, 1.5, "100"])
+def test_document_rejects_invalid_budget(base_url, budget):
+    status, body = _post(base_url, "/detect/document", {"text": "hello there", "char_budget": budget})
+    assert status == 400 and "char_budget" in body["error"]
@@ -0,0 +1,67 @@
+"""VibeWindow aggregation, eviction and the push / extend scoring paths."""
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle.lexicon import EMOTIONS
+from vibe_oracle.streaming import VibeWindow
+
+
+def _one_hot(text: str) -> dict:
+    """Stand-in scorer: all mass on the emotion named in the text."""
+    return {e: float(e in text) for e in EMOTIONS}
+
+
+def test_count_window_mean_and_eviction():
+    room = VibeWindow(max_messages=2, score_fn=_one_hot)
+    for text in ("joy", "anger", "anger"):
+        room.push(text)
+    snap = room.snapshot()
+    assert snap["messages"] == 2 and snap["pushed"] == 3
+    assert snap["dominant"] == "anger" and snap["scores"]["joy"] == 0.0
+
+
+def test_time_window_ages_out_quiet_room():
+    room = VibeWindow(window_seconds=10, score_fn=_one_hot)
+    room.push("joy", timestamp=0)
+    room.push("fear", timestamp=5)
+    assert room.snapshot(now=12)["dominant"] == "fear"
+    assert room.snapshot(now=20)["messages"] == 0
+
+
+def test_extend_uses_custom_score_fn():
+    pushed, extended = (VibeWindow(max_messages=10, score_fn=_one_hot) for _ in range(2))
+    texts = ["joy", "sadness", "joy"]
+    for t in texts:
+        pushed.push(t, timestamp=1)
+    rows = extended.extend(texts, timestamps=[1, 1, 1])
+    assert rows.shape == (3, len(EMOTIONS))
+    assert pushed.snapshot() == extended.snapshot()
+
+
+def test_extend_default_matches_push():
+    texts = ["ami khub khushi", "I am  so angry", "this is scary"]
+    pushed, extended = VibeWindow(max_messages=10), VibeWindow(max_messages=10)
+    for t in texts:
+        pushed.push(t, timestamp=1)
+    extended.extend(texts, timestamps=[1, 1, 1])
+    assert pushed.snapshot() == extended.snapshot()
+
+
+def test_extend_rejects_timestamp_length_mismatch():
+    room = VibeWindow(max_messages=10, score_fn=_one_hot)
+    with pytest.raises(ValueError):
+        room.extend(["joy", "fear", "anger", "disgust"], timestamps=[1, 2])
+    assert len(room) == 0
+
+
+def test_running_sum_stays_exact():
+    room = VibeWindow(max_messages=3, score_fn=_one_hot)
+    rng  = np.random.default_rng(0)
+    rows = rng.dirichlet(np.ones(len(EMOTIONS)), size=50)
+    for row in rows:
+        room.push_scores(row)
+    expected = np.round(rows[-3:].mean(axis=0), 4)
+    assert list(room.snapshot()["scores"].values()) == expected.tolist()
@@ -0,0 +1,122 @@
+"""TranslationCache driven by a local stand-in translator — no network."""
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import pytest
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import translation_cache as tc_module
+from vibe_oracle.translation_cache import TranslationCache
+
+
+class StubTranslator:
+    """Upper-cases its input and records every call; raises for texts in `fail`."""
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail  = set(fail)
+
+    def __call__(self, text: str) -> str:
+        self.calls.append(text)
+        if text in self.fail:
+            raise ConnectionError("translator unavailable")
+        return text.upper()
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(tc_module.time, "time", fake)
+    return fake
+
+
+def test_hit_after_miss():
+    stub  = StubTranslator()
+    cache = TranslationCache(stub)
+    assert cache.translate("ami") == "AMI"
+    assert cache.translate("ami") == "AMI"
+    assert stub.calls == ["ami"]
+
+
+def test_lru_eviction_at_memory_size():
+    stub  = StubTranslator()
+    cache = TranslationCache(stub, memory_size=2)
+    cache.translate("a")
+    cache.translate("b")
+    cache.translate("a")                       # "a" is now most recently used
+    cache.translate("c")                       # evicts "b"
+    assert cache.stats()["memory_items"] == 2
+    cache.translate("a")
+    cache.translate("b")
+    assert stub.calls == ["a", "b", "c", "b"]
+
+
+def test_ttl_expiry_memory_tier(clock):
+    stub  = StubTranslator()
+    cache = TranslationCache(stub, ttl_seconds=60)
+    cache.translate("a")
+    clock.now += 59
+    cache.translate("a")
+    clock.now += 2
+    cache.translate("a")
+    assert stub.calls == ["a", "a"]
+
+
+def test_ttl_expiry_disk_tier(tmp_path, clock):
+    db    = str(tmp_path / "tr.sqlite3")
+    stub  = StubTranslator()
+    cache = TranslationCache(stub, db_path=db, memory_size=0, ttl_seconds=60)
+    cache.translate("a")
+    clock.now += 30
+    assert cache.translate("a") == "A"
+    assert cache.stats()["disk_hits"] == 1
+    clock.now += 31
+    cache.translate("a")
+    assert stub.calls == ["a", "a"]
+
+
+def test_persistence_across_instances(tmp_path):
+    db     = str(tmp_path / "tr.sqlite3")
+    first  = StubTranslator()
+    TranslationCache(first, db_path=db).translate("ami khushi")
+    second = StubTranslator()
+    cache  = TranslationCache(second, db_path=db)
+    assert cache.translate("ami khushi") == "AMI KHUSHI"
+    assert second.calls == []
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_failures_are_not_cached(tmp_path):
+    stub  = StubTranslator(fail={"boom"})
+    cache = TranslationCache(stub, db_path=str(tmp_path / "tr.sqlite3"))
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            cache.translate("boom")
+    assert stub.calls == ["boom", "boom"]
+    assert cache.stats()["memory_items"] == cache.stats()["disk_items"] == 0
+
+
+def test_stats_counters(tmp_path):
+    db = str(tmp_path / "tr.sqlite3")
+    TranslationCache(StubTranslator(), db_path=db).translate("a")
+    cache = TranslationCache(StubTranslator(), db_path=db)
+    cache.translate("a")                       # disk hit, promoted to memory
+    cache.translate("a")                       # memory hit
+    cache.translate("b")                       # miss
+    assert cache.stats() == {
+        "memory_hits":  1,
+        "disk_hits":    1,
+        "misses":       1,
+        "hit_ratio":    2 / 3,
+        "memory_items": 2,
+        "disk_items":   2,
+    }
+    cache.clear()
+    assert cache.stats()["misses"] == cache.stats()["disk_items"] == 0
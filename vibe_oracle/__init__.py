@@ -0,0 +1,23 @@
+"""
+🌌 Vibe Oracle — headless emotion detection library behind the Streamlit app.
+
+    from vibe_oracle import detect_emotion, detect_emotion_batch
+
+Modules: `engine` (detection pipeline), `lexicon` (emotion dictionaries),
+`server` (HTTP inference service), `file_scorer` (streaming CSV/JSONL scoring),
+`parallel` (process-pool scoring), `async_translate` (concurrent translation),
+`model_store`, `translation_cache`, `result_cache`, `lexicon_matcher`,
+`fast_inference` (array-level single-row predict_proba), `compact_model`
+(pruned / quantised .npz export), `spans` (per-stage latency histograms),
+`streaming` (sliding-window room vibe). The engine is imported lazily, so
+importing a helper module does not load NLTK or the model.
+"""
+
+_ENGINE_EXPORTS = ("detect_emotion", "detect_emotion_batch", "get_model", "EMOTIONS")
+
+
+def __getattr__(name):
+    if name in _ENGINE_EXPORTS:
+        from vibe_oracle import engine
+        return getattr(engine, name)
+    raise AttributeError(f"module 'vibe_oracle' has no attribute {name!r}")
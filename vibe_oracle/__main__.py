@@ -0,0 +1,105 @@
+"""
+Command-line entry point:  python -m vibe_oracle <command>
+
+    bake-model      train (if needed) and store the model artifact — run at image build
+    export-compact  write the pruned / quantised .npz form of the current model
+    serve           start the HTTP inference service
+    score           stream-score a CSV / JSONL file (resumable)
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import argparse
+import sys
+import time
+
+
+def _bake_model(args) -> int:
+    from vibe_oracle import engine
+
+    t0   = time.perf_counter()
+    key  = engine.model_key()
+    path = engine._model_store().path_for(key)
+    engine.get_model()
+    print(f"{engine.MODEL_VARIANT} model {key[:16]} ready at {path} ({time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+def _export_compact(args) -> int:
+    from vibe_oracle import engine
+    from vibe_oracle.compact_model import export_compact
+
+    pipe, le = engine.get_model()
+    info     = export_compact(pipe, le, args.output, dtype=args.dtype, prune=args.prune)
+    print(f"{engine.MODEL_VARIANT} model {engine.model_key()[:16]} → {args.output}: "
+          f"{info['kept']:,}/{info['features']:,} features ({info['norm_only']:,} norm-only), "
+          f"{args.dtype}, {info['bytes'] / 1024:.1f} kB")
+    return 0
+
+
+def _serve(args) -> int:
+    from vibe_oracle.server import serve
+
+    serve(args.host, args.port)
+    return 0
+
+
+def _score(args) -> int:
+    from vibe_oracle.file_scorer import score_file
+
+    try:
+        stats = score_file(
+            args.input, args.output,
+            text_column=args.text_column,
+            id_column=args.id_column,
+            chunk_size=args.chunk_size,
+            start_offset=args.start_offset,
+            resume=args.resume,
+            input_format=args.input_format,
+            workers=args.workers,
+        )
+    except ValueError as exc:                  # missing column, unrecoverable partial output
+        print(f"score: {exc}", file=sys.stderr)
+        return 2
+    print(f"scored {stats['rows']:,} rows from offset {stats['start_offset']:,} "
+          f"in {stats['seconds']}s ({stats['rows_per_sec']:,} rows/s)", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m vibe_oracle")
+    sub    = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("bake-model", help="train/store the model artifact (image build step)")
+    p.set_defaults(func=_bake_model)
+
+    p = sub.add_parser("export-compact", help="write a pruned / quantised .npz of the model")
+    p.add_argument("output")
+    p.add_argument("--dtype", choices=["int8", "float32"], default="int8")
+    p.add_argument("--prune", type=float, default=0.01,
+                   help="drop features below this fraction of the largest weight (0 keeps all)")
+    p.set_defaults(func=_export_compact)
+
+    p = sub.add_parser("serve", help="run the HTTP inference service")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.set_defaults(func=_serve)
+
+    p = sub.add_parser("score", help="stream-score a CSV/JSONL file (.gz ok, '-' = stdin)")
+    p.add_argument("input")
+    p.add_argument("output", help="output .csv or .jsonl (format from extension)")
+    p.add_argument("--text-column", default="text")
+    p.add_argument("--id-column", default=None, help="input field copied to the output")
+    p.add_argument("--chunk-size", type=int, default=2048)
+    p.add_argument("--input-format", choices=["csv", "jsonl"], default=None)
+    p.add_argument("--workers", type=int, default=1, help="scoring processes (default 1)")
+    g = p.add_mutually_exclusive_group()
+    g.add_argument("--start-offset", type=int, default=0, help="skip this many input records")
+    g.add_argument("--resume", action="store_true", help="continue after rows already in output")
+    p.set_defaults(func=_score)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
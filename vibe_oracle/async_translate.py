@@ -0,0 +1,126 @@
+"""
+Concurrent translation stage with bounded concurrency and connection reuse.
+
+`PooledGoogleTranslator` issues the same request deep_translator's
+GoogleTranslator does (same endpoint, params and result element) but over one
+`requests.Session` whose connection pool is sized for the concurrency limit,
+with a per-request timeout. `translate_many` fans a batch out under an asyncio
+semaphore; any request that fails or times out yields None so the caller can
+fall back to the original text (and avoid caching the failure).
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+GOOGLE_TRANSLATE_URL = "https://translate.google.com/m"
+MAX_CHARS            = 5000        # deep_translator's per-request limit
+
+
+class PooledGoogleTranslator:
+    """Thread-safe Google Translate client sharing one pooled HTTP session."""
+
+    def __init__(
+        self,
+        source: str = "auto",
+        target: str = "en",
+        base_url: str = GOOGLE_TRANSLATE_URL,
+        pool_size: int = 16,
+        timeout: float = 10.0,
+    ):
+        self.source   = source
+        self.target   = target
+        self.base_url = base_url
+        self.timeout  = timeout
+        self._local   = threading.local()
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+
+    @property
+    def session(self) -> requests.Session:
+        # Sessions are not guaranteed thread-safe; one per thread, all sharing the adapter's pool
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    def translate(self, text: str) -> str:
+        """Translate one text; raises on HTTP errors, timeouts or a missing result."""
+        text = text.strip()
+        if not text:
+            return text
+        if len(text) > MAX_CHARS:
+            raise ValueError(f"text longer than {MAX_CHARS} characters")
+        response = self.session.get(
+            self.base_url,
+            params={"tl": self.target, "sl": self.source, "q": text},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        soup    = BeautifulSoup(response.text, "html.parser")
+        element = soup.find("div", {"class": "t0"}) or soup.find("div", {"class": "result-container"})
+        if element is None:
+            raise LookupError("no translation in response")
+        return element.get_text(strip=True)
+
+
+async def translate_many_async(
+    texts,
+    translate_fn,
+    concurrency: int = 16,
+    timeout: float = 10.0,
+    executor=None,
+) -> list:
+    """
+    Run blocking `translate_fn` over `texts` with at most `concurrency` in flight.
+
+    Returns results in input order; an entry is None if its call raised or
+    exceeded `timeout` seconds. Identical texts are translated once.
+    """
+    loop      = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    unique    = list(dict.fromkeys(texts))
+    own_pool  = executor is None
+    if own_pool:
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="translate")
+
+    async def one(text):
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(executor, translate_fn, text), timeout
+                )
+            except Exception:
+                return None
+
+    try:
+        results = dict(zip(unique, await asyncio.gather(*(one(t) for t in unique))))
+    finally:
+        if own_pool:
+            executor.shutdown(wait=False, cancel_futures=True)
+    return [results[t] for t in texts]
+
+
+def translate_many(texts, translate_fn, concurrency: int = 16, timeout: float = 10.0) -> list:
+    """
+    Blocking wrapper around translate_many_async.
+
+    Safe to call from inside a running event loop (Jupyter, an async server):
+    the batch then gets its own loop on a helper thread, since asyncio.run()
+    cannot nest. The caller blocks until the batch is done either way.
+    """
+    coro = translate_many_async(list(texts), translate_fn, concurrency, timeout)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="translate-loop") as pool:
+        return pool.submit(asyncio.run, coro).result()
@@ -0,0 +1,269 @@
+"""
+Compact, quantised export of the TF-IDF / hashed TF-IDF + LogReg model.
+
+    export_compact(pipe, le, "model.npz", dtype="int8", prune=0.01)
+    model = CompactModel.load("model.npz")
+    model.predict_proba(["feel happy today"])     # (N, n_classes), le.classes_ order
+
+The joblib artifact pickles the whole sklearn Pipeline: a Python dict
+vocabulary, float64 coefficients for every feature and the estimator objects.
+The export keeps only what inference needs, in one uncompressed .npz:
+
+    keys       sorted feature keys — UTF-8 terms joined by "\\n" (vocabulary
+               variant) or int32 hashed column ids (hashing variant)
+    idf        float32 idf of the kept features
+    coef       (kept, classes) int8 with one float32 scale per class, or float32
+    intercept  float64 per class
+    norm_keys  pruned features, idf only (float16 norm_idf) — they still count
+               towards the L2 norm, just not towards the logits
+    meta       JSON: analyzer settings, tf/norm flags, class labels, and the
+               idf every hashed column without a stored entry gets
+
+A feature is pruned when its largest possible logit contribution
+(idf × max |coef|) is below `prune` × the largest one. Pruning and int8
+rounding are lossy; benchmarks/bench_compact_model.py reports the accuracy
+and agreement delta against get_model(). Loading and scoring need only NumPy
+(the hashing variant carries its own MurmurHash3), not scikit-learn.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import json
+import math
+import os
+import re
+import tempfile
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+
+FORMAT_VERSION = 1
+DTYPES         = ("int8", "float32")
+
+
+def _word_analyzer(token_pattern: str, ngram_range: tuple):
+    """Lowercase → token_pattern → word n-grams, as sklearn's default word analyzer."""
+    find_tokens = re.compile(token_pattern).findall
+    lo, hi      = ngram_range
+
+    def analyze(text: str) -> list:
+        tokens = find_tokens(text.lower())
+        grams  = list(tokens) if lo == 1 else []
+        for n in range(max(lo, 2), hi + 1):
+            grams += [" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+        return grams
+    return analyze
+
+
+def _feature_steps(pipe):
+    """(vectoriser, tf-idf step, kind) for the two supported pipeline shapes."""
+    from sklearn.feature_extraction.text import (
+        HashingVectorizer, TfidfTransformer, TfidfVectorizer,
+    )
+
+    steps = [step for _, step in pipe.steps]
+    if len(steps) == 2 and isinstance(steps[0], TfidfVectorizer):
+        vec, tfidf, kind = steps[0], steps[0], "vocab"
+    elif (len(steps) == 3 and isinstance(steps[0], HashingVectorizer)
+          and isinstance(steps[1], TfidfTransformer)):
+        vec, tfidf, kind = steps[0], steps[1], "hash"
+        if vec.alternate_sign or vec.norm is not None:
+            raise ValueError("hashing step must use alternate_sign=False, norm=None")
+    else:
+        raise ValueError(f"unsupported pipeline steps: {[type(s).__name__ for s in steps]}")
+
+    plain = (vec.analyzer == "word" and vec.lowercase and vec.preprocessor is None
+             and vec.tokenizer is None and vec.stop_words is None and vec.strip_accents is None)
+    if not plain:
+        raise ValueError("only the default word analyzer (lowercase, token_pattern) is supported")
+    if tfidf.norm not in ("l2", None) or not tfidf.use_idf:
+        raise ValueError("tf-idf step must use idf and norm 'l2' or None")
+    return vec, tfidf, kind
+
+
+def export_compact(pipe, le, path: str, dtype: str = "int8", prune: float = 0.0) -> dict:
+    """
+    Write `pipe` (+ label encoder `le`) as a compact .npz at `path` (atomic).
+
+    dtype – "int8" (per-class symmetric scale) or "float32" coefficients
+    prune – drop features contributing < prune × the largest feature's weight
+    Returns {features, kept, bytes}.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype must be one of {DTYPES}")
+    vec, tfidf, kind = _feature_steps(pipe)
+    clf       = pipe.steps[-1][1]
+    coef      = np.asarray(clf.coef_, dtype=float).T             # (features, classes)
+    idf       = np.asarray(tfidf.idf_, dtype=float)
+    intercept = np.asarray(clf.intercept_, dtype=float)
+
+    weight  = idf * np.abs(coef).max(axis=1)
+    kept    = weight >= prune * weight.max() if prune > 0 else np.ones(len(idf), dtype=bool)
+    default = float(idf.max()) if kind == "hash" else None   # idf of a never-seen hashed column
+    cols, keys           = _sorted_keys(vec, kind, np.flatnonzero(kept))
+    norm_cols, norm_keys  = _sorted_keys(vec, kind, np.flatnonzero(~kept & (idf != default)))
+
+    arrays = {
+        "keys":      keys,
+        "idf":       idf[cols].astype(np.float32),
+        "intercept": intercept,
+        "norm_keys": norm_keys,
+        "norm_idf":  idf[norm_cols].astype(np.float16),
+    }
+    if dtype == "int8":
+        scale = np.abs(coef[cols]).max(axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        arrays["coef"]  = np.round(coef[cols] / scale).astype(np.int8)
+        arrays["scale"] = scale.astype(np.float32)
+    else:
+        arrays["coef"] = coef[cols].astype(np.float32)
+
+    meta = {
+        "format":        FORMAT_VERSION,
+        "kind":          kind,
+        "token_pattern": vec.token_pattern,
+        "ngram_range":   list(vec.ngram_range),
+        "n_features":    getattr(vec, "n_features", None),
+        "binary":        bool(vec.binary),
+        "sublinear_tf":  bool(tfidf.sublinear_tf),
+        "norm":          tfidf.norm,
+        "dtype":         dtype,
+        "classes":       [str(c) for c in le.classes_],
+        "default_idf":   default,
+    }
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp   = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".npz")
+    os.close(fd)
+    try:
+        with open(tmp, "wb") as fh:
+            np.savez(fh, **arrays)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return {"features": len(idf), "kept": len(cols), "norm_only": len(norm_cols),
+            "bytes": os.path.getsize(path)}
+
+
+def _sorted_keys(vec, kind: str, columns: np.ndarray) -> tuple:
+    """(model columns, stored keys) for `columns`, ordered by key for searchsorted."""
+    if kind == "hash":
+        return columns, columns.astype(np.int32)
+    wanted = set(columns.tolist())
+    terms  = sorted((t, j) for t, j in vec.vocabulary_.items() if j in wanted)
+    blob   = "\n".join(t for t, _ in terms).encode("utf-8")
+    return np.array([j for _, j in terms], dtype=np.intp), np.frombuffer(blob, dtype=np.uint8)
+
+
+class CompactModel:
+    """Inference over an export_compact() file; see the module docstring."""
+
+    def __init__(self, arrays: dict):
+        meta            = json.loads(bytes(arrays["meta"]).decode("utf-8"))
+        self.meta       = meta
+        self.classes_   = np.array(meta["classes"])
+        self._analyzer  = _word_analyzer(meta["token_pattern"], tuple(meta["ngram_range"]))
+        self._idf       = arrays["idf"]
+        self._coef      = arrays["coef"]                         # (kept, classes), int8 or float32
+        self._scale     = arrays["scale"].astype(float) if "scale" in arrays else 1.0
+        self._intercept = arrays["intercept"]
+        self._norm_idf  = arrays["norm_idf"].astype(float)
+        self._default   = meta["default_idf"]
+
+        if meta["kind"] == "vocab":
+            self._keys      = _decode_terms(arrays["keys"])
+            self._norm_keys = _decode_terms(arrays["norm_keys"])
+            self._hash      = None
+        else:
+            self._keys      = arrays["keys"]
+            self._norm_keys = arrays["norm_keys"]
+            n_features      = meta["n_features"]
+            self._hash      = lambda gram: abs(_murmurhash3_32(gram)) % n_features
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as npz:
+            return cls({name: npz[name] for name in npz.files})
+
+    def _proba_one(self, text: str) -> np.ndarray:
+        z     = self._intercept.astype(float)
+        grams = self._analyzer(text)
+        if grams:
+            if self._hash is None:
+                probe = np.array(grams)
+            else:
+                probe = np.fromiter((self._hash(g) for g in grams), dtype=np.int64, count=len(grams))
+            keys, counts = np.unique(probe, return_counts=True)
+            tf = np.ones(len(keys)) if self.meta["binary"] else counts.astype(float)
+            if self.meta["sublinear_tf"]:
+                tf = np.log(tf) + 1.0
+
+            rows, hit       = _lookup(self._keys, keys)
+            norm_rows, hit2 = _lookup(self._norm_keys, keys[~hit])
+            x  = tf[hit] * self._idf[rows]
+            sq = float(x @ x) + float(((tf[~hit][hit2] * self._norm_idf[norm_rows]) ** 2).sum())
+            if self._default is not None:                     # hashed columns never seen in training
+                sq += float(((tf[~hit][~hit2] * self._default) ** 2).sum())
+            if self.meta["norm"] == "l2" and sq > 0.0:
+                x = x / math.sqrt(sq)
+            z = z + (x @ self._coef[rows]) * self._scale
+        if len(z) == 1:
+            p = 1.0 / (1.0 + np.exp(-z))
+            return np.concatenate([1.0 - p, p])
+        z = np.exp(z - z.max())
+        return z / z.sum()
+
+    def predict_proba(self, texts) -> np.ndarray:
+        """(N, n_classes) probabilities for preprocessed texts, in classes_ order."""
+        return np.array([self._proba_one(t) for t in texts]).reshape(-1, len(self.classes_))
+
+    def predict(self, texts) -> np.ndarray:
+        """Class labels (strings) for preprocessed texts."""
+        return self.classes_[self.predict_proba(texts).argmax(axis=1)]
+
+
+def _decode_terms(blob: np.ndarray) -> np.ndarray:
+    text = bytes(blob).decode("utf-8")
+    return np.array(text.split("\n") if text else [], dtype=str)
+
+
+def _lookup(keys: np.ndarray, probe: np.ndarray) -> tuple:
+    """(positions of the matching keys, mask of probe entries that matched) — keys sorted."""
+    if not len(keys) or not len(probe):
+        return np.empty(0, dtype=np.intp), np.zeros(len(probe), dtype=bool)
+    pos = np.searchsorted(keys, probe)
+    pos[pos == len(keys)] = 0
+    hit = keys[pos] == probe
+    return pos[hit], hit
+
+
+def _murmurhash3_32(text: str, seed: int = 0) -> int:
+    """Signed MurmurHash3 x86_32 of the UTF-8 bytes — sklearn.utils.murmurhash3_32(text, seed)."""
+    data   = text.encode("utf-8")
+    h      = seed & 0xFFFFFFFF
+    c1, c2 = 0xCC9E2D51, 0x1B873593
+    tail   = len(data) & ~3
+    for i in range(0, tail, 4):
+        k = int.from_bytes(data[i:i + 4], "little")
+        k = (k * c1) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * c2) & 0xFFFFFFFF
+        h ^= k
+        h = ((h << 13) | (h >> 19)) & 0xFFFFFFFF
+        h = (h * 5 + 0xE6546B64) & 0xFFFFFFFF
+    rest = data[tail:]
+    if rest:
+        k = int.from_bytes(rest, "little")
+        k = (k * c1) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * c2) & 0xFFFFFFFF
+        h ^= k
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h - (1 << 32) if h & 0x80000000 else h
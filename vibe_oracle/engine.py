@@ -0,0 +1,1092 @@
+"""
+Headless Vibe Oracle detection engine.
+
+Preprocessing, translation routing, the rule layer, the TF-IDF + LogReg model,
+the VADER fallback and fusion — importable from workers, the HTTP service or
+the CLI without pulling in Streamlit or causing any UI side effects.
+Process-wide singletons are lazy `lru_cache` getters, so they are built on
+first use and then live as long as the interpreter.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import re
+import os
+import time
+import tempfile
+import itertools
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+# sklearn, requests/bs4 (translator), VADER and WordNet are imported lazily on
+# first use (see NLP UTILITIES / ML MODEL).
+_T_IMPORT_START = time.perf_counter()
+import numpy as np
+import pandas as pd
+import nltk
+_T_IMPORT_CORE = time.perf_counter() - _T_IMPORT_START
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle.lexicon import EMOTION_KEYWORDS, EMOTIONS, LANG_DICT, MULTILANG_PHRASES
+from vibe_oracle.fast_inference import LinearTextScorer
+from vibe_oracle.lexicon_matcher import LexiconMatcher
+from vibe_oracle.model_store import ModelStore, fingerprint
+from vibe_oracle.result_cache import ResultCache, canonical_text
+from vibe_oracle.spans import SpanRecorder
+from vibe_oracle.translation_cache import TranslationCache
+
+# =============================================================================
+# STARTUP  (offline corpus check + cold-start timing report)
+# =============================================================================
+
+# VIBE_ORACLE_OFFLINE=1 → only look for local corpora, never call nltk.download
+OFFLINE = os.environ.get("VIBE_ORACLE_OFFLINE", "").lower() not in ("", "0", "false")
+
+# NLTK package → resource path checked with nltk.data.find (no network)
+_NLTK_RESOURCES = {
+    "vader_lexicon": "sentiment/vader_lexicon.zip",
+    "stopwords":     "corpora/stopwords",
+    "wordnet":       "corpora/wordnet",
+    "punkt":         "tokenizers/punkt",
+    "punkt_tab":     "tokenizers/punkt_tab",     # NLTK ≥ 3.8.2 sentence model
+    "omw-1.4":       "corpora/omw-1.4",
+}
+
+
+# Process-wide {component: seconds} record of first import/initialisation cost
+_STARTUP_TIMINGS = {}
+
+
+@contextmanager
+def _timed(component: str):
+    """Record how long the first initialisation of `component` took."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _STARTUP_TIMINGS.setdefault(component, time.perf_counter() - t0)
+
+
+def startup_report() -> pd.DataFrame:
+    """Cold-start cost per component, in the order components were first loaded."""
+    timings = _STARTUP_TIMINGS
+    return pd.DataFrame({
+        "component": list(timings.keys()),
+        "seconds":   [round(v, 4) for v in timings.values()],
+    })
+
+
+@lru_cache(maxsize=None)
+def _ensure_nltk_data() -> tuple:
+    """
+    Check local NLTK corpora once per process; return the packages still missing.
+
+    Only packages not found locally are downloaded, and nothing is downloaded
+    at all in OFFLINE mode — a cold container without network starts instantly.
+    """
+    with _timed("nltk corpora check"):
+        missing = []
+        for pkg, resource in _NLTK_RESOURCES.items():
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                missing.append(pkg)
+        if missing and not OFFLINE:
+            for pkg in list(missing):
+                try:
+                    if nltk.download(pkg, quiet=True):
+                        missing.remove(pkg)
+                except Exception:
+                    pass
+    return tuple(missing)
+
+
+_STARTUP_TIMINGS.setdefault("import numpy/pandas/nltk", _T_IMPORT_CORE)
+_ensure_nltk_data()
+
+# Per-request stage spans (VIBE_ORACLE_SPANS=1, or SPANS.enable() at runtime):
+# detect_emotion total, model load, translation, preprocess, rule layer,
+# ml layer, vader, normalisation, segmentation — export with SPANS.report() / SPANS.snapshot()
+SPANS = SpanRecorder(
+    enabled=os.environ.get("VIBE_ORACLE_SPANS", "").lower() not in ("", "0", "false"),
+)
+
+# =============================================================================
+# NLP UTILITIES
+# =============================================================================
+
+# Rule-layer automata, compiled once: phrases (×2, case-folded) + keywords (×1),
+# each pattern mapped to a weight row over the fixed EMOTIONS columns
+_PHRASE_MATCHER  = LexiconMatcher(MULTILANG_PHRASES, weight=2.0, lowercase=True, columns=EMOTIONS)
+_KEYWORD_MATCHER = LexiconMatcher(EMOTION_KEYWORDS,  weight=1.0, columns=EMOTIONS)
+
+
+@lru_cache(maxsize=None)
+def _load_stop_words() -> frozenset:
+    """English stopwords from the local NLTK corpus (empty if unavailable)."""
+    with _timed("nltk stopwords"):
+        try:
+            from nltk.corpus import stopwords
+            return frozenset(stopwords.words("english"))
+        except Exception:
+            return frozenset()
+
+
+@lru_cache(maxsize=None)
+def _get_lemmatize():
+    """Lazily build the WordNet lemmatizer; identity function if WordNet is missing."""
+    with _timed("wordnet lemmatizer"):
+        try:
+            from nltk.stem import WordNetLemmatizer
+            lemmatizer = WordNetLemmatizer()
+            lemmatizer.lemmatize("warmup")       # WordNet itself loads on first call
+            return lemmatizer.lemmatize
+        except Exception:
+            return lambda token: token
+
+
+@lru_cache(maxsize=None)
+def _get_sia():
+    """Lazily build the VADER analyzer; None if the lexicon is unavailable."""
+    with _timed("vader analyzer"):
+        try:
+            from nltk.sentiment.vader import SentimentIntensityAnalyzer
+            return SentimentIntensityAnalyzer()
+        except Exception:
+            return None
+
+
+_stop_words = _load_stop_words()
+
+
+# Bounded token → lemma memo: the vocabulary is small and repetitive, so after
+# warm-up almost every WordNet lookup is a dict hit
+LEMMA_MEMO_SIZE = 65_536
+_PUNCT_RE       = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=LEMMA_MEMO_SIZE)
+def _lemma(token: str) -> str:
+    return _get_lemmatize()(token)
+
+
+def preprocess(text: str) -> str:
+    """Lowercase → strip punctuation → tokenize → remove stopwords → lemmatize → rejoin."""
+    text   = text.lower()
+    text   = _PUNCT_RE.sub(" ", text)
+    tokens = text.split()
+    tokens = [_lemma(t) for t in tokens if t not in _stop_words]
+    return " ".join(tokens)
+
+
+# ── Local script / language routing (decides if the translator hop is needed) ─
+_SCRIPT_RANGES = {
+    "bengali":    ("\u0980", "\u09ff"),
+    "devanagari": ("\u0900", "\u097f"),
+}
+_ENGLISH_MIN_KNOWN_RATIO = 0.5
+
+# English vocabulary we can recognise offline: lexicon words + NLTK stopwords
+_BASE_ENGLISH_VOCAB = (
+    {w for kws in EMOTION_KEYWORDS.values() for w in kws}
+    | {w for entry in LANG_DICT.values() for w in entry["en"]}
+    | _stop_words
+)
+_ENGLISH_VOCAB      = _BASE_ENGLISH_VOCAB   # + overlay keywords, see reload_lexicon
+
+
+
+# Process-wide tally of translation_decision reasons
+translation_route_counts = Counter()
+
+
+def _dominant_script(text: str) -> str:
+    """Classify letters by Unicode block → 'bengali' | 'devanagari' | 'latin' | 'other' | 'none'."""
+    counts = Counter()
+    for ch in text:
+        if not ch.isalpha():
+            continue
+        for script, (lo, hi) in _SCRIPT_RANGES.items():
+            if lo <= ch <= hi:
+                counts[script] += 1
+                break
+        else:
+            counts["latin" if ch.isascii() else "other"] += 1
+    return counts.most_common(1)[0][0] if counts else "none"
+
+
+def translation_decision(text: str) -> dict:
+    """
+    Decide locally whether `text` needs the remote translation hop.
+
+    Returns {"translate": bool, "script": str, "reason": str}. Translation is
+    skipped when the text has no letters, is fully covered by MULTILANG_PHRASES,
+    or is Latin-script with at least half its tokens in the English vocabulary.
+    """
+    script = _dominant_script(text)
+    if script == "none":
+        return {"translate": False, "script": script, "reason": "no-letters"}
+
+    text_lc = text.lower()
+    covered = _PHRASE_MATCHER.covered_mask(text_lc)
+    if not any(ch.isalpha() and not hit for ch, hit in zip(text_lc, covered)):
+        return {"translate": False, "script": script, "reason": "lexicon-covered"}
+
+    if script == "latin":
+        tokens = re.findall(r"[a-z]+(?:[-'][a-z]+)*", text.lower())
+        known  = sum(t in _ENGLISH_VOCAB for t in tokens)
+        if tokens and known / len(tokens) >= _ENGLISH_MIN_KNOWN_RATIO:
+            return {"translate": False, "script": script, "reason": "english"}
+        return {"translate": True, "script": script, "reason": "latin-non-english"}
+
+    return {"translate": True, "script": script, "reason": f"{script}-script"}
+
+
+# Concurrency limit / per-request timeout for the translation stage (also the pool size)
+TRANSLATE_CONCURRENCY = 16
+TRANSLATE_TIMEOUT     = 10.0
+
+
+@lru_cache(maxsize=None)
+def _translator():
+    """One pooled-session Google client per process, shared by single and batch paths."""
+    with _timed("translator client"):
+        from vibe_oracle.async_translate import PooledGoogleTranslator
+        return PooledGoogleTranslator(
+            source="auto", target="en",
+            pool_size=TRANSLATE_CONCURRENCY, timeout=TRANSLATE_TIMEOUT,
+        )
+
+
+def _google_translate(text: str) -> str:
+    """Single uncached round trip to Google Translate (source auto-detected)."""
+    result = _translator().translate(text)
+    return result if result else text
+
+
+# VIBE_ORACLE_TRANSLATE=0 → never call the remote translator (benchmarks, air-gapped hosts)
+TRANSLATE = os.environ.get("VIBE_ORACLE_TRANSLATE", "1").lower() not in ("0", "false")
+
+# ── Translation cache (in-process LRU → SQLite on disk, shared by workers) ────
+# Built on first use, so VIBE_ORACLE_TRANSLATE=0 never creates the SQLite file
+TRANSLATION_CACHE_PATH = (
+    os.environ.get("VIBE_ORACLE_TRANSLATION_CACHE_DB")
+    or os.path.join(tempfile.gettempdir(), "vibe_oracle_translations.sqlite3")
+)
+TRANSLATION_CACHE_SIZE = int(os.environ.get("VIBE_ORACLE_TRANSLATION_CACHE_SIZE", "4096"))
+TRANSLATION_CACHE_TTL  = int(os.environ.get("VIBE_ORACLE_TRANSLATION_CACHE_TTL", str(30 * 24 * 3600)))
+TRANSLATION_CACHE_ROWS = int(os.environ.get("VIBE_ORACLE_TRANSLATION_CACHE_ROWS", "200000"))
+
+
+@lru_cache(maxsize=None)
+def translation_cache() -> TranslationCache:
+    """One TranslationCache per process, shared by every caller of translate_to_english."""
+    with _timed("translation cache"):
+        return TranslationCache(
+            _google_translate,
+            db_path=TRANSLATION_CACHE_PATH,
+            memory_size=TRANSLATION_CACHE_SIZE,
+            ttl_seconds=TRANSLATION_CACHE_TTL,
+            max_disk_rows=TRANSLATION_CACHE_ROWS,
+        )
+
+
+def translate_to_english(text: str) -> str:
+    """Translate to English when translation_decision says so (cached; falls back to input)."""
+    with SPANS.span("translation") as sp:
+        decision = translation_decision(text)
+        translation_route_counts[decision["reason"]] += 1
+        sp.branch = decision["reason"]
+        if not decision["translate"] or not TRANSLATE:
+            return text
+        try:
+            return translation_cache().translate(text)
+        except Exception:
+            sp.branch = "failed"
+            return text
+
+
+def translate_batch_to_english(texts: list) -> list:
+    """
+    translate_to_english over many texts with the network hops run concurrently.
+
+    Routing and cache lookups happen first; only distinct cache misses go to
+    the translator, at most TRANSLATE_CONCURRENCY at a time over pooled
+    connections. Failed or timed-out requests fall back to the original text
+    and are not cached — element i equals translate_to_english(texts[i]).
+    """
+    out     = list(texts)
+    pending = {}                       # text → positions awaiting translation
+    for i, text in enumerate(out):
+        decision = translation_decision(text)
+        translation_route_counts[decision["reason"]] += 1
+        if not decision["translate"] or not TRANSLATE:
+            continue
+        hit = translation_cache().get(text)
+        if hit is not None:
+            out[i] = hit
+        else:
+            pending.setdefault(text, []).append(i)
+
+    if pending:
+        from vibe_oracle.async_translate import translate_many
+        results = translate_many(
+            list(pending), _google_translate,
+            concurrency=TRANSLATE_CONCURRENCY, timeout=TRANSLATE_TIMEOUT,
+        )
+        for text, result in zip(pending, results):
+            if result is not None:
+                translation_cache().put(text, result)
+            for i in pending[text]:
+                out[i] = text if result is None else result
+    return out
+
+
+# =============================================================================
+# SKLEARN ML MODEL  (TF-IDF / hashed TF-IDF + Logistic Regression, content-addressed joblib store)
+# =============================================================================
+
+# Pre-bake into an image with:  VIBE_ORACLE_MODEL_DIR=/app/models python -m vibe_oracle bake-model
+MODEL_STORE_DIR = (
+    os.environ.get("VIBE_ORACLE_MODEL_DIR")
+    or os.path.join(tempfile.gettempdir(), "vibe_oracle_models")
+)
+
+# Arrays in the artifact are mapped read-only and shared by all worker processes
+MODEL_MMAP_MODE = "r"
+
+# Pipeline hyperparameters per variant — part of the artifact key, so edits force a retrain.
+#   tfidf   – TfidfVectorizer with a fitted vocabulary dict (pickled with the model)
+#   hashing – stateless HashingVectorizer into a fixed 2^14 feature space + idf;
+#             no vocabulary, so artifact size and load time do not grow with the corpus
+_MODEL_CONFIGS = {
+    "tfidf": {
+        "tfidf": {"ngram_range": (1, 2), "max_features": 8000, "sublinear_tf": True},
+        "clf":   {"max_iter": 1000, "C": 5.0, "solver": "lbfgs", "random_state": 42},
+    },
+    "hashing": {
+        "hash":  {"ngram_range": (1, 2), "n_features": 2 ** 14, "alternate_sign": False, "norm": None},
+        "tfidf": {"sublinear_tf": True},
+        "clf":   {"max_iter": 1000, "C": 5.0, "solver": "lbfgs", "random_state": 42},
+    },
+}
+
+# VIBE_ORACLE_MODEL_VARIANT=hashing selects the hashed-feature pipeline at startup
+MODEL_VARIANT = os.environ.get("VIBE_ORACLE_MODEL_VARIANT", "tfidf").lower()
+if MODEL_VARIANT not in _MODEL_CONFIGS:
+    raise ValueError(f"VIBE_ORACLE_MODEL_VARIANT must be one of {sorted(_MODEL_CONFIGS)}")
+_MODEL_CONFIG = _MODEL_CONFIGS[MODEL_VARIANT]
+
+
+# Sentence templates per keyword
+_TRAINING_TEMPLATES = [
+    "I feel {w} today",
+    "This makes me feel {w}",
+    "Feeling so {w} right now",
+    "I am completely {w}",
+    "Everything feels {w}",
+    "Such a {w} moment",
+    "I cannot help but feel {w}",
+    "It was truly {w}",
+    "The {w} inside me is overwhelming",
+    "So much {w}",
+    "{w} is all I feel",
+    "{w}",
+]
+
+
+def _build_training_corpus(keywords: dict = None, phrases: dict = None) -> pd.DataFrame:
+    """
+    Build a synthetic training DataFrame from keyword + phrase seeds
+    (default: the shipped EMOTION_KEYWORDS / MULTILANG_PHRASES).
+    Returns a pandas DataFrame with columns ['text', 'label'].
+    """
+    keywords = EMOTION_KEYWORDS  if keywords is None else keywords
+    phrases  = MULTILANG_PHRASES if phrases  is None else phrases
+
+    records = []
+    for emotion in EMOTIONS:
+        for kw in keywords.get(emotion, []):
+            for tpl in _TRAINING_TEMPLATES:
+                records.append({"text": tpl.format(w=kw), "label": emotion})
+        # Also seed with multi-language phrases
+        for phrase in phrases.get(emotion, []):
+            records.append({"text": phrase, "label": emotion})
+
+    # Build DataFrame and shuffle with numpy for reproducibility
+    df  = pd.DataFrame(records)
+    rng = np.random.default_rng(42)
+    idx = rng.permutation(len(df))
+    df  = df.iloc[idx].reset_index(drop=True)
+    return df
+
+
+def _make_pipeline(config: dict):
+    """Unfitted sklearn Pipeline for one _MODEL_CONFIGS entry."""
+    with _timed("import sklearn"):
+        from sklearn.feature_extraction.text import (
+            HashingVectorizer, TfidfTransformer, TfidfVectorizer,
+        )
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+
+    if "hash" in config:
+        return Pipeline([
+            ("hash",  HashingVectorizer(**config["hash"])),
+            ("tfidf", TfidfTransformer(**config["tfidf"])),
+            ("clf",   LogisticRegression(**config["clf"])),
+        ])
+    return Pipeline([
+        ("tfidf", TfidfVectorizer(**config["tfidf"])),
+        ("clf",   LogisticRegression(**config["clf"])),
+    ])
+
+
+def _train_model(keywords: dict = None, phrases: dict = None, config: dict = None):
+    """Train the configured feature + LogisticRegression pipeline; return (pipeline, label_encoder)."""
+    pipe = _make_pipeline(config or _MODEL_CONFIG)
+    from sklearn.preprocessing import LabelEncoder
+
+    df = _build_training_corpus(keywords, phrases)
+    le = LabelEncoder()
+    y  = le.fit_transform(df["label"])
+    X  = df["text"].apply(preprocess)
+
+    pipe.fit(X, y)
+    # Introspection-only; sklearn documents it as safe to drop before pickling
+    if hasattr(pipe.named_steps["tfidf"], "stop_words_"):
+        delattr(pipe.named_steps["tfidf"], "stop_words_")
+    return pipe, le
+
+
+@lru_cache(maxsize=None)
+def model_key() -> str:
+    """
+    Content hash identifying the model artifact.
+
+    Covers the training corpus, pipeline config, preprocessing inputs
+    (stopwords, whether WordNet is available) and the scikit-learn version
+    the artifact is pickled with.
+    """
+    from importlib.metadata import version
+
+    df = _build_training_corpus()
+    return fingerprint(
+        df["text"].tolist(),
+        df["label"].tolist(),
+        _MODEL_CONFIG,
+        sorted(_stop_words),
+        _get_lemmatize()("cats"),
+        version("scikit-learn"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _model_store() -> ModelStore:
+    """Process-wide handle on the artifact directory."""
+    return ModelStore(MODEL_STORE_DIR)
+
+
+@lru_cache(maxsize=None)
+def get_model():
+    """
+    Return (pipeline, label_encoder) memory-mapped from the model store; train only on a miss.
+
+    With a lexicon overlay loaded, the base artifact is updated incrementally
+    (see _update_model) and that result is stored under its own key.
+    """
+    with _timed("model load/train"):
+        store = _model_store()
+        base  = store.get_or_build(model_key(), _train_model, mmap_mode=MODEL_MMAP_MODE)
+        if not _overlay_size(_lexicon_overlay):
+            return base
+        return store.get_or_build(
+            fingerprint(model_key(), _lexicon_overlay),
+            lambda: _update_model(base, _lexicon_overlay),
+            mmap_mode=MODEL_MMAP_MODE,
+        )
+
+
+# =============================================================================
+# LEXICON OVERLAY  (hot-reloadable rule entries + incremental model update)
+# =============================================================================
+
+# VIBE_ORACLE_LEXICON_OVERLAY=<file.json> adds entries on top of the shipped
+# lexicons:  {"keywords": {"joy": ["stoked", ...]}, "phrases": {"fear": [...]}}
+# The file is re-read when its mtime changes (checked at most every interval).
+LEXICON_OVERLAY_PATH   = os.environ.get("VIBE_ORACLE_LEXICON_OVERLAY") or None
+LEXICON_CHECK_INTERVAL = 2.0
+
+# Base-corpus rows replayed next to the delta so the warm start does not forget
+# (None → all of them; an int → stratified sample, re-weighted to the full size)
+INCREMENTAL_REPLAY_ROWS = None
+
+_lexicon_overlay = {"keywords": {}, "phrases": {}}
+_overlay_state   = {"mtime": None, "checked": 0.0}
+
+
+def _overlay_size(overlay: dict) -> int:
+    return sum(len(v) for part in overlay.values() for v in part.values())
+
+
+def _read_overlay(path: str) -> dict:
+    """
+    Parse an overlay file, dropping entries the shipped lexicons already have.
+
+    Raises ValueError unless every emotion maps to a list of non-empty
+    strings. Keywords are lowercased: the keyword matcher sees lowercased text.
+    """
+    import json
+
+    with open(path, encoding="utf-8") as fh:
+        raw = json.load(fh)
+    if not isinstance(raw, dict):
+        raise ValueError("overlay: expected a JSON object")
+    out = {"keywords": {}, "phrases": {}}
+    for part, base in (("keywords", EMOTION_KEYWORDS), ("phrases", MULTILANG_PHRASES)):
+        section = raw.get(part) or {}
+        if not isinstance(section, dict):
+            raise ValueError(f"overlay {part}: expected an object of emotion → list")
+        for emotion, entries in section.items():
+            if emotion not in EMOTIONS:
+                raise ValueError(f"overlay {part}: unknown emotion {emotion!r}")
+            if not isinstance(entries, list) or not all(isinstance(w, str) and w.strip() for w in entries):
+                raise ValueError(f"overlay {part}.{emotion}: expected a list of non-empty strings")
+            if part == "keywords":
+                entries = [w.lower() for w in entries]
+            known = set(base.get(emotion, []))
+            new   = [w for w in dict.fromkeys(entries) if w not in known]
+            if new:
+                out[part][emotion] = new
+    return out
+
+
+def _merged(base: dict, extra: dict) -> dict:
+    return {e: list(base.get(e, [])) + extra.get(e, []) for e in EMOTIONS if base.get(e) or extra.get(e)}
+
+
+def lexicon_version() -> str:
+    """'base', or a short hash of the loaded overlay — part of the result-cache version."""
+    if not _overlay_size(_lexicon_overlay):
+        return "base"
+    return fingerprint(_lexicon_overlay)[:16]
+
+
+def reload_lexicon(path: str = None) -> dict:
+    """
+    (Re)load the overlay from `path` (default LEXICON_OVERLAY_PATH; None → base only).
+
+    Rule matchers and the routing vocabulary are rebuilt and swapped in at
+    once; the model and result cache pick up the new version on next use.
+    """
+    global _PHRASE_MATCHER, _KEYWORD_MATCHER, _ENGLISH_VOCAB, _lexicon_overlay
+
+    path      = path or LEXICON_OVERLAY_PATH
+    overlay   = _read_overlay(path) if path else {"keywords": {}, "phrases": {}}
+    t0        = time.perf_counter()
+    keywords  = _merged(EMOTION_KEYWORDS, overlay["keywords"])
+    phrases   = _merged(MULTILANG_PHRASES, overlay["phrases"])
+    phrase_m  = LexiconMatcher(phrases,  weight=2.0, lowercase=True, columns=EMOTIONS)
+    keyword_m = LexiconMatcher(keywords, weight=1.0, columns=EMOTIONS)
+    vocab     = _BASE_ENGLISH_VOCAB | {w for kws in overlay["keywords"].values() for w in kws}
+
+    _PHRASE_MATCHER, _KEYWORD_MATCHER, _ENGLISH_VOCAB = phrase_m, keyword_m, vocab
+    _lexicon_overlay = overlay
+    get_model.cache_clear()
+    _label_index.cache_clear()
+    _fast_scorer.cache_clear()
+    if result_cache.cache_info().currsize:
+        result_cache().version = _result_cache_version()
+    return {
+        "version":        lexicon_version(),
+        "keywords_added": _overlay_size({"k": overlay["keywords"]}),
+        "phrases_added":  _overlay_size({"p": overlay["phrases"]}),
+        "rules_seconds":  round(time.perf_counter() - t0, 4),
+    }
+
+
+def _maybe_reload_lexicon():
+    """Cheap per-request hook: reload when the overlay file's mtime has changed."""
+    if LEXICON_OVERLAY_PATH is None:
+        return
+    now = time.monotonic()
+    if now - _overlay_state["checked"] < LEXICON_CHECK_INTERVAL:
+        return
+    _overlay_state["checked"] = now
+    try:
+        mtime = os.stat(LEXICON_OVERLAY_PATH).st_mtime
+    except OSError:
+        mtime = None
+    if mtime != _overlay_state["mtime"]:
+        _overlay_state["mtime"] = mtime
+        try:
+            reload_lexicon(LEXICON_OVERLAY_PATH if mtime is not None else None)
+        except Exception:
+            pass     # malformed/half-written file — keep serving the current lexicon
+
+
+def _update_model(base, overlay: dict):
+    """
+    Incrementally extend a fitted (pipeline, label_encoder) with overlay entries.
+
+    Only the delta corpus (templates × new keywords + new phrases) is
+    analysed for new terms: they are appended to the TF-IDF vocabulary with
+    idf from their delta document frequency; existing idf values are kept and
+    the vectorizer is never refit. The classifier is warm-started from the
+    base coefficients (new columns zero) and refit on the delta plus replayed
+    base rows (INCREMENTAL_REPLAY_ROWS), so it converges in a fraction of the
+    iterations and does not forget the base classes.
+    """
+    import copy
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+
+    pipe, le = base
+    delta    = _build_training_corpus(overlay["keywords"], overlay["phrases"])
+    base_df  = _build_training_corpus()
+    replay   = base_df
+    if INCREMENTAL_REPLAY_ROWS is not None and INCREMENTAL_REPLAY_ROWS < len(base_df):
+        per_cls = max(INCREMENTAL_REPLAY_ROWS // len(EMOTIONS), 1)
+        replay  = pd.concat(
+            g.sample(n=min(per_cls, len(g)), random_state=42) for _, g in base_df.groupby("label")
+        )
+    X_delta  = [preprocess(t) for t in delta["text"]]
+
+    if "hash" in pipe.named_steps:
+        # ── Fixed hashed feature space: new terms land in existing columns ───
+        steps     = pipe.steps[:-1]
+        features  = Pipeline(steps)
+        new_terms = []
+    else:
+        # ── Vocabulary / idf extension ───────────────────────────────────────
+        tfidf     = copy.deepcopy(pipe.named_steps["tfidf"])     # detach from mmap'd arrays
+        analyzer  = tfidf.build_analyzer()
+        vocab     = dict(tfidf.vocabulary_)
+        doc_freq  = Counter(t for doc in X_delta for t in set(analyzer(doc)) if t not in vocab)
+        new_terms = sorted(doc_freq)
+        for term in new_terms:
+            vocab[term] = len(vocab)
+        n_docs = len(base_df) + len(delta)
+        df_new = np.array([doc_freq[t] for t in new_terms], dtype=float)
+        tfidf.vocabulary_ = vocab
+        tfidf.idf_        = np.concatenate([np.asarray(tfidf.idf_), np.log((1 + n_docs) / (1 + df_new)) + 1])
+        tfidf._tfidf.n_features_in_ = len(vocab)
+        steps    = [("tfidf", tfidf)]
+        features = tfidf
+
+    # ── Warm-started classifier ──────────────────────────────────────────────
+    old = pipe.named_steps["clf"]
+    clf = LogisticRegression(**_MODEL_CONFIG["clf"], warm_start=True)
+    clf.coef_      = np.hstack([np.asarray(old.coef_), np.zeros((old.coef_.shape[0], len(new_terms)))])
+    clf.intercept_ = np.array(old.intercept_)
+    X = features.transform(X_delta + [preprocess(t) for t in replay["text"]])
+    y = le.transform(list(delta["label"]) + list(replay["label"]))
+    w = np.r_[np.ones(len(delta)), np.full(len(replay), len(base_df) / len(replay))]
+    clf.fit(X, y, sample_weight=w)
+    return Pipeline(steps + [("clf", clf)]), le
+
+
+# =============================================================================
+# EMOTION DETECTION  (3-layer fusion)
+# =============================================================================
+
+# Column positions of the emotions the fusion rules single out
+_N_EMOTIONS = len(EMOTIONS)
+_JOY        = EMOTIONS.index("joy")
+_SADNESS    = EMOTIONS.index("sadness")
+_UNIFORM    = np.full(_N_EMOTIONS, round(1.0 / _N_EMOTIONS, 4))
+
+
+@lru_cache(maxsize=None)
+def _label_index() -> np.ndarray:
+    """EMOTIONS column of each model class, in predict_proba column order (built once)."""
+    _, le = get_model()
+    return np.array([EMOTIONS.index(c) for c in le.classes_], dtype=np.intp)
+
+
+def _rule_vector(raw_text: str, translated: str, processed: str = None, out=None) -> np.ndarray:
+    """Layer 1 + 2: multi-lang phrase hits (weight ×2) + keyword hits, as an EMOTIONS vector.
+
+    `processed` is preprocess(translated); pass it when the caller already has it.
+    `out` is a zeroed vector (e.g. a row of a preallocated matrix) to write into.
+    """
+    if out is None:
+        out = np.zeros(_N_EMOTIONS)
+
+    # 1. Multi-language phrase detection on original text (one automaton pass)
+    _PHRASE_MATCHER.add_vector(out, raw_text.lower())
+
+    # 2. Keyword matching on translated + preprocessed text
+    if processed is None:
+        processed = preprocess(translated)
+    _KEYWORD_MATCHER.add_vector(out, translated.lower(), set(processed.split()))
+
+    return out
+
+
+# VIBE_ORACLE_FAST_PATH=0 sends single texts through Pipeline.predict_proba as well
+FAST_PATH = os.environ.get("VIBE_ORACLE_FAST_PATH", "1").lower() not in ("0", "false")
+
+
+@lru_cache(maxsize=None)
+def _fast_scorer():
+    """LinearTextScorer over get_model()'s pipeline; None if disabled or the pipeline is unsupported."""
+    if not FAST_PATH:
+        return None
+    try:
+        return LinearTextScorer.from_pipeline(get_model()[0])
+    except Exception:
+        return None
+
+
+def _predict_proba_one(pipe, processed: str) -> np.ndarray:
+    """(1, n_classes) probabilities for one text — array path when available, else the Pipeline."""
+    scorer = _fast_scorer()
+    if scorer is None:
+        return pipe.predict_proba([processed])
+    return scorer.predict_proba(processed)[None, :]
+
+
+def _ml_matrix(proba: np.ndarray) -> np.ndarray:
+    """Scatter predict_proba columns onto EMOTIONS columns (missing classes → 0)."""
+    out = np.zeros((proba.shape[0], _N_EMOTIONS))
+    out[:, _label_index()] = proba
+    return out
+
+
+def _fuse_vector(rule_v: np.ndarray, ml_v: np.ndarray, translated: str) -> np.ndarray:
+    """Blend rule + ML vectors (VADER safety-net included) into a rounded distribution."""
+    rule_total = rule_v.sum()
+
+    # ── Blend ────────────────────────────────────────────────────────────────
+    if rule_total > 0:
+        blended = 0.6 * (rule_v / rule_total) + 0.4 * ml_v
+    else:
+        blended = ml_v.copy()
+        # ── Layer 3: VADER safety-net when ML is uncertain ────────────────────
+        if blended.max() < 0.40:
+            with SPANS.span("vader") as sp:
+                sia      = _get_sia()
+                compound = sia.polarity_scores(translated)["compound"] if sia else 0.0
+                if compound >= 0.05:
+                    blended[_JOY]     += 0.50
+                    sp.branch = "joy"
+                elif compound <= -0.05:
+                    blended[_SADNESS] += 0.50
+                    sp.branch = "sadness"
+                else:
+                    sp.branch = "neutral" if sia else "unavailable"
+                blended /= blended.sum()
+
+    # Final normalisation
+    with SPANS.span("normalisation") as sp:
+        total = blended.sum()
+        if total > 0:
+            sp.branch = "scaled"
+            return np.round(blended / total, 4)
+        sp.branch = "uniform"
+        return _UNIFORM.copy()
+
+
+# ── Vectorised fusion (batch path) ────────────────────────────────────────────
+def _vader_rows(rule: np.ndarray, ml: np.ndarray) -> np.ndarray:
+    """Rows of an N×6 batch that take the VADER safety-net: no rule signal, top ML < 0.40."""
+    return (rule.sum(axis=1) <= 0) & (ml.max(axis=1) < 0.40)
+
+
+def _vader_compounds(translated: list, rows: np.ndarray) -> np.ndarray:
+    """VADER compound per text, computed only where `rows` is set (0.0 elsewhere / no VADER)."""
+    out = np.zeros(len(translated))
+    sia = _get_sia()
+    if sia is not None:
+        for i in np.flatnonzero(rows):
+            out[i] = sia.polarity_scores(translated[i])["compound"]
+    return out
+
+
+def _fuse_matrix(rule: np.ndarray, ml: np.ndarray, compound: np.ndarray) -> np.ndarray:
+    """
+    _fuse_vector over a whole batch with masked array ops.
+
+    rule / ml are N×6 in EMOTIONS order, compound the N VADER compounds (only
+    read on _vader_rows). Every row is bit-identical to the scalar path.
+    """
+    rule_total = rule.sum(axis=1)
+    has_rule   = rule_total > 0
+    blended    = ml.copy()
+
+    # ── Blend: 60% rule + 40% ML where the rule layer fired ──────────────────
+    if has_rule.any():
+        blended[has_rule] = (
+            0.6 * (rule[has_rule] / rule_total[has_rule, None]) + 0.4 * ml[has_rule]
+        )
+
+    # ── Layer 3: VADER nudge + renormalise where ML is uncertain ─────────────
+    vader = _vader_rows(rule, ml)
+    if vader.any():
+        sub = blended[vader]
+        c   = compound[vader]
+        sub[c >= 0.05,  _JOY]     += 0.50
+        sub[c <= -0.05, _SADNESS] += 0.50
+        blended[vader] = sub / sub.sum(axis=1, keepdims=True)
+
+    # Final normalisation (uniform where nothing scored)
+    total = blended.sum(axis=1)
+    ok    = total > 0
+    out   = np.tile(_UNIFORM, (len(blended), 1))
+    out[ok] = np.round(blended[ok] / total[ok, None], 4)
+    return out
+
+
+def _detect_emotion_uncached(raw_text: str) -> dict:
+    """
+    Multi-layer emotion detection → probability distribution over 6 emotions.
+
+    Priority chain:
+      1. Rule-based (phrase + keyword) — normalised if any signal
+      2. ML model (TF-IDF + LogReg) probability vector
+      3. VADER compound fallback when ML confidence is low
+      4. Blend: 60% rule + 40% ML when rule has signal; 100% ML otherwise
+
+    Scores canonical_text(raw_text) (NFKC, whitespace collapsed), like
+    _score_chunk, so cached, uncached and batch results agree.
+    """
+    raw_text = canonical_text(raw_text)
+    with SPANS.span("model load") as sp:
+        sp.branch = "warm" if get_model.cache_info().currsize else "cold"
+        pipe, le  = get_model()
+
+    # Translate + preprocess once; both layers share the result
+    translated = translate_to_english(raw_text)
+    with SPANS.span("preprocess"):
+        processed = preprocess(translated)
+
+    # ── Layer 1 & 2: rule-based ───────────────────────────────────────────────
+    with SPANS.span("rule layer") as sp:
+        rule_v    = _rule_vector(raw_text, translated, processed)
+        sp.branch = "signal" if rule_v.any() else "no-signal"
+
+    # ── Layer 2: ML ───────────────────────────────────────────────────────────
+    with SPANS.span("ml layer") as sp:
+        ml_v      = _ml_matrix(_predict_proba_one(pipe, processed))[0]
+        sp.branch = "confident" if ml_v.max() >= 0.40 else "uncertain"
+
+    return dict(zip(EMOTIONS, _fuse_vector(rule_v, ml_v, translated).tolist()))
+
+
+# ── Result cache (canonical text + model version → scores) ────────────────────
+# VIBE_ORACLE_RESULT_CACHE_SIZE=0 disables the in-process tier; setting
+# VIBE_ORACLE_RESULT_CACHE_DB=<path> adds a SQLite tier shared across processes
+RESULT_CACHE_SIZE = int(os.environ.get("VIBE_ORACLE_RESULT_CACHE_SIZE", "16384"))
+RESULT_CACHE_PATH = os.environ.get("VIBE_ORACLE_RESULT_CACHE_DB") or None
+
+
+def _result_cache_version() -> str:
+    return f"{model_key()}:{lexicon_version()}:translate={int(TRANSLATE)}"
+
+
+@lru_cache(maxsize=None)
+def result_cache() -> ResultCache:
+    """One ResultCache per process, versioned by model artifact, lexicon overlay and translator switch."""
+    with _timed("result cache"):
+        return ResultCache(
+            _detect_emotion_uncached,
+            version=_result_cache_version(),
+            memory_size=RESULT_CACHE_SIZE,
+            db_path=RESULT_CACHE_PATH,
+        )
+
+
+def detect_emotion(raw_text: str) -> dict:
+    """
+    Multi-layer emotion detection → probability distribution over 6 emotions.
+
+    Served from result_cache() when enabled: whitespace variants of a
+    message already scored by this model version are a dict lookup.
+    Texts longer than LONG_TEXT_THRESHOLD go through detect_document instead
+    (sentence batch, capped at CHAR_BUDGET) and bypass the cache.
+    See _detect_emotion_uncached for the layers.
+    """
+    _maybe_reload_lexicon()
+    with SPANS.span("detect_emotion total") as sp:
+        if _is_long(raw_text):
+            sp.branch = "long-document"
+            return detect_document(raw_text)["emotions"]
+        if RESULT_CACHE_SIZE <= 0 and RESULT_CACHE_PATH is None:
+            sp.branch = "cache-off"
+            return _detect_emotion_uncached(raw_text)
+        return result_cache().get_or_compute(raw_text)
+
+
+BATCH_CHUNK_SIZE = 1024
+
+
+def _score_chunk(chunk: list) -> np.ndarray:
+    """(len(chunk), 6) fused scores: one translate batch, one predict_proba, matrix fusion."""
+    chunk      = [canonical_text(t) for t in chunk]
+    pipe, _    = get_model()
+    translated = translate_batch_to_english(chunk)
+    processed  = [preprocess(t) for t in translated]
+    ml_mat     = _ml_matrix(pipe.predict_proba(processed))
+    rule_mat   = np.zeros((len(chunk), _N_EMOTIONS))       # rows written in place
+    for i, (raw, tr, pr) in enumerate(zip(chunk, translated, processed)):
+        _rule_vector(raw, tr, pr, out=rule_mat[i])
+    compound = _vader_compounds(translated, _vader_rows(rule_mat, ml_mat))
+    return _fuse_matrix(rule_mat, ml_mat, compound)
+
+
+def detect_emotion_batch(texts, chunk_size: int = BATCH_CHUNK_SIZE, as_frame: bool = False):
+    """
+    Batch version of detect_emotion over a list, pandas Series or any iterable.
+
+    Input is consumed in chunks of `chunk_size`; each chunk gets one vectorised
+    TF-IDF transform + predict_proba instead of one sklearn call per text.
+    Returns an (N, 6) float array with columns in EMOTIONS order, or a DataFrame
+    (index preserved for a Series) when as_frame=True. Row i is identical to
+    the uncached detect_emotion(texts[i]) — long texts included, which are
+    scored by detect_document; the result cache is not consulted.
+    """
+    _maybe_reload_lexicon()
+    index = texts.index if isinstance(texts, pd.Series) else None
+    get_model()
+    rows  = []
+
+    it = iter(texts)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            break
+
+        # Long rows leave the chunk as "" and are scored sentence by sentence
+        long_rows = {i: t for i, t in enumerate(chunk) if _is_long(t)}
+        for i in long_rows:
+            chunk[i] = ""
+        fused = _score_chunk(chunk)
+        for i, text in long_rows.items():
+            fused[i] = list(detect_document(text)["emotions"].values())
+        rows.append(fused)
+
+    out = np.concatenate(rows) if rows else np.empty((0, _N_EMOTIONS))
+    if as_frame:
+        return pd.DataFrame(out, columns=EMOTIONS, index=index)
+    return out
+
+
+# =============================================================================
+# LONG-DOCUMENT MODE  (sentence segmentation + bounded per-request cost)
+# =============================================================================
+
+# Texts longer than this many characters are scored as documents
+# (0 disables the routing; detect_document can still be called directly)
+LONG_TEXT_THRESHOLD = int(os.environ.get("VIBE_ORACLE_LONG_TEXT_THRESHOLD", "2000"))
+# Characters of a document that are scored at all; the rest is ignored
+CHAR_BUDGET         = int(os.environ.get("VIBE_ORACLE_CHAR_BUDGET", "20000"))
+# Run-on "sentences" (no punctuation) are cut at whitespace into pieces this long
+SENTENCE_MAX_CHARS  = 400
+
+# Lines and danda-terminated clauses (Bengali / Devanagari full stop)
+_BLOCK_RE = re.compile(r"[^\n।॥]+[।॥]*")
+
+
+def _is_long(text: str) -> bool:
+    return 0 < LONG_TEXT_THRESHOLD < len(text)
+
+
+@lru_cache(maxsize=None)
+def _sentence_tokenizer():
+    """Pretrained English Punkt model if the corpus is installed, else untrained Punkt."""
+    with _timed("punkt tokenizer"):
+        from nltk.tokenize.punkt import PunktSentenceTokenizer
+        try:
+            from nltk.tokenize import PunktTokenizer       # NLTK ≥ 3.8.2 (punkt_tab)
+            return PunktTokenizer("english")
+        except Exception:
+            pass
+        try:
+            return nltk.data.load("tokenizers/punkt/english.pickle")
+        except Exception:
+            return PunktSentenceTokenizer()
+
+
+def sentence_spans(text: str, max_chars: int = SENTENCE_MAX_CHARS) -> list:
+    """
+    [(start, end), ...] character spans of the sentences in `text`.
+
+    Lines and ।/॥ clauses are split first (Punkt only knows Latin punctuation),
+    then Punkt splits each block; pieces longer than `max_chars` are cut at the
+    last space before the limit.
+    """
+    tokenizer = _sentence_tokenizer()
+    spans     = []
+    for block in _BLOCK_RE.finditer(text):
+        offset = block.start()
+        for s, e in tokenizer.span_tokenize(block.group()):
+            s, e = s + offset, e + offset
+            while e - s > max_chars:
+                cut = text.rfind(" ", s + 1, s + max_chars)
+                cut = cut if cut > s else s + max_chars
+                spans.append((s, cut))
+                s = cut
+                while s < e and text[s].isspace():
+                    s += 1
+            piece = text[s:e]
+            if piece.strip():
+                s += len(piece) - len(piece.lstrip())
+                e -= len(piece) - len(piece.rstrip())
+                spans.append((s, e))
+    return spans
+
+
+def detect_document(raw_text: str, char_budget: int = None) -> dict:
+    """
+    Long-text mode: split into sentences, score them as one batch, combine.
+
+    Only the first `char_budget` characters (default CHAR_BUDGET, <= 0 for
+    no limit) are segmented and scored, so per-request cost is bounded
+    whatever the input size. Returns
+
+        emotions         document distribution — sentence rows averaged,
+                         weighted by sentence length
+        dominant_share   fraction of sentences whose top emotion is each emotion
+        sentences        [{start, end, text, scores, dominant}, ...]
+        chars, chars_scored, truncated
+    """
+    budget = CHAR_BUDGET if char_budget is None else char_budget
+    text   = raw_text[:budget] if budget > 0 else raw_text
+
+    with SPANS.span("segmentation") as sp:
+        spans     = sentence_spans(text) or [(0, len(text))]
+        sp.branch = "single" if len(spans) == 1 else "multi"
+    sentences = [text[s:e] for s, e in spans]
+
+    matrix = np.concatenate([
+        _score_chunk(sentences[i:i + BATCH_CHUNK_SIZE])
+        for i in range(0, len(sentences), BATCH_CHUNK_SIZE)
+    ])
+    weights  = np.array([max(e - s, 1) for s, e in spans], dtype=float)
+    doc      = np.round(weights @ matrix / weights.sum(), 4)
+    dominant = matrix.argmax(axis=1)
+    share    = np.bincount(dominant, minlength=_N_EMOTIONS) / len(spans)
+
+    return {
+        "emotions":       dict(zip(EMOTIONS, doc.tolist())),
+        "dominant_share": dict(zip(EMOTIONS, np.round(share, 4).tolist())),
+        "sentences": [
+            {
+                "start":    s,
+                "end":      e,
+                "text":     sentence,
+                "scores":   dict(zip(EMOTIONS, row.tolist())),
+                "dominant": EMOTIONS[d],
+            }
+            for (s, e), sentence, row, d in zip(spans, sentences, matrix, dominant)
+        ],
+        "chars":        len(raw_text),
+        "chars_scored": len(text),
+        "truncated":    len(text) < len(raw_text),
+    }
+
+
+# Load the lexicon overlay (if configured) before the first request
+_maybe_reload_lexicon()
@@ -0,0 +1,124 @@
+"""
+Single-row inference straight from the fitted pipeline's arrays.
+
+For one short text, Pipeline.predict_proba spends most of its time in input
+validation, step dispatch and building a 1-row CSR matrix. LinearTextScorer
+reads the vectoriser's analyzer and vocabulary (or hash space), the idf
+vector and the LogisticRegression coefficients out of the pipeline once, then
+scores a text with a dict lookup per n-gram, a dot product over the handful
+of active features and a softmax.
+
+The arithmetic follows sklearn's operation order: sorted feature indices,
+1 + log(tf), × idf, sequential L2 norm, row-by-row accumulation of the
+coefficient rows, then softmax. Its probabilities match predict_proba to
+float rounding (bit-for-bit on the shipped corpus).
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import math
+from collections import Counter
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+
+
+class LinearTextScorer:
+    """
+    predict_proba for one text over a fitted
+    [TfidfVectorizer | HashingVectorizer + TfidfTransformer] → LogisticRegression pipeline.
+
+    Build with LinearTextScorer.from_pipeline(pipe); raises ValueError for a
+    pipeline shape it cannot reproduce exactly (the caller keeps using sklearn).
+    """
+
+    def __init__(self, analyzer, lookup, idf, coef, intercept, sublinear_tf: bool,
+                 norm: str, binary: bool):
+        self._analyzer  = analyzer
+        self._lookup    = lookup                   # n-gram → feature index (None if unknown)
+        self._idf       = None if idf is None else np.asarray(idf, dtype=float)
+        self._coef      = np.asarray(coef, dtype=float)   # (classes, features); no copy, stays mmap-shared
+        self._intercept = np.asarray(intercept, dtype=float)
+        self._sublinear = sublinear_tf
+        self._norm      = norm
+        self._binary    = binary
+
+    @classmethod
+    def from_pipeline(cls, pipe):
+        from sklearn.feature_extraction.text import (
+            HashingVectorizer, TfidfTransformer, TfidfVectorizer,
+        )
+        from sklearn.linear_model import LogisticRegression
+
+        steps = [step for _, step in pipe.steps]
+        clf   = steps[-1]
+        if not isinstance(clf, LogisticRegression):
+            raise ValueError("last step must be LogisticRegression")
+
+        if len(steps) == 2 and isinstance(steps[0], TfidfVectorizer):
+            vec, tfidf = steps[0], steps[0]
+            lookup     = vec.vocabulary_.get
+        elif (len(steps) == 3 and isinstance(steps[0], HashingVectorizer)
+              and isinstance(steps[1], TfidfTransformer)):
+            vec, tfidf = steps[0], steps[1]
+            if vec.alternate_sign or vec.norm is not None:
+                raise ValueError("hashing step must use alternate_sign=False, norm=None")
+            lookup = _hash_lookup(vec.n_features)
+        else:
+            raise ValueError(f"unsupported pipeline steps: {[type(s).__name__ for s in steps]}")
+
+        if tfidf.norm not in ("l2", None):
+            raise ValueError(f"unsupported norm {tfidf.norm!r}")
+        return cls(
+            analyzer=vec.build_analyzer(),
+            lookup=lookup,
+            idf=getattr(tfidf, "idf_", None) if tfidf.use_idf else None,
+            coef=clf.coef_,
+            intercept=clf.intercept_,
+            sublinear_tf=tfidf.sublinear_tf,
+            norm=tfidf.norm,
+            binary=vec.binary,
+        )
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        """Class probabilities for one (already preprocessed) text, in clf.classes_ order."""
+        lookup = self._lookup
+        counts = Counter()
+        for gram in self._analyzer(text):
+            j = lookup(gram)
+            if j is not None:
+                counts[j] += 1
+
+        z = self._intercept.copy()
+        if counts:
+            idx  = sorted(counts)
+            data = np.fromiter((1 if self._binary else counts[j] for j in idx), dtype=float, count=len(idx))
+            if self._sublinear:
+                np.log(data, data)
+                data += 1.0
+            if self._idf is not None:
+                data *= self._idf[idx]
+            if self._norm == "l2":
+                sq = 0.0
+                for v in data.tolist():            # sequential, as sklearn's row normaliser
+                    sq += v * v
+                if sq > 0.0:
+                    data /= math.sqrt(sq)
+            rows = self._coef[:, idx].T * data[:, None]
+            z    = np.add.reduce(rows, axis=0) + self._intercept
+
+        if len(z) == 1:                            # binary LogisticRegression
+            p = 1.0 / (1.0 + np.exp(-z))
+            return np.concatenate([1.0 - p, p])
+        z -= z.max()
+        np.exp(z, out=z)
+        z /= z.sum()
+        return z
+
+
+def _hash_lookup(n_features: int):
+    """HashingVectorizer's token → column map (signed MurmurHash3, |h| mod n_features)."""
+    from sklearn.utils import murmurhash3_32
+
+    def lookup(gram: str) -> int:
+        return abs(murmurhash3_32(gram, seed=0)) % n_features
+    return lookup
@@ -0,0 +1,196 @@
+"""
+Streaming scorer for large CSV / JSONL message dumps.
+
+Records are read lazily and scored in fixed-size chunks with the vectorised
+`detect_emotion_batch`, so memory use is bounded by the chunk size, not the
+file size. Each output row carries the input record offset, an optional id,
+the six emotion probabilities and the dominant label; a run can be resumed
+from an explicit offset or from however many rows the output already holds.
+
+    python -m vibe_oracle score dump.jsonl.gz scores.csv --text-column message --resume
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import csv
+import gzip
+import itertools
+import json
+import os
+import sys
+import time
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+
+DEFAULT_CHUNK_SIZE = 2048
+
+
+def _open_text(path: str, mode: str = "rt"):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def _detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    return "jsonl" if name.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def _iter_records(fh, fmt: str):
+    """Yield one dict per input record."""
+    if fmt == "csv":
+        try:
+            csv.field_size_limit(sys.maxsize)
+        except OverflowError:
+            csv.field_size_limit(2**31 - 1)
+        yield from csv.DictReader(fh)
+    else:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _scan_output(path: str) -> tuple:
+    """(complete data rows, whether the last row is complete) of a scorer output file."""
+    rows, last = 0, None
+    try:
+        with _open_text(path) as fh:
+            if _detect_format(path) == "csv":
+                for last in csv.reader(fh):
+                    rows += 1
+                rows = max(rows - 1, 0)
+                ok   = rows == 0 or (bool(last) and last[-1] in engine.EMOTIONS)
+            else:
+                for line in fh:
+                    if line.strip():
+                        rows, last = rows + 1, line
+                ok = rows == 0 or _is_json_row(last)
+    except (EOFError, OSError, csv.Error):     # truncated .gz stream, unterminated quote
+        return rows, False
+    return (rows if ok else rows - 1), ok
+
+
+def _is_json_row(line: str) -> bool:
+    try:
+        return isinstance(json.loads(line), dict)
+    except ValueError:
+        return False
+
+
+def _trim_partial_row(path: str):
+    """Cut an unterminated last line (the run died mid-write) off a plain output file."""
+    if path.endswith(".gz") or not os.path.exists(path):
+        return
+    with open(path, "rb+") as fh:
+        end = fh.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            step  = min(65536, pos)
+            pos  -= step
+            fh.seek(pos)
+            block = fh.read(step)
+            nl    = block.rfind(b"\n")
+            if nl >= 0:
+                if pos + nl + 1 < end:
+                    fh.truncate(pos + nl + 1)
+                return
+        fh.truncate(0)
+
+
+def count_output_rows(path: str) -> int:
+    """Number of complete data rows already written to a scorer output file (0 if missing)."""
+    if not os.path.exists(path):
+        return 0
+    return _scan_output(path)[0]
+
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    text_column: str = "text",
+    id_column: str = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start_offset: int = 0,
+    resume: bool = False,
+    input_format: str = None,
+    workers: int = 1,
+    progress=sys.stderr,
+) -> dict:
+    """
+    Score `input_path` into `output_path`; return {"rows", "seconds", "rows_per_sec", "start_offset"}.
+
+    resume=True continues after the rows already present in `output_path`
+    (appending, no new header); a half-written last row is cut off first.
+    start_offset skips that many input records. workers > 1 scores chunks on
+    a process pool (see vibe_oracle.parallel). Raises ValueError if the first
+    input record lacks `text_column` / `id_column`, before the output is touched.
+    """
+    in_fmt  = input_format or _detect_format(input_path)
+    out_fmt = _detect_format(output_path)
+    if resume:
+        _trim_partial_row(output_path)
+        start_offset, complete = _scan_output(output_path) if os.path.exists(output_path) else (0, True)
+        if not complete:
+            raise ValueError(f"{output_path} ends with a partial row that cannot be trimmed; "
+                             "remove it (or recompress the file) before resuming")
+    append = start_offset > 0 and os.path.exists(output_path)
+
+    fields = ["row"] + ([id_column] if id_column else []) + engine.EMOTIONS + ["dominant"]
+    done   = 0
+    t0     = time.perf_counter()
+
+    with _open_text(input_path) as fin:
+        records = _iter_records(fin, in_fmt)
+        first   = next(records, None)
+        if first is not None:
+            missing = [c for c in (text_column, id_column) if c and c not in first]
+            if missing:
+                raise ValueError(f"column {missing[0]!r} not in input record; "
+                                 f"available: {', '.join(map(str, first))}")
+            records = itertools.chain([first], records)
+        records = itertools.islice(records, start_offset, None)
+
+        with _open_text(output_path, "at" if append else "wt") as fout:
+            writer = csv.writer(fout) if out_fmt == "csv" else None
+            if writer is not None and not append:
+                writer.writerow(fields)
+
+            chunks = iter(lambda: list(itertools.islice(records, chunk_size)), [])
+            jobs   = ((chunk, [str(r.get(text_column) or "") for r in chunk]) for chunk in chunks)
+            if workers and workers > 1:
+                from vibe_oracle.parallel import imap_batches
+                scored = imap_batches(jobs, workers)
+            else:
+                scored = ((chunk, engine.detect_emotion_batch(texts, chunk_size=len(texts)))
+                          for chunk, texts in jobs)
+
+            row_no = start_offset
+            for chunk, matrix in scored:
+                best = matrix.argmax(axis=1)
+                for rec, probs, b in zip(chunk, matrix, best):
+                    values = ([row_no] + ([rec.get(id_column)] if id_column else [])
+                              + [float(p) for p in probs] + [engine.EMOTIONS[b]])
+                    if writer is not None:
+                        writer.writerow(values)
+                    else:
+                        fout.write(json.dumps(dict(zip(fields, values)), ensure_ascii=False) + "\n")
+                    row_no += 1
+                fout.flush()
+
+                done   += len(chunk)
+                elapsed = time.perf_counter() - t0
+                if progress is not None:
+                    progress.write(f"\r{row_no:,} rows  ({done / elapsed:,.0f} rows/s)")
+                    progress.flush()
+
+    elapsed = time.perf_counter() - t0
+    if progress is not None:
+        progress.write("\n")
+    return {
+        "rows":         done,
+        "seconds":      round(elapsed, 3),
+        "rows_per_sec": round(done / elapsed, 1) if elapsed > 0 else 0.0,
+        "start_offset": start_offset,
+    }
@@ -0,0 +1,333 @@
+"""
+Emotion lexicons: English keywords plus the English · Bengali · Hindi dictionary.
+
+Pure data, no third-party imports — shared by the detection engine (phrase and
+keyword matching, training corpus) and the Streamlit UI (reference tables).
+"""
+
+# =============================================================================
+# EMOTION DATA DICTIONARIES
+# =============================================================================
+
+EMOTION_KEYWORDS = {
+    "joy": [
+        "happy", "happiness", "joyful", "excited", "love", "wonderful", "amazing",
+        "great", "fantastic", "cheerful", "delighted", "thrilled", "bliss", "elated",
+        "ecstatic", "glad", "laugh", "smile", "celebrate", "fun", "enjoy", "grateful",
+        "awesome", "brilliant", "content", "pleased", "radiant", "euphoric", "good",
+        "excellent", "positive", "hopeful", "vibrant", "alive", "bright",
+    ],
+    "anger": [
+        "angry", "anger", "furious", "rage", "mad", "hate", "irritated", "annoyed",
+        "outraged", "frustrated", "enraged", "livid", "fuming", "hostile", "bitter",
+        "resentful", "aggressive", "violent", "disgusted", "infuriated", "explode",
+        "boiling", "seething", "wrathful", "irate", "temper", "snap", "explosive",
+    ],
+    "sadness": [
+        "sad", "unhappy", "depressed", "miserable", "heartbroken", "grief", "cry",
+        "sorrow", "mournful", "hopeless", "lonely", "gloomy", "melancholy", "despair",
+        "desolate", "tragic", "painful", "lost", "tears", "devastated", "anguish",
+        "down", "blue", "broken", "suffering", "hurt", "empty", "void", "miss",
+    ],
+    "fear": [
+        "afraid", "fear", "scared", "terrified", "anxious", "nervous", "panic",
+        "dread", "horror", "terror", "phobia", "worried", "uneasy", "apprehensive",
+        "trembling", "fright", "nightmare", "shock", "startled", "petrified",
+        "paranoid", "shaking", "tremble", "spooked", "creepy", "haunted",
+    ],
+    "disgust": [
+        "disgusting", "gross", "revolting", "nasty", "awful", "yuck", "repulsed",
+        "sick", "vomit", "nauseating", "horrible", "repulsive", "filthy", "foul",
+        "unpleasant", "loathe", "abhorrent", "putrid", "hideous", "revolted",
+        "sickening", "vile", "repugnant", "offensive", "stink",
+    ],
+    "surprise": [
+        "surprised", "shocked", "astonished", "amazed", "unexpected", "wow",
+        "unbelievable", "incredible", "stunning", "remarkable", "astounded",
+        "speechless", "gasp", "omg", "whoa", "sudden", "startling", "jaw-dropping",
+        "mind-blowing", "extraordinary", "unreal", "whoah", "no way",
+    ],
+}
+
+# =============================================================================
+# THREE-LANGUAGE DICTIONARY  (English · Bengali · Hindi)
+# Used both for phrase-matching detection AND for the UI reference table.
+# =============================================================================
+
+# Each entry: { "en": [...], "bn": [...], "hi": [...] }
+LANG_DICT = {
+    "joy": {
+        "en": [
+            "happy", "joyful", "excited", "wonderful", "amazing", "delighted",
+            "thrilled", "ecstatic", "cheerful", "blissful", "elated", "radiant",
+            "grateful", "celebrate", "euphoric", "content", "pleased",
+        ],
+        "bn": [
+            "খুশি",           # khushi  – happy
+            "আনন্দিত",        # anandita – joyful
+            "উত্সাহিত",       # utsahit – excited
+            "দারুণ",          # darun – wonderful
+            "অসাধারণ",        # asadharan – amazing
+            "আনন্দ",          # ananda – joy
+            "হাসি",           # hashi – smile/laughter
+            "ভালো লাগছে",     # bhalo lagche – feeling good
+            "অনেক মজা",       # onek moja – so much fun
+            "খুব ভালো",       # khub bhalo – very good
+            "উল্লাস",         # ullas – delight
+            "তৃপ্তি",         # tripti – contentment
+            "কৃতজ্ঞ",         # kritagya – grateful
+            "উচ্ছ্বাস",       # uchchhas – elation
+            "মজাদার",         # mojadaar – enjoyable
+        ],
+        "hi": [
+            "खुश",            # khush – happy
+            "खुशी",           # khushi – happiness
+            "प्रसन्न",        # prasann – pleased
+            "आनंदित",         # aanandित – joyful
+            "उत्साहित",       # utsaahit – excited
+            "शानदार",         # shaandaar – wonderful
+            "मस्त",           # mast – awesome
+            "जश्न",           # jashn – celebration
+            "कमाल",           # kamaal – amazing
+            "बेहतरीन",        # behtareen – excellent
+            "दिल खुश",        # dil khush – heart happy
+            "बहुत मज़ा",       # bahut maza – so much fun
+            "कृतज्ञ",         # kritagna – grateful
+            "उल्लास",         # ullaas – joy
+            "तृप्त",          # trupt – content
+        ],
+    },
+    "anger": {
+        "en": [
+            "angry", "furious", "rage", "mad", "hate", "irritated", "annoyed",
+            "outraged", "frustrated", "enraged", "livid", "fuming", "hostile",
+            "bitter", "resentful", "aggressive", "infuriated", "wrathful",
+        ],
+        "bn": [
+            "রাগান্বিত",      # raganvit – angry
+            "ক্রোধিত",        # krodhit – furious
+            "রাগ হচ্ছে",      # rag hochhe – feeling angry
+            "খুব রাগ",        # khub rag – very angry
+            "বিরক্ত",         # birakt – irritated
+            "ঘেন্না",         # ghenna – disgust/hatred
+            "ক্ষুব্ধ",        # khubdh – outraged
+            "জ্বলছি",         # jolchi – burning (with anger)
+            "অসহ্য",          # asahya – unbearable
+            "হতাশ",           # hatash – frustrated
+            "শত্রুতা",        # shotrutha – hostility
+            "প্রতিশোধ",       # protishod – revenge
+            "উগ্র",           # ugro – aggressive
+            "তিক্ততা",        # tiktota – bitterness
+            "রোষ",            # rosh – wrath
+        ],
+        "hi": [
+            "गुस्सा",         # gussa – angry
+            "क्रोध",          # krodh – anger/rage
+            "नाराज़",         # naraaz – displeased
+            "चिढ़",           # chidh – irritated
+            "भड़का हुआ",      # bhadka hua – enraged
+            "आग बबूला",       # aag babula – furious
+            "बहुत गुस्सा",    # bahut gussa – very angry
+            "जलन",            # jalan – burning anger
+            "कोप",            # kop – wrath
+            "आक्रोश",         # aakrosh – outrage
+            "नफ़रत",          # nafrat – hatred
+            "झुंझलाहट",       # jhunjhlahat – annoyance
+            "कड़वाहट",        # kadwahat – bitterness
+            "रोष",            # rosh – fury
+            "तैश",            # taish – rage
+        ],
+    },
+    "sadness": {
+        "en": [
+            "sad", "unhappy", "depressed", "miserable", "heartbroken", "grief",
+            "sorrow", "hopeless", "lonely", "gloomy", "melancholy", "despair",
+            "devastated", "anguish", "broken", "suffering", "empty", "lost",
+        ],
+        "bn": [
+            "দুঃখিত",          # dukhit – sad
+            "মন খারাপ",        # mon kharap – feeling down
+            "কষ্ট পাচ্ছি",    # koshto pachhi – feeling hurt
+            "কান্না পাচ্ছে",  # kanna pachhe – feeling like crying
+            "একা",             # eka – alone/lonely
+            "হতাশ",            # hatash – hopeless
+            "দুঃখ",            # dukh – grief
+            "বিষণ্ণ",          # bishonno – gloomy
+            "ভেঙে পড়েছি",    # bhenge porechhi – broken down
+            "বিষাদ",           # bishad – melancholy
+            "শোক",             # shok – mourning
+            "যন্ত্রণা",        # jantrana – anguish
+            "অসহায়",          # asahay – helpless
+            "ক্লান্ত",         # klant – exhausted/weary
+            "বিধ্বস্ত",        # bidhwosto – devastated
+        ],
+        "hi": [
+            "उदास",            # udaas – sad
+            "दुखी",            # dukhi – unhappy
+            "निराश",           # niraash – disappointed/hopeless
+            "अकेला",           # akela – lonely
+            "टूटा हुआ",        # toota hua – broken
+            "रोना आ रहा",      # rona aa raha – feeling like crying
+            "दर्द",            # dard – pain
+            "गम",              # gham – grief
+            "बर्बाद",          # barbaad – devastated
+            "दिल टूट गया",    # dil toot gaya – heartbroken
+            "उजड़ा हुआ",      # ujda hua – desolate
+            "विषाद",           # vishad – melancholy
+            "पीड़ा",           # peeda – suffering
+            "तकलीफ़",         # takleef – distress
+            "बेबस",            # bebas – helpless
+        ],
+    },
+    "fear": {
+        "en": [
+            "afraid", "scared", "terrified", "anxious", "nervous", "panic",
+            "dread", "horror", "terror", "worried", "uneasy", "petrified",
+            "paranoid", "trembling", "haunted", "spooked", "fright", "nightmare",
+        ],
+        "bn": [
+            "ভয় পাচ্ছি",      # bhoy pachhi – feeling scared
+            "ভয় লাগছে",       # bhoy lagche – feeling fear
+            "আতঙ্কিত",         # aatankito – terrified
+            "নার্ভাস",         # nervous – nervous
+            "উদ্বিগ্ন",        # udbigno – anxious
+            "ভয়ংকর",          # bhoyonkor – horrifying
+            "দুশ্চিন্তা",      # dushchinta – worry
+            "আতঙ্ক",           # aatank – panic/terror
+            "শিউরে উঠছি",     # shiure uthchi – shuddering
+            "ভূত ভূত",         # bhoot bhoot – ghostly
+            "ত্রাস",           # tras – dread
+            "শঙ্কা",           # shanka – apprehension
+            "কাঁপছি",          # kampchi – trembling
+            "দুঃস্বপ্ন",       # duhswapno – nightmare
+            "আশঙ্কা",          # ashanka – fearful anticipation
+        ],
+        "hi": [
+            "डर",              # dar – fear
+            "डरा हुआ",         # dara hua – scared
+            "घबराहट",          # ghabrahat – nervousness
+            "भय",              # bhay – dread
+            "आतंक",            # aatank – terror
+            "चिंता",           # chinta – anxiety/worry
+            "दहशत",            # dahshat – horror
+            "सहम गया",         # saham gaya – startled/froze
+            "कांप रहा हूं",    # kaanp raha hun – trembling
+            "बहुत डर",         # bahut dar – very scared
+            "डर लग रहा है",   # dar lag raha hai – feeling scared
+            "भूत जैसा",        # bhoot jaisa – like a ghost
+            "घबराया हुआ",      # ghabraya hua – panicked
+            "रूह काँप गई",     # rooh kaanp gayi – soul trembled
+            "खौफ़",            # khauf – terror
+        ],
+    },
+    "disgust": {
+        "en": [
+            "disgusting", "gross", "revolting", "nasty", "yuck", "repulsed",
+            "nauseating", "horrible", "repulsive", "filthy", "foul", "loathe",
+            "abhorrent", "putrid", "vile", "sickening", "offensive", "stink",
+        ],
+        "bn": [
+            "ঘেন্না লাগছে",   # ghenna lagche – feeling disgusted
+            "বিরক্তিকর",       # birktikar – disgusting
+            "নোংরা",           # nongra – filthy
+            "বাজে",            # baje – awful/bad
+            "অসহ্য গন্ধ",     # asahya gondho – unbearable smell
+            "ছি ছি",           # chhi chhi – ugh/yuck
+            "জঘন্য",           # jaghonyo – heinous/disgusting
+            "বমি পাচ্ছে",      # bomi pachhe – feeling like vomiting
+            "ঘৃণা",            # ghrina – hatred/revulsion
+            "অরুচিকর",         # oruchikor – distasteful
+            "ভয়াবহ",          # bhoyaboho – horrible
+            "কুৎসিত",          # kutsit – ugly/repulsive
+            "দুর্গন্ধ",        # durgondho – foul smell
+            "বীভৎস",           # bibhotso – grotesque
+            "ঘৃণ্য",           # ghrinyo – repugnant
+        ],
+        "hi": [
+            "घिनौना",          # ghinauna – disgusting
+            "बेकार",           # bekaar – useless/awful
+            "गंदा",            # ganda – dirty/filthy
+            "उल्टी आ रही",    # ulti aa rahi – feeling like vomiting
+            "घृणा",            # ghrina – revulsion
+            "बदबूदार",         # badbudaar – stinking
+            "भयानक",           # bhayanak – horrible
+            "नफ़रत",           # nafrat – loathing
+            "छी छी",           # chhi chhi – yuck
+            "गंदगी",           # gandagi – filth
+            "वाहियात",         # waahiyaat – disgusting/worthless
+            "बकवास",           # bakwaas – nonsense/awful
+            "जुगुप्सा",        # jugupsa – disgust
+            "घिन",             # ghin – revulsion
+            "बेहूदा",          # behooda – absurd/repulsive
+        ],
+    },
+    "surprise": {
+        "en": [
+            "surprised", "shocked", "astonished", "amazed", "unexpected", "wow",
+            "unbelievable", "incredible", "stunning", "remarkable", "astounded",
+            "speechless", "gasp", "mind-blowing", "extraordinary", "whoa", "omg",
+        ],
+        "bn": [
+            "অবাক",            # obak – surprised
+            "আশ্চর্য",         # ashchoryo – astonished
+            "অবিশ্বাস্য",      # obishwasyo – unbelievable
+            "চমকে গেছি",       # chomke gechi – startled
+            "এটা কী করে সম্ভব", # eta ki kore shombhob – how is this possible
+            "অদ্ভুত",          # odbhut – strange/unexpected
+            "হতবাক",           # hotobak – speechless
+            "বিস্মিত",         # bismit – amazed
+            "চমৎকার",          # chomotkar – wonderful/astonishing
+            "অপ্রত্যাশিত",     # oprottashit – unexpected
+            "অকল্পনীয়",       # okalponiyo – unimaginable
+            "আরে বাবা",        # are baba – oh my goodness
+            "কী আশ্চর্য",      # ki ashchoryo – how surprising
+            "বিষ্ময়",          # bishmoyo – amazement
+            "থমকে গেছি",       # thomke gechi – stunned
+        ],
+        "hi": [
+            "हैरान",           # hairaan – surprised
+            "चौंक गया",        # chaunk gaya – startled
+            "अविश्वसनीय",     # avishvasneey – unbelievable
+            "अरे वाह",         # are waah – oh wow
+            "क्या बात है",     # kya baat hai – what a thing
+            "अचंभा",           # achambha – astonishment
+            "दंग रह गया",      # dang reh gaya – stunned
+            "सच में",          # sach mein – really?
+            "यकीन नहीं होता", # yakeen nahi hota – can't believe it
+            "ओह माय गॉड",     # oh my god
+            "कमाल है",         # kamaal hai – amazing
+            "अजीब",            # ajeeb – strange/unexpected
+            "विस्मय",          # vismay – wonder
+            "हक्का बक्का",     # hakka bakka – dumbfounded
+            "अप्रत्याशित",    # apratyashit – unexpected
+        ],
+    },
+}
+
+# Flatten LANG_DICT into MULTILANG_PHRASES for detection engine
+# (combines Bengali script + Hindi script + romanised Hinglish phrases)
+_HINGLISH_EXTRA = {
+    "joy":      ["bahut maza", "kitna maza", "maja aa gaya", "full masti",
+                 "dil khush", "ek number", "bhai wah", "acha lag raha", "bohot khushi"],
+    "anger":    ["bahut gussa", "bura lag raha", "kuch nahi chahiye", "bohot bura",
+                 "chup raho", "teri toh", "faltu baat", "kya bakwas", "dimag mat kha"],
+    "sadness":  ["bahut dukh", "rona aa raha", "dil toot gaya", "ek dum sad",
+                 "kuch nahi ho raha", "akele hain", "bahut bura lag raha"],
+    "fear":     ["bahut dar lag raha", "dar gaya", "dara hua", "bhoot jaisa",
+                 "itna darna", "andhera"],
+    "disgust":  ["chhi chhi", "yuck yaar", "kya bakwas hai", "bilkul pasand nahi",
+                 "ganda hai", "ulti aa rahi"],
+    "surprise": ["arre wah", "yaar kya baat", "sach mein", "aisa kaise",
+                 "oh my god yaar", "kya hua", "kitni badi baat"],
+}
+
+MULTILANG_PHRASES = {
+    emotion: (
+        LANG_DICT[emotion]["bn"]
+        + LANG_DICT[emotion]["hi"]
+        + _HINGLISH_EXTRA[emotion]
+    )
+    for emotion in LANG_DICT
+}
+
+EMOTIONS = list(EMOTION_KEYWORDS.keys())
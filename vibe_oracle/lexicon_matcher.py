@@ -0,0 +1,147 @@
+"""
+Aho–Corasick multi-pattern matching for the rule-based layer.
+
+The automaton is compiled once from an {emotion: [patterns]} lexicon and then
+finds every pattern occurring in a text in a single left-to-right pass, so the
+cost per request is O(len(text) + matches) instead of O(patterns × len(text)).
+Given fixed output columns, each pattern also owns a precomputed weight row,
+so a match set scores straight into a NumPy vector.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+from collections import deque
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+
+
+class AhoCorasick:
+    """Trie + failure links over a fixed list of patterns (pattern id = list index)."""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._goto    = [{}]           # node → {char: node}
+        self._fail    = [0]            # node → longest proper suffix node
+        self._out     = [()]           # node → pattern ids ending here
+
+        # 1. Trie
+        for pid, pat in enumerate(self.patterns):
+            if not pat:
+                continue               # an empty pattern would match everywhere
+            node = 0
+            for ch in pat:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[node][ch] = nxt
+                node = nxt
+            self._out[node] += (pid,)
+
+        # 2. Failure links (BFS); outputs inherit their failure node's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """Yield (end_index, pattern_id) for every occurrence in `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                yield i, pid
+
+    def find_ids(self, text: str) -> set:
+        """Set of pattern ids occurring at least once in `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        node  = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class LexiconMatcher:
+    """
+    Score an {emotion: [patterns]} lexicon against text in one automaton pass.
+
+    Semantics match the original loops exactly: every lexicon entry whose
+    pattern occurs in the text (presence, not count) adds `weight` to its
+    emotion, duplicates included. With `lowercase=True` patterns are
+    lowercased once at build time instead of on every call.
+
+    `columns` fixes the emotion order for add_vector (default: lexicon order);
+    row p of `weight_matrix` is what pattern p adds to each column.
+    """
+
+    def __init__(self, lexicon: dict, weight: float = 1.0, lowercase: bool = False,
+                 columns=None):
+        self.weight  = weight
+        self.columns = list(columns if columns is not None else lexicon)
+        col          = {e: j for j, e in enumerate(self.columns)}
+        ids          = {}              # pattern → pattern id
+        self._hits   = []              # pattern id → [emotion, ...] (with repeats)
+        for emotion, patterns in lexicon.items():
+            for pat in patterns:
+                key = pat.lower() if lowercase else pat
+                pid = ids.setdefault(key, len(ids))
+                if pid == len(self._hits):
+                    self._hits.append([])
+                self._hits[pid].append(emotion)
+        self._ids      = ids
+        self.automaton = AhoCorasick(ids)
+
+        self.weight_matrix = np.zeros((len(ids), len(self.columns)))
+        for pid, emotions in enumerate(self._hits):
+            for emotion in emotions:
+                self.weight_matrix[pid, col[emotion]] += weight
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def matched_ids(self, text: str, tokens=None) -> set:
+        """Pattern ids found as substrings of `text` or, optionally, as whole tokens."""
+        found = self.automaton.find_ids(text)
+        if tokens:
+            ids = self._ids
+            found.update(ids[t] for t in tokens if t in ids)
+        return found
+
+    def add_scores(self, scores: dict, text: str, tokens=None) -> dict:
+        """Add `weight` to scores[emotion] for each matching entry; returns `scores`."""
+        for pid in self.matched_ids(text, tokens):
+            for emotion in self._hits[pid]:
+                scores[emotion] += self.weight
+        return scores
+
+    def add_vector(self, out: np.ndarray, text: str, tokens=None) -> np.ndarray:
+        """add_scores into a float vector laid out as `columns` (in place); returns `out`."""
+        found = self.matched_ids(text, tokens)
+        if found:
+            out += self.weight_matrix[list(found)].sum(axis=0)
+        return out
+
+    def covered_mask(self, text: str) -> list:
+        """Per-character flags: True where some pattern occurrence covers the char."""
+        mask     = [False] * len(text)
+        patterns = self.automaton.patterns
+        for end, pid in self.automaton.iter_matches(text):
+            for j in range(end - len(patterns[pid]) + 1, end + 1):
+                mask[j] = True
+        return mask
@@ -0,0 +1,113 @@
+"""
+Content-addressed store for trained model artifacts.
+
+An artifact is saved under a key derived from everything that determines the
+fitted model (training corpus, pipeline config, preprocessing inputs, library
+versions), so a changed lexicon or hyperparameter can never be served from a
+stale file. Writes are atomic (temp file + os.replace) and training is guarded
+by an inter-process file lock, so N workers starting together train once and
+the rest load the finished artifact.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import joblib
+
+try:
+    import fcntl
+except ImportError:        # Windows: fall back to unlocked (still atomic) writes
+    fcntl = None
+
+
+def fingerprint(*parts) -> str:
+    """SHA-256 over the canonical JSON encoding of `parts` (lists, dicts, str, numbers)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ModelStore:
+    """Directory of `<prefix>-<key>.joblib` artifacts; see module docstring."""
+
+    def __init__(self, root: str, prefix: str = "vibe_oracle"):
+        self.root   = root
+        self.prefix = prefix
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, f"{self.prefix}-{key[:16]}.joblib")
+
+    def load(self, key: str, mmap_mode: str = None):
+        """
+        Return the artifact stored under `key`, or None if absent/corrupt.
+
+        With mmap_mode="r" the NumPy arrays inside the artifact (coefficients,
+        idf vector, …) are memory-mapped read-only instead of copied, so every
+        process loading the same file shares one physical copy via the page cache.
+        """
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            return joblib.load(path, mmap_mode=mmap_mode)
+        except Exception:
+            return None    # corrupt/incompatible artifact — caller rebuilds
+
+    def save(self, key: str, obj) -> str:
+        """Atomically write `obj` under `key`; readers never see a partial file."""
+        os.makedirs(self.root, exist_ok=True)
+        path     = self.path_for(key)
+        fd, tmp  = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=".joblib")
+        os.close(fd)
+        try:
+            joblib.dump(obj, tmp)         # uncompressed, so arrays stay mmap-able
+            os.chmod(tmp, 0o644)           # mkstemp is 0600; other worker users must read it
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return path
+
+    def get_or_build(self, key: str, build_fn, mmap_mode: str = None):
+        """Load `key`, or build it with `build_fn()` while holding the store lock."""
+        obj = self.load(key, mmap_mode)
+        if obj is not None:
+            return obj
+        with self._lock(key):
+            obj = self.load(key, mmap_mode)   # another worker may have built it
+            if obj is not None:
+                return obj
+            obj = build_fn()
+            try:
+                self.save(key, obj)
+            except Exception:
+                return obj     # read-only store — serve the in-memory model anyway
+        # Re-open from disk so the building process shares the mapped pages too;
+        # keep the in-memory model if the fresh file is gone or cannot be mapped
+        mapped = self.load(key, mmap_mode) if mmap_mode else None
+        return obj if mapped is None else mapped
+
+    @contextmanager
+    def _lock(self, key: str):
+        handle = None
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            handle = open(self.path_for(key) + ".lock", "a")
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+        except OSError:
+            handle = None  # unwritable store — build without the lock
+        try:
+            yield
+        finally:
+            if handle is not None:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+                handle.close()
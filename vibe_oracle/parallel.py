@@ -0,0 +1,119 @@
+"""
+Process-pool scoring for multi-core hosts.
+
+`preprocess` (WordNet lemmatizer loop) and VADER are pure Python and hold the
+GIL, so one process scores on one core. This module fans batches out over a
+`ProcessPoolExecutor`; each worker imports the engine and warms the model once
+in its initializer, and results come back in input order.
+
+Workers are started with the "spawn" method so no SQLite connection or
+half-initialised lazy singleton is inherited through fork; the model artifact
+itself is memory-mapped, so N workers still share one copy of its arrays.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import itertools
+import multiprocessing as mp
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+import pandas as pd
+
+DEFAULT_BATCH_SIZE = 512
+
+
+def default_workers() -> int:
+    """CPUs available to this process (respects affinity / cgroup cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker():
+    """Runs once per worker process: import the engine and warm every lazy component."""
+    from vibe_oracle import engine
+
+    engine.get_model()
+    engine.preprocess("warm up")
+
+
+def _score_batch(texts: list) -> np.ndarray:
+    from vibe_oracle import engine
+
+    return engine.detect_emotion_batch(texts, chunk_size=len(texts))
+
+
+def make_pool(workers: int = None) -> ProcessPoolExecutor:
+    """Pool of `workers` spawn-started processes with the model pre-loaded."""
+    return ProcessPoolExecutor(
+        max_workers=workers or default_workers(),
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def imap_batches(jobs, workers: int = None, pool=None):
+    """
+    Score an iterable of (payload, texts) jobs; yield (payload, matrix) in order.
+
+    At most 2 × workers jobs are in flight, so arbitrarily long inputs are
+    scored in bounded memory. `payload` rides along untouched (e.g. the source
+    records). Pass an existing `pool` to reuse warm workers.
+    """
+    workers  = workers or default_workers()
+    own_pool = pool is None
+    if own_pool:
+        pool = make_pool(workers)
+    it    = iter(jobs)
+    queue = deque()
+    try:
+        while True:
+            while len(queue) < 2 * workers:
+                job = next(it, None)
+                if job is None:
+                    break
+                queue.append((job[0], pool.submit(_score_batch, job[1])))
+            if not queue:
+                break
+            payload, fut = queue.popleft()
+            yield payload, fut.result()
+    finally:
+        for _, fut in queue:
+            fut.cancel()
+        if own_pool:
+            pool.shutdown()
+
+
+def iter_scored_batches(texts, workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE, pool=None):
+    """Yield one (len(batch), 6) probability matrix per `batch_size` texts, in order."""
+    it   = iter(texts)
+    jobs = iter(lambda: list(itertools.islice(it, batch_size)), [])
+    for _, matrix in imap_batches(((None, batch) for batch in jobs), workers, pool):
+        yield matrix
+
+
+def detect_emotion_parallel(
+    texts,
+    workers: int = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    as_frame: bool = False,
+    pool=None,
+):
+    """
+    Parallel detect_emotion_batch: same (N, 6) output, rows in input order.
+
+    workers defaults to the number of usable CPUs; workers=1 still uses a
+    single worker process (use detect_emotion_batch to stay in-process).
+    """
+    from vibe_oracle.lexicon import EMOTIONS
+
+    index  = texts.index if isinstance(texts, pd.Series) else None
+    blocks = list(iter_scored_batches(texts, workers, batch_size, pool))
+    out    = np.vstack(blocks) if blocks else np.empty((0, len(EMOTIONS)))
+    if as_frame:
+        return pd.DataFrame(out, columns=EMOTIONS, index=index)
+    return out
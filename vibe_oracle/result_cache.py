@@ -0,0 +1,195 @@
+"""
+Result cache in front of detect_emotion: bounded in-process LRU, optionally
+backed by a SQLite file that several processes share.
+
+Keys are a SHA-256 of (model version, canonical text), so whitespace and
+Unicode-compatibility variants of the same message share one entry and a new
+model artifact never serves stale scores. Each entry remembers how long it took to compute, which
+is what a hit is credited with in the "seconds_saved" counter.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def canonical_text(text: str) -> str:
+    """NFKC-normalise and collapse runs of whitespace — the form that gets scored and keyed."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class ResultCache:
+    """
+    Memoise `compute_fn(text) -> dict` keyed on canonical_text(text) + `version`.
+
+    version       – model artifact identifier; part of every key
+    memory_size   – max entries kept in the in-process LRU (0 disables it)
+    db_path       – SQLite file shared between processes (None → memory only)
+    max_disk_rows – on-disk row budget; least-recently-used rows are evicted
+
+    compute_fn must itself score canonical_text(text) (engine's scorers do), so
+    a cached result is exactly what the uncached call would return. Case is
+    kept in the key: VADER weighs ALL-CAPS words a little higher.
+    """
+
+    def __init__(
+        self,
+        compute_fn,
+        version: str,
+        memory_size: int = 16_384,
+        db_path: str = None,
+        max_disk_rows: int = 500_000,
+    ):
+        self.compute_fn    = compute_fn
+        self.version       = version
+        self.memory_size   = memory_size
+        self.max_disk_rows = max_disk_rows
+        self._memory       = OrderedDict()          # key → (result, compute_seconds)
+        self._lock         = threading.Lock()
+        self._db           = None
+        self._writes       = 0
+        self.memory_hits   = 0
+        self.shared_hits   = 0
+        self.misses        = 0
+        self.seconds_saved = 0.0
+        self.seconds_spent = 0.0
+
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    " key TEXT PRIMARY KEY, result TEXT NOT NULL,"
+                    " cost REAL NOT NULL, used_at REAL NOT NULL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)"
+                )
+                self._db.commit()
+            except Exception:
+                self._db = None   # read-only / locked filesystem — memory tier only
+
+    # ── Public API ───────────────────────────────────────────────────────────
+    def get_or_compute(self, text: str) -> dict:
+        """Cached result for `text` (a fresh dict), calling compute_fn on a miss.
+
+        Exceptions from compute_fn propagate and nothing is cached for them.
+        """
+        t0  = time.perf_counter()
+        key = self._key(text)
+        with self._lock:
+            entry = self._memory_get(key)
+            if entry is not None:
+                self.memory_hits += 1
+            else:
+                entry = self._disk_get(key)
+                if entry is not None:
+                    self.shared_hits += 1
+                    self._memory_put(key, *entry)
+            if entry is not None:
+                self.seconds_saved += max(entry[1] - (time.perf_counter() - t0), 0.0)
+                return dict(entry[0])
+
+        t1     = time.perf_counter()
+        result = self.compute_fn(text)
+        cost   = time.perf_counter() - t1
+        with self._lock:
+            self.misses        += 1
+            self.seconds_spent += cost
+            self._memory_put(key, dict(result), cost)
+            self._disk_put(key, result, cost)
+        return result
+
+    def stats(self) -> dict:
+        """Hit/miss counters, hit ratio, compute time spent and saved, tier sizes."""
+        with self._lock:
+            hits    = self.memory_hits + self.shared_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits":   self.memory_hits,
+                "shared_hits":   self.shared_hits,
+                "misses":        self.misses,
+                "hit_ratio":     hits / lookups if lookups else 0.0,
+                "seconds_spent": round(self.seconds_spent, 4),
+                "seconds_saved": round(self.seconds_saved, 4),
+                "memory_items":  len(self._memory),
+                "shared_items":  self._disk_count(),
+            }
+
+    def clear(self):
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+            self.memory_hits = self.shared_hits = self.misses = 0
+            self.seconds_saved = self.seconds_spent = 0.0
+
+    # ── Internals ────────────────────────────────────────────────────────────
+    def _key(self, text: str) -> str:
+        payload = self.version + "\x00" + canonical_text(text)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _memory_get(self, key: str):
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, result: dict, cost: float):
+        if self.memory_size <= 0:
+            return
+        self._memory[key] = (result, cost)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str):
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT result, cost FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE results SET used_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def _disk_put(self, key: str, result: dict, cost: float):
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, result, cost, used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result), cost, time.time()),
+            )
+            self._writes += 1
+            # Enforce the row budget every 256 writes to keep inserts cheap
+            if self._writes % 256 == 0 and self.max_disk_rows:
+                self._db.execute(
+                    "DELETE FROM results WHERE key IN ("
+                    " SELECT key FROM results ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_rows,),
+                )
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _disk_count(self) -> int:
+        if self._db is None:
+            return 0
+        try:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        except sqlite3.Error:
+            return 0
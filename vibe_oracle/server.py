@@ -0,0 +1,126 @@
+"""
+Lightweight HTTP inference service for the Vibe Oracle engine (stdlib only).
+
+    python -m vibe_oracle serve [--host 127.0.0.1] [--port 8000]
+
+    GET  /healthz        → {"status": "ok", "model": "<artifact key>", "variant": "tfidf", ...}
+    GET  /metrics/spans  → {"enabled": bool, "stages": {stage: {p50_ms, p95_ms, p99_ms, ...}}}
+    POST /detect         {"text": "..."}          → {"scores": {...}, "dominant": "joy"}
+    POST /detect/batch   {"texts": ["...", ...]}  → {"results": [{"scores": ..., "dominant": ...}, ...]}
+    POST /detect/document {"text": "...", "char_budget": 20000}
+                         → {"scores", "dominant", "dominant_share", "sentences", "truncated", ...}
+
+The model is loaded before the socket opens and stays warm for the life of
+the process; requests are served on a thread per connection.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle import engine
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH_SIZE = 10_000
+
+
+def _result(scores: dict) -> dict:
+    return {"scores": scores, "dominant": max(scores, key=scores.get)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "VibeOracle/1.0"
+
+    # ── Routes ───────────────────────────────────────────────────────────────
+    def do_GET(self):
+        if self.path == "/healthz":
+            self._send(200, {
+                "status":       "ok",
+                "model":        engine.model_key()[:16],
+                "variant":      engine.MODEL_VARIANT,
+                "result_cache": engine.result_cache().stats(),
+            })
+        elif self.path == "/metrics/spans":
+            self._send(200, {"enabled": engine.SPANS.enabled, "stages": engine.SPANS.snapshot()})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = self._read_json()
+        if body is None:
+            return
+        if self.path == "/detect":
+            text = body.get("text")
+            if not isinstance(text, str):
+                return self._send(400, {"error": "'text' must be a string"})
+            self._send(200, _result(engine.detect_emotion(text)))
+        elif self.path == "/detect/batch":
+            texts = body.get("texts")
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                return self._send(400, {"error": "'texts' must be a list of strings"})
+            if len(texts) > MAX_BATCH_SIZE:
+                return self._send(413, {"error": f"batch larger than {MAX_BATCH_SIZE}"})
+            matrix  = engine.detect_emotion_batch(texts)
+            results = [_result(dict(zip(engine.EMOTIONS, map(float, row)))) for row in matrix]
+            self._send(200, {"results": results})
+        elif self.path == "/detect/document":
+            text   = body.get("text")
+            budget = body.get("char_budget")                  # None → engine.CHAR_BUDGET
+            if not isinstance(text, str):
+                return self._send(400, {"error": "'text' must be a string"})
+            if budget is not None:
+                # bool is an int subclass: JSON true must not mean a 1-character budget
+                if isinstance(budget, bool) or not isinstance(budget, int) or budget <= 0:
+                    return self._send(400, {"error": "'char_budget' must be a positive integer"})
+                if engine.CHAR_BUDGET > 0:
+                    budget = min(budget, engine.CHAR_BUDGET)  # clients may only lower the cap
+            doc = engine.detect_document(text, char_budget=budget)
+            self._send(200, {**_result(doc.pop("emotions")), **doc})
+        else:
+            self._send(404, {"error": "not found"})
+
+    # ── Helpers ──────────────────────────────────────────────────────────────
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(413, {"error": "request body too large"})
+            return None
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, {"error": "invalid JSON"})
+            return None
+        if not isinstance(body, dict):
+            self._send(400, {"error": "expected a JSON object"})
+            return None
+        return body
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt, *args):   # keep request logs off stderr by default
+        pass
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    """Warm the model, then bind (without serving) — handy for embedding/tests."""
+    engine.get_model()
+    return ThreadingHTTPServer((host, port), _Handler)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000):
+    """Block serving inference requests until interrupted."""
+    httpd = make_server(host, port)
+    print(f"🔮 Vibe Oracle inference service on http://{host}:{httpd.server_port}", flush=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
@@ -0,0 +1,147 @@
+"""
+Per-stage latency spans for the detection pipeline.
+
+    with SPANS.span("rule layer") as sp:
+        ...
+        sp.branch = "signal"
+
+Each finished span adds its duration to a bounded per-stage sample window and
+bumps a (stage, branch) counter; report() turns those into p50/p95/p99 rows.
+A disabled recorder hands out one shared no-op span, so an instrumented call
+costs a method call and two empty __enter__/__exit__ calls per stage.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import threading
+import time
+from collections import Counter, deque
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+import pandas as pd
+
+
+class _NullSpan:
+    """Shared do-nothing span handed out while recording is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def branch(self):
+        return None
+
+    @branch.setter
+    def branch(self, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_recorder", "stage", "branch", "_t0")
+
+    def __init__(self, recorder, stage: str):
+        self._recorder = recorder
+        self.stage     = stage
+        self.branch    = None
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        branch = "error" if exc_type is not None else self.branch
+        self._recorder.record(self.stage, time.perf_counter() - self._t0, branch)
+        return False
+
+
+class SpanRecorder:
+    """
+    Thread-safe per-stage timing store.
+
+    enabled – start recording immediately (toggle later with enable()/disable())
+    window  – samples kept per stage for the percentiles (oldest dropped first)
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 10_000):
+        self.enabled   = enabled
+        self.window    = window
+        self._samples  = {}                # stage → deque of seconds
+        self._counts   = Counter()         # stage → spans ever recorded
+        self._branches = Counter()         # (stage, branch) → spans ever recorded
+        self._lock     = threading.Lock()
+
+    # ── Recording ────────────────────────────────────────────────────────────
+    def span(self, stage: str):
+        """Context manager timing one stage; set `.branch` on it to tag the path taken."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage)
+
+    def record(self, stage: str, seconds: float, branch: str = None):
+        """Add one externally measured duration."""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._counts[stage] += 1
+            if branch is not None:
+                self._branches[(stage, branch)] += 1
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Forget every sample and counter (the enabled flag is left alone)."""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._branches.clear()
+
+    # ── Export ───────────────────────────────────────────────────────────────
+    def snapshot(self) -> dict:
+        """
+        JSON-ready {stage: {count, window, mean_ms, p50_ms, p95_ms, p99_ms, max_ms,
+        branches: {branch: count}}} in first-seen stage order.
+        """
+        with self._lock:
+            samples  = {stage: np.fromiter(s, dtype=float) for stage, s in self._samples.items()}
+            counts   = dict(self._counts)
+            branches = dict(self._branches)
+
+        out = {}
+        for stage, arr in samples.items():
+            p50, p95, p99 = np.percentile(arr, [50, 95, 99]) * 1000
+            out[stage] = {
+                "count":    counts[stage],
+                "window":   int(arr.size),
+                "mean_ms":  round(float(arr.mean()) * 1000, 4),
+                "p50_ms":   round(float(p50), 4),
+                "p95_ms":   round(float(p95), 4),
+                "p99_ms":   round(float(p99), 4),
+                "max_ms":   round(float(arr.max()) * 1000, 4),
+                "branches": {b: n for (s, b), n in branches.items() if s == stage},
+            }
+        return out
+
+    def report(self) -> pd.DataFrame:
+        """snapshot() as one row per stage, branch tallies flattened to 'a=3, b=1'."""
+        rows = [
+            {"stage": stage, **{k: v for k, v in st.items() if k != "branches"},
+             "branches": ", ".join(f"{b}={n}" for b, n in st["branches"].items())}
+            for stage, st in self.snapshot().items()
+        ]
+        return pd.DataFrame(rows, columns=[
+            "stage", "count", "window", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "branches",
+        ])
@@ -0,0 +1,187 @@
+"""
+Sliding-window "room vibe" over a live message stream.
+
+    room = VibeWindow(max_messages=200, window_seconds=600)
+    room.push("ami khub khushi aaj")            # → that message's scores
+    room.snapshot()                             # → windowed mean distribution
+
+Each message is scored once with detect_emotion (the fused six-emotion
+output) and its row is added to a running sum; rows that fall out of the
+window — past the last N messages or older than the time window — are
+subtracted again. Updating the aggregate is O(1) per message whatever the
+window length, and history is never re-scored. Every so often the sum is
+recomputed from the rows still held, so float drift cannot build up.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import threading
+import time
+from collections import deque
+
+# ── Third-party ───────────────────────────────────────────────────────────────
+import numpy as np
+
+# ── Local ─────────────────────────────────────────────────────────────────────
+from vibe_oracle.lexicon import EMOTIONS
+
+_N_EMOTIONS = len(EMOTIONS)
+
+# Resync the running sum after this many evictions (or one window's worth, if larger)
+RESYNC_EVERY = 4096
+
+
+class VibeWindow:
+    """
+    Windowed six-emotion aggregate for one conversation / room. Thread-safe.
+
+    max_messages   – keep at most the last N messages (None → no count limit)
+    window_seconds – keep messages newer than this many seconds (None → no age limit)
+    score_fn       – text → {emotion: prob}; defaults to engine.detect_emotion
+    clock          – timestamp source for push() calls without one (time.time)
+
+    Timestamps are expected to be non-decreasing; an earlier one is treated as
+    the newest timestamp seen so far, so the window never holds rows out of order.
+    """
+
+    def __init__(self, max_messages: int = None, window_seconds: float = None,
+                 score_fn=None, clock=time.time):
+        if max_messages is None and window_seconds is None:
+            raise ValueError("VibeWindow needs max_messages and/or window_seconds")
+        if max_messages is not None and max_messages < 1:
+            raise ValueError("max_messages must be >= 1")
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
+
+        self.max_messages   = max_messages
+        self.window_seconds = window_seconds
+        self._score_fn      = score_fn
+        self._clock         = clock
+        self._rows          = deque()                       # (timestamp, row, dominant index)
+        self._sum           = np.zeros(_N_EMOTIONS)
+        self._dominant      = np.zeros(_N_EMOTIONS, dtype=np.int64)
+        self._newest        = float("-inf")
+        self._evicted       = 0
+        self._pushed        = 0
+        self._lock          = threading.Lock()
+
+    # ── Ingest ───────────────────────────────────────────────────────────────
+    def push(self, text: str, timestamp: float = None) -> dict:
+        """Score one message, add it to the window and return its scores."""
+        scores = self._score(text)
+        self.push_scores(scores, timestamp)
+        return scores
+
+    def extend(self, texts: list, timestamps: list = None) -> np.ndarray:
+        """
+        Backfill many messages → (N, 6) rows in EMOTIONS order.
+
+        One detect_emotion_batch call with the default scorer; a custom
+        score_fn is called per text, so push and extend always agree.
+        """
+        texts = list(texts)
+        if timestamps is None:
+            timestamps = [None] * len(texts)
+        elif len(timestamps) != len(texts):
+            raise ValueError(f"{len(texts)} texts but {len(timestamps)} timestamps")
+
+        if self._score_fn is None:
+            from vibe_oracle import engine
+            matrix = engine.detect_emotion_batch(texts)
+        else:
+            matrix = np.array([_as_row(self._score_fn(t)) for t in texts]).reshape(-1, _N_EMOTIONS)
+        for row, ts in zip(matrix, timestamps):
+            self.push_scores(row, ts)
+        return matrix
+
+    def _score(self, text: str):
+        if self._score_fn is not None:
+            return self._score_fn(text)
+        from vibe_oracle import engine
+        return engine.detect_emotion(text)
+
+    def push_scores(self, scores, timestamp: float = None):
+        """Add an already-scored message: a {emotion: prob} dict or a row in EMOTIONS order."""
+        row = _as_row(scores)
+        ts  = self._clock() if timestamp is None else float(timestamp)
+        top = int(row.argmax())
+
+        with self._lock:
+            ts           = max(ts, self._newest)
+            self._newest = ts
+            self._rows.append((ts, row, top))
+            self._sum           += row
+            self._dominant[top] += 1
+            self._pushed        += 1
+            self._evict(ts)
+
+    # ── Window maintenance ───────────────────────────────────────────────────
+    def _evict(self, now: float):
+        rows = self._rows
+        if self.max_messages is not None:
+            while len(rows) > self.max_messages:
+                self._drop()
+        if self.window_seconds is not None:
+            cutoff = now - self.window_seconds
+            while rows and rows[0][0] <= cutoff:
+                self._drop()
+        if self._evicted >= max(RESYNC_EVERY, len(rows)):
+            self._resync()
+
+    def _drop(self):
+        _, row, top = self._rows.popleft()
+        self._sum           -= row
+        self._dominant[top] -= 1
+        self._evicted       += 1
+
+    def _resync(self):
+        """Recompute the running sum exactly (amortised O(1): runs once per window's worth of evictions)."""
+        self._sum = (np.sum([row for _, row, _ in self._rows], axis=0)
+                     if self._rows else np.zeros(_N_EMOTIONS))
+        self._evicted = 0
+
+    # ── Export ───────────────────────────────────────────────────────────────
+    def snapshot(self, now: float = None) -> dict:
+        """
+        Current window → {messages, scores, dominant, dominant_share, oldest, newest, pushed}.
+
+        Pass `now` (same time base as the timestamps) to also age out rows of
+        a room that has gone quiet; without it the window ends at the newest
+        message. scores is the mean distribution over the window (all zeros
+        when empty).
+        """
+        with self._lock:
+            if now is not None and self.window_seconds is not None:
+                self._evict(max(float(now), self._newest))
+            n = len(self._rows)
+            if n:
+                mean  = np.round(self._sum / n, 4)
+                share = np.round(self._dominant / n, 4)
+            else:
+                mean = share = np.zeros(_N_EMOTIONS)
+            return {
+                "messages":       n,
+                "scores":         dict(zip(EMOTIONS, mean.tolist())),
+                "dominant":       EMOTIONS[int(mean.argmax())] if n else None,
+                "dominant_share": dict(zip(EMOTIONS, share.tolist())),
+                "oldest":         self._rows[0][0] if n else None,
+                "newest":         self._rows[-1][0] if n else None,
+                "pushed":         self._pushed,
+            }
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def reset(self):
+        """Empty the window (the pushed counter is kept)."""
+        with self._lock:
+            self._rows.clear()
+            self._sum[:]      = 0.0
+            self._dominant[:] = 0
+            self._evicted     = 0
+
+
+def _as_row(scores) -> np.ndarray:
+    """{emotion: prob} dict or sequence in EMOTIONS order → float row."""
+    if isinstance(scores, dict):
+        return np.fromiter((scores[e] for e in EMOTIONS), dtype=float, count=_N_EMOTIONS)
+    return np.asarray(scores, dtype=float).reshape(_N_EMOTIONS)
@@ -0,0 +1,203 @@
+"""
+Two-tier translation cache: bounded in-process LRU in front of a SQLite store.
+
+Entries are keyed by a SHA-256 of (source, target, text) so the on-disk tier
+never stores raw input as its key. The translator itself is injected, which
+keeps the cache usable (and checkable) offline with a local stand-in function.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class TranslationCache:
+    """
+    Memoise `translate_fn(text) -> str` across calls and processes.
+
+    memory_size   – max entries kept in the in-process LRU (0 disables it)
+    db_path       – SQLite file for the persistent tier (None → memory only)
+    ttl_seconds   – entries older than this are treated as misses (None → never)
+    max_disk_rows – on-disk row budget; least-recently-used rows are evicted
+    """
+
+    def __init__(
+        self,
+        translate_fn,
+        db_path: str = None,
+        memory_size: int = 4096,
+        ttl_seconds: float = None,
+        max_disk_rows: int = 200_000,
+        source: str = "auto",
+        target: str = "en",
+    ):
+        self.translate_fn  = translate_fn
+        self.memory_size   = memory_size
+        self.ttl_seconds   = ttl_seconds
+        self.max_disk_rows = max_disk_rows
+        self._prefix       = f"{source}:{target}:"
+        self._memory       = OrderedDict()          # key → (result, created_at)
+        self._lock         = threading.Lock()
+        self._db           = None
+        self._writes       = 0
+        self.memory_hits   = 0
+        self.disk_hits     = 0
+        self.misses        = 0
+
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    " key TEXT PRIMARY KEY, result TEXT NOT NULL,"
+                    " created_at REAL NOT NULL, used_at REAL NOT NULL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS translations_used_at"
+                    " ON translations (used_at)"
+                )
+                self._db.commit()
+            except Exception:
+                self._db = None   # read-only / locked filesystem — memory tier only
+
+    # ── Public API ───────────────────────────────────────────────────────────
+    def translate(self, text: str) -> str:
+        """Return the cached translation of `text`, calling translate_fn on a miss.
+
+        Exceptions from translate_fn propagate and nothing is cached for them.
+        """
+        hit = self.get(text)
+        if hit is not None:
+            return hit
+        result = self.translate_fn(text)
+        self.put(text, result)
+        return result
+
+    def get(self, text: str):
+        """Cached translation of `text` or None (counts as a hit or a miss)."""
+        key = self._key(text)
+        now = time.time()
+        with self._lock:
+            hit = self._memory_get(key, now)
+            if hit is not None:
+                self.memory_hits += 1
+                return hit
+            hit = self._disk_get(key, now)
+            if hit is not None:
+                self.disk_hits += 1
+                self._memory_put(key, hit[0], hit[1])
+                return hit[0]
+            self.misses += 1
+            return None
+
+    def put(self, text: str, result: str):
+        """Store a successful translation in both tiers."""
+        key = self._key(text)
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, result, now)
+            self._disk_put(key, result, now)
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus current tier sizes."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits":  self.memory_hits,
+                "disk_hits":    self.disk_hits,
+                "misses":       self.misses,
+                "hit_ratio":    (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "disk_items":   self._disk_count(),
+            }
+
+    def clear(self):
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations")
+                self._db.commit()
+            self.memory_hits = self.disk_hits = self.misses = 0
+
+    # ── Internals ────────────────────────────────────────────────────────────
+    def _key(self, text: str) -> str:
+        return hashlib.sha256((self._prefix + text).encode("utf-8")).hexdigest()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _memory_get(self, key: str, now: float):
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry[1], now):
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return entry[0]
+
+    def _memory_put(self, key: str, result: str, created_at: float):
+        if self.memory_size <= 0:
+            return
+        self._memory[key] = (result, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str, now: float):
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT result, created_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[1], now):
+                self._db.execute("DELETE FROM translations WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE translations SET used_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            return row
+        except sqlite3.Error:
+            return None
+
+    def _disk_put(self, key: str, result: str, now: float):
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO translations (key, result, created_at, used_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, result, now, now),
+            )
+            self._writes += 1
+            # Enforce TTL + row budget every 256 writes to keep inserts cheap
+            if self._writes % 256 == 0 and self.ttl_seconds is not None:
+                self._db.execute(
+                    "DELETE FROM translations WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+            if self._writes % 256 == 0 and self.max_disk_rows:
+                self._db.execute(
+                    "DELETE FROM translations WHERE key IN ("
+                    " SELECT key FROM translations ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_rows,),
+                )
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _disk_count(self) -> int:
+        if self._db is None:
+            return 0
+        try:
+            return self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        except sqlite3.Error:
+            return 0